@@ -18,12 +18,14 @@ from pytest_mock_resources.fixture import (
     create_redis_fixture,
     create_redshift_fixture,
     create_sqlite_fixture,
+    MongoCollection,
     pmr_mongo_config,
     pmr_mongo_container,
     pmr_moto_config,
     pmr_moto_container,
     pmr_mysql_config,
     pmr_mysql_container,
+    pmr_parallel_startup,
     pmr_postgres_config,
     pmr_postgres_container,
     pmr_redis_config,
@@ -36,13 +38,18 @@ from pytest_mock_resources.fixture import (
 from pytest_mock_resources.hooks import (  # noqa
     pytest_addoption,
     pytest_configure,
+    pytest_fixture_setup,
     pytest_itemcollected,
     pytest_sessionfinish,
+    pytest_terminal_summary,
+    pytest_testnodedown,
+    pytest_unconfigure,
 )
 from pytest_mock_resources.sqlalchemy import Rows, Statements, StaticStatements
 
 __all__ = [
     "Credentials",
+    "MongoCollection",
     "MongoConfig",
     "MotoConfig",
     "MysqlConfig",
@@ -70,6 +77,7 @@ __all__ = [
     "pmr_moto_container",
     "pmr_mysql_config",
     "pmr_mysql_container",
+    "pmr_parallel_startup",
     "pmr_postgres_config",
     "pmr_postgres_container",
     "pmr_redis_config",
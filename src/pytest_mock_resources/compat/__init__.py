@@ -54,6 +54,16 @@ except ImportError:
         "redshift",
     )
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = ImportAdaptor(
+        "pyarrow",
+        "redshift-arrow",
+        fail_message="Cannot COPY parquet or JSON data into redshift fixtures without pyarrow.\n"
+        "pip install pytest-mock-resources[redshift-arrow]",
+    )
+
 try:
     import pymongo
 except ImportError:
@@ -77,6 +87,7 @@ __all__ = [
     "boto3",
     "moto",
     "sqlparse",
+    "pyarrow",
     "pymongo",
     "redis",
     "pymysql",
@@ -16,6 +16,7 @@ if version.startswith("1.4") or version.startswith("2."):
     URL = sqlalchemy.engine.url.URL.create
 
     select = sqlalchemy.select
+    create_mock_engine = sqlalchemy.create_mock_engine
 else:
     from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
 
@@ -32,6 +33,11 @@ else:
 
     select = _select
 
+    def _create_mock_engine(url, executor, **kw):
+        return sqlalchemy.create_engine(url, strategy="mock", executor=executor, **kw)
+
+    create_mock_engine = _create_mock_engine
+
 
 def extract_model_base_metadata(base) -> Optional[sqlalchemy.MetaData]:
     metadata = getattr(base, "metadata", None)
@@ -43,6 +49,7 @@ def extract_model_base_metadata(base) -> Optional[sqlalchemy.MetaData]:
 
 __all__ = [
     "asyncio",
+    "create_mock_engine",
     "declarative_base",
     "DeclarativeMeta",
     "URL",
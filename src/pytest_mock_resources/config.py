@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import functools
 import os
 import socket
@@ -127,3 +128,11 @@ class DockerContainerConfig:
 
     def check_fn(self):
         pass
+
+    async def async_check_fn(self):
+        """Perform `check_fn`, without blocking the event loop.
+
+        Configs with a natively async check should override this.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.check_fn)
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import json
+import logging
 import pathlib
 import socket
 import time
 import types
-from typing import Awaitable, Callable, TYPE_CHECKING, TypeVar
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, TYPE_CHECKING, TypeVar
 
 from pytest_mock_resources.hooks import (
     get_docker_client,
     get_pytest_flag,
     use_multiprocess_safe_mode,
 )
+from pytest_mock_resources.timing import timed
 
 try:
     import responses as _responses
@@ -25,9 +29,14 @@ except ImportError:
 if TYPE_CHECKING:
     from python_on_whales.docker_client import DockerClient
 
+    from pytest_mock_resources.config import DockerContainerConfig
+
+log = logging.getLogger(__name__)
+
 
 DEFAULT_RETRIES = 40
 DEFAULT_INTERVAL = 0.5
+DEFAULT_BACKOFF = 0.005
 
 
 class ContainerCheckFailed(Exception):  # noqa: N818
@@ -37,6 +46,29 @@ class ContainerCheckFailed(Exception):  # noqa: N818
 T = TypeVar("T")
 
 
+def backoff(interval=DEFAULT_INTERVAL, *, start=DEFAULT_BACKOFF):
+    """Produce exponentially increasing delays, starting at `start` and capped at `interval`.
+
+    Examples:
+        >>> delays = backoff(0.1, start=0.02)
+        >>> [next(delays) for _ in range(5)]
+        [0.02, 0.04, 0.08, 0.1, 0.1]
+    """
+    delay = min(start, interval)
+    while True:
+        yield delay
+        delay = min(delay * 2, interval)
+
+
+def retry_deadline(retries, interval) -> float:
+    """Produce the time after which to stop retrying.
+
+    Checks are retried (with backoff) until the same amount of time has been spent waiting as
+    the `retries` attempts would have, with fixed `interval` sleeps between them.
+    """
+    return time.monotonic() + (retries - 1) * interval
+
+
 async def async_retry(
     func: Callable[..., Awaitable[T]],
     *,
@@ -46,18 +78,15 @@ async def async_retry(
     interval=DEFAULT_INTERVAL,
     on_exc=Exception,
 ) -> T:
-    while retries:
-        retries -= 1
+    delays = backoff(interval)
+    deadline = retry_deadline(retries, interval)
+    while True:
         try:
-            result = await func(*args, **kwargs)
+            return await func(*args, **kwargs)
         except on_exc:
-            if not retries:
+            if time.monotonic() >= deadline:
                 raise
-            time.sleep(interval)
-        else:
-            return result
-
-    raise NotImplementedError()  # pragma: no cover
+            await asyncio.sleep(next(delays))
 
 
 def retry(
@@ -69,23 +98,19 @@ def retry(
     interval=DEFAULT_INTERVAL,
     on_exc=Exception,
 ) -> T:
-    while retries:
-        retries -= 1
+    delays = backoff(interval)
+    deadline = retry_deadline(retries, interval)
+    while True:
         try:
-            result = func(*args, **kwargs)
+            return func(*args, **kwargs)
         except on_exc:
-            if not retries:
+            if time.monotonic() >= deadline:
                 raise
-            time.sleep(interval)
-        else:
-            return result
-
-    raise NotImplementedError()  # pragma: no cover
+            time.sleep(next(delays))
 
 
 def get_container(pytestconfig, config, *, retries=DEFAULT_RETRIES, interval=DEFAULT_INTERVAL):
     multiprocess_safe_mode = use_multiprocess_safe_mode(pytestconfig)
-    docker = get_docker_client(pytestconfig)
 
     if responses:
         # XXX: moto library may over-mock responses. SEE: https://github.com/spulec/moto/issues/1026
@@ -96,30 +121,12 @@ def get_container(pytestconfig, config, *, retries=DEFAULT_RETRIES, interval=DEF
     container = None
 
     try:
-        if multiprocess_safe_mode:
-            from filelock import FileLock
-
-            # get the temp directory shared by all workers (assuming pytest-xdist)
-            root_tmp_dir = pytestconfig._tmp_path_factory.getbasetemp().parent
-            fn = root_tmp_dir / f"pmr_create_container_{config.port}.lock"
-            # wait for the container one process at a time
-            with FileLock(str(fn)):
-                container = wait_for_container(
-                    docker,
-                    config,
-                    retries=retries,
-                    interval=interval,
+        with timed("container"):
+            started, container = claim_started_container(pytestconfig, config)
+            if not started:
+                container = start_container(
+                    pytestconfig, config, retries=retries, interval=interval
                 )
-            if container:
-                record_container_creation(pytestconfig, container)
-
-        else:
-            container = wait_for_container(
-                docker,
-                config,
-                retries=retries,
-                interval=interval,
-            )
 
         yield config
     finally:
@@ -128,6 +135,117 @@ def get_container(pytestconfig, config, *, retries=DEFAULT_RETRIES, interval=DEF
             container.kill()
 
 
+def start_container(pytestconfig, config, *, retries=DEFAULT_RETRIES, interval=DEFAULT_INTERVAL):
+    """Wait for the container described by `config`, starting it if necessary.
+
+    Returns the container, if one was created. Otherwise, `None`.
+    """
+    docker = get_docker_client(pytestconfig)
+
+    if not use_multiprocess_safe_mode(pytestconfig):
+        return wait_for_container(docker, config, retries=retries, interval=interval)
+
+    from filelock import FileLock
+
+    # get the temp directory shared by all workers (assuming pytest-xdist)
+    root_tmp_dir = pytestconfig._tmp_path_factory.getbasetemp().parent
+    fn = root_tmp_dir / f"pmr_create_container_{config.port}.lock"
+    # wait for the container one process at a time
+    with FileLock(str(fn)):
+        container = wait_for_container(docker, config, retries=retries, interval=interval)
+
+    if container:
+        record_container_creation(pytestconfig, container)
+    return container
+
+
+def start_containers(
+    pytestconfig, configs, *, retries=DEFAULT_RETRIES, interval=DEFAULT_INTERVAL
+) -> dict[DockerContainerConfig, Future]:
+    """Concurrently start the containers for all of the given `configs`.
+
+    This does not wait for the containers to become available. Instead, the
+    in-flight startups are recorded on `pytestconfig`, such that `get_container`
+    can wait on (and claim) the result, rather than starting the container itself.
+
+    Configs which share a port with an earlier config (for example postgres and
+    redshift) are assumed to share a container, and are skipped.
+    """
+    pending = pending_containers(pytestconfig)
+
+    ports = set()
+    configs = [c for c in configs if c not in pending]
+    if not configs:
+        return {}
+
+    executor = ThreadPoolExecutor(
+        max_workers=len(configs), thread_name_prefix="pmr-container-startup"
+    )
+
+    started = {}
+    for config in configs:
+        if config.port is not None:
+            if config.port in ports:
+                continue
+            ports.add(config.port)
+
+        started[config] = executor.submit(
+            start_container, pytestconfig, config, retries=retries, interval=interval
+        )
+
+    # Threads exit once their startup has finished; there's no need to block here.
+    executor.shutdown(wait=False)
+
+    pending.update(started)
+    return started
+
+
+def claim_started_container(pytestconfig, config) -> tuple[bool, Any]:
+    """Claim the result of an in-flight startup (by `start_containers`) of the `config`.
+
+    Returns a tuple of whether the startup was found and succeeded, and the
+    container which was created by it (if any). Ownership of the container
+    transfers to the caller.
+    """
+    future = pending_containers(pytestconfig).pop(config, None)
+    if future is None:
+        return False, None
+
+    try:
+        return True, future.result()
+    except Exception:
+        log.warning("Background startup of %s container failed", config.name, exc_info=True)
+        return False, None
+
+
+def discard_started_containers(pytestconfig, started: dict[DockerContainerConfig, Future]):
+    """Wait for, and cleanup after, any of the `started` containers which were never claimed."""
+    pending = pending_containers(pytestconfig)
+
+    for config, future in started.items():
+        if pending.get(config) is not future:
+            continue
+
+        del pending[config]
+
+        try:
+            container = future.result()
+        except Exception:
+            log.debug("Background startup of %s container failed", config.name, exc_info=True)
+            continue
+
+        cleanup_container = get_pytest_flag(pytestconfig, "pmr_cleanup_container", default=True)
+        if cleanup_container and container and not use_multiprocess_safe_mode(pytestconfig):
+            container.kill()
+
+
+def pending_containers(pytestconfig) -> dict[DockerContainerConfig, Future]:
+    pending = getattr(pytestconfig, "_pmr_pending_containers", None)
+    if pending is None:
+        pending = pytestconfig._pmr_pending_containers = {}
+    return pending
+
+
 def wait_for_container(
     docker: DockerClient, config, *, retries=DEFAULT_RETRIES, interval=DEFAULT_INTERVAL
 ):
@@ -140,7 +258,7 @@ def wait_for_container(
         config.set("port", unused_tcp_port())
 
     check_fn = config.check_fn
-    run_args = (config.image,)
+    run_args = (config.image, list(config.container_args))
     run_kwargs = {
         "publish": [(dest, source) for source, dest in config.ports().items()],
         "envs": config.environment(),
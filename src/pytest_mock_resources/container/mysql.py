@@ -1,4 +1,6 @@
-from typing import ClassVar, Iterable
+import contextlib
+import sys
+from typing import ClassVar, Iterable, Optional
 
 import sqlalchemy
 
@@ -6,6 +8,11 @@ from pytest_mock_resources import compat
 from pytest_mock_resources.config import DockerContainerConfig, fallback
 from pytest_mock_resources.container.base import ContainerCheckFailed
 
+if sys.version_info < (3, 8):
+    from importlib_metadata import Distribution
+else:
+    from importlib.metadata import Distribution
+
 
 class MysqlConfig(DockerContainerConfig):
     """Define the configuration object for MySql.
@@ -25,6 +32,9 @@ class MysqlConfig(DockerContainerConfig):
             Defaults to :code:`"password"`.
         root_database (str): The name of the root database to create.
             Defaults to :code:`"dev"`.
+        drivername (str): The sqlalchemy driver to use
+            Defaults to :code:`"mysql+pymysql"`, or for async fixtures, whichever of
+            :code:`"mysql+asyncmy"` or :code:`"mysql+aiomysql"` is installed.
     """
 
     name = "mysql"
@@ -36,6 +46,7 @@ class MysqlConfig(DockerContainerConfig):
         "username",
         "password",
         "root_database",
+        "drivername",
     }
     _fields_defaults: ClassVar[dict] = {
         "image": "mysql:5.6",
@@ -46,6 +57,7 @@ class MysqlConfig(DockerContainerConfig):
         "username": "root",
         "password": "password",
         "root_database": "dev",
+        "drivername": None,
     }
 
     @fallback
@@ -60,6 +72,10 @@ class MysqlConfig(DockerContainerConfig):
     def root_database(self):
         raise NotImplementedError()
 
+    @fallback
+    def drivername(self):
+        raise NotImplementedError()
+
     def ports(self):
         return {3306: self.port}
 
@@ -70,17 +86,72 @@ class MysqlConfig(DockerContainerConfig):
         }
 
     def check_fn(self):
+        import socket
+
+        try:
+            with socket.create_connection((self.host, int(self.port)), timeout=5) as s:
+                response = s.recv(1024)
+        except OSError:
+            response = b""
+
+        if not is_handshake_response(response):
+            raise ContainerCheckFailed(
+                f"Unable to connect to a presumed MySQL test container via given config: {self}"
+            )
+
+    async def async_check_fn(self):
+        import asyncio
+
         try:
-            get_sqlalchemy_engine(self, self.root_database)
-        except sqlalchemy.exc.OperationalError:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, int(self.port)), timeout=5
+            )
+            try:
+                response = await asyncio.wait_for(reader.read(1024), timeout=5)
+            finally:
+                writer.close()
+                with contextlib.suppress(OSError):
+                    await writer.wait_closed()
+        except (OSError, asyncio.TimeoutError):
+            response = b""
+
+        if not is_handshake_response(response):
             raise ContainerCheckFailed(
                 f"Unable to connect to a presumed MySQL test container via given config: {self}"
             )
 
 
-def get_sqlalchemy_engine(config, database_name, **engine_kwargs):
+# The protocol versions of MySQL's initial handshake packet.
+HANDSHAKE_PROTOCOL_VERSIONS = (9, 10)
+
+
+def is_handshake_response(response: bytes) -> bool:
+    r"""Determine whether `response` is the initial handshake packet of a MySQL server.
+
+    The server speaks first, as soon as a client connects. A TCP connection alone is not
+    sufficient evidence of readiness, because docker accepts connections on a published port
+    before the server inside the container is listening. Error packets (for example, while
+    the server is still initializing) are not considered ready.
+
+    Examples:
+        >>> is_handshake_response(b"")
+        False
+        >>> is_handshake_response(b"J\x00\x00\x00\x0a5.6.51\x00...")
+        True
+        >>> is_handshake_response(b"\x17\x00\x00\x00\xff\x10\x04Too many connections")
+        False
+    """
+    # Packets are prefixed by a 3 byte length and a 1 byte sequence number.
+    if len(response) < 5:
+        return False
+    return response[4] in HANDSHAKE_PROTOCOL_VERSIONS
+
+
+def get_sqlalchemy_engine(config, database_name, async_=False, **engine_kwargs):
+    drivername = detect_driver(config.drivername, async_=async_)
+
     url = compat.sqlalchemy.URL(
-        "mysql+pymysql",
+        drivername,
         username=config.username,
         password=config.password,
         host=config.host,
@@ -88,13 +159,34 @@ def get_sqlalchemy_engine(config, database_name, **engine_kwargs):
         database=database_name,
     )
 
-    from pytest_mock_resources.compat import pymysql
+    if async_ or getattr(url.get_dialect(), "is_async", None):
+        from sqlalchemy.ext.asyncio import create_async_engine
 
-    pymysql.connect
+        return create_async_engine(url, **engine_kwargs)
 
-    engine = sqlalchemy.create_engine(url, **engine_kwargs)
+    if drivername == "mysql+pymysql":
+        # Fail with a helpful error, when the driver is not installed.
+        from pytest_mock_resources.compat import pymysql
 
-    # Verify engine is connected
-    engine.connect()
+        pymysql.connect
 
-    return engine
+    return sqlalchemy.create_engine(url, **engine_kwargs)
+
+
+def detect_driver(drivername: Optional[str] = None, async_: bool = False) -> str:
+    if drivername:
+        return drivername
+
+    if not async_:
+        return "mysql+pymysql"
+
+    if any(Distribution.discover(name="asyncmy")):
+        return "mysql+asyncmy"
+
+    if any(Distribution.discover(name="aiomysql")):
+        return "mysql+aiomysql"
+
+    raise ValueError(
+        "No suitable async driver found for MySQL. Please install `asyncmy` or `aiomysql`, "
+        "or explicitly configure the `drivername=` field of `MysqlConfig`."
+    )
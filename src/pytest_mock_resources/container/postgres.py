@@ -1,3 +1,5 @@
+import contextlib
+import struct
 import sys
 from typing import ClassVar, Iterable, Optional
 
@@ -86,15 +88,87 @@ class PostgresConfig(DockerContainerConfig):
     def check_fn(self):
         import socket
 
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            s.connect((self.host, int(self.port)))
-        except (OSError, ConnectionRefusedError):
+            with socket.create_connection((self.host, int(self.port)), timeout=5) as s:
+                s.sendall(startup_message(self.username, self.root_database))
+                response = s.recv(1024)
+        except OSError:
+            response = b""
+
+        if not is_ready_response(response):
             raise ContainerCheckFailed(
                 f"Unable to connect to a presumed Postgres test container via given config: {self}"
             )
-        finally:
-            s.close()
+
+    async def async_check_fn(self):
+        import asyncio
+
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, int(self.port)), timeout=5
+            )
+            try:
+                writer.write(startup_message(self.username, self.root_database))
+                await writer.drain()
+                response = await asyncio.wait_for(reader.read(1024), timeout=5)
+            finally:
+                writer.close()
+                with contextlib.suppress(OSError):
+                    await writer.wait_closed()
+        except (OSError, asyncio.TimeoutError):
+            response = b""
+
+        if not is_ready_response(response):
+            raise ContainerCheckFailed(
+                f"Unable to connect to a presumed Postgres test container via given config: {self}"
+            )
+
+
+# The error code Postgres responds with, while it is starting up/shutting down.
+CANNOT_CONNECT_NOW = "57P03"
+
+
+def startup_message(username: str, database: str) -> bytes:
+    r"""Produce a Postgres (protocol version 3.0) StartupMessage.
+
+    Examples:
+        >>> startup_message("user", "dev")
+        b'\x00\x00\x00 \x00\x03\x00\x00user\x00user\x00database\x00dev\x00\x00'
+    """
+    params = b"".join(
+        part.encode("utf-8") + b"\x00" for part in ("user", username, "database", database)
+    )
+    params += b"\x00"
+    return struct.pack("!ii", len(params) + 8, 196608) + params
+
+
+def is_ready_response(response: bytes) -> bool:
+    r"""Determine whether the response to a StartupMessage implies that Postgres is ready.
+
+    A TCP connection alone is not sufficient evidence, because docker accepts connections
+    on a published port before the server inside the container is listening. Any
+    response other than a "starting up" error indicates the server is accepting
+    connections; for example authentication requests/failures.
+
+    Examples:
+        >>> is_ready_response(b"")
+        False
+        >>> is_ready_response(b"R\x00\x00\x00\x0c\x00\x00\x00\x05salt")
+        True
+        >>> is_ready_response(b"E\x00\x00\x00\x10SFATAL\x00C57P03\x00\x00")
+        False
+        >>> is_ready_response(b"E\x00\x00\x00\x10SFATAL\x00C28P01\x00\x00")
+        True
+    """
+    if not response:
+        return False
+
+    if response[:1] != b"E":
+        return True
+
+    # ErrorResponse: a series of (field type, null-terminated value) fields.
+    fields = response[5:].split(b"\x00")
+    return b"C" + CANNOT_CONNECT_NOW.encode() not in fields
 
 
 def get_sqlalchemy_engine(config, database_name, async_=False, autocommit=False, **engine_kwargs):
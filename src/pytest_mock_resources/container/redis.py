@@ -1,3 +1,4 @@
+import os
 from typing import ClassVar, Iterable
 
 from pytest_mock_resources.compat import redis
@@ -19,6 +20,11 @@ class RedisConfig(DockerContainerConfig):
             Defaults to :code:`6379`.
         decode_responses (bool): Whether to decode responses from the server on the client.
             Defaults to :code:`False`.
+        databases (int): The number of databases the container's server is started with. Each
+            pytest-xdist worker leases its own database, so this bounds the number of workers.
+            Defaults to the greater of :code:`16` and the number of xdist workers.
+        container_args (tuple): The command the container is run with. Defaults to starting
+            :code:`redis-server` with the configured number of :code:`databases`.
     """
 
     name = "redis"
@@ -29,6 +35,8 @@ class RedisConfig(DockerContainerConfig):
         "port",
         "ci_port",
         "decode_responses",
+        "databases",
+        "container_args",
     }
     _fields_defaults: ClassVar[dict] = {
         "image": "redis:5.0.7",
@@ -41,6 +49,14 @@ class RedisConfig(DockerContainerConfig):
     def decode_responses(self):
         raise NotImplementedError()
 
+    @fallback
+    def databases(self):
+        return max(16, int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 0)))
+
+    @fallback
+    def container_args(self):
+        return ("redis-server", "--databases", str(self.databases))
+
     def ports(self):
         return {6379: self.port}
 
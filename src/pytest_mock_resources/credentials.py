@@ -1,3 +1,4 @@
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 
 from pytest_mock_resources import compat
@@ -80,6 +81,8 @@ class Credentials:
     def assign_from_connection(cls, connection):
         if isinstance(connection, Session):
             url = connection.connection().engine.url
+        elif isinstance(connection, Connection):
+            url = connection.engine.url
         else:
             url = connection.url
 
@@ -1,5 +1,7 @@
+from pytest_mock_resources.fixture.base import pmr_parallel_startup
 from pytest_mock_resources.fixture.mongo import (
     create_mongo_fixture,
+    MongoCollection,
     pmr_mongo_config,
     pmr_mongo_container,
 )
@@ -35,6 +37,7 @@ from pytest_mock_resources.fixture.redshift import (
 from pytest_mock_resources.fixture.sqlite import create_sqlite_fixture
 
 __all__ = [
+    "MongoCollection",
     "S3Bucket",
     "S3Object",
     "create_mongo_fixture",
@@ -52,6 +55,7 @@ __all__ = [
     "pmr_moto_container",
     "pmr_mysql_config",
     "pmr_mysql_container",
+    "pmr_parallel_startup",
     "pmr_postgres_config",
     "pmr_postgres_container",
     "pmr_redis_config",
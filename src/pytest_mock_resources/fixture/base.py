@@ -1,9 +1,19 @@
+import logging
+import queue
+import threading
 import uuid
-from typing import Union
+from typing import Callable, Generic, Optional, TypeVar, Union
 
 import pytest
 from typing_extensions import Literal
 
+from pytest_mock_resources.container.base import discard_started_containers, start_containers
+from pytest_mock_resources.hooks import get_resource_kinds, use_parallel_startup
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
 
 def generate_fixture_id(enabled: bool = True, name=""):
     if enabled:
@@ -23,6 +33,144 @@ def asyncio_fixture(async_fixture, scope="function"):
     return fixture(async_fixture)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def pmr_parallel_startup(request, pytestconfig):
+    """Concurrently start the containers required by the collected tests.
+
+    Only enabled through the `pmr_parallel_startup` option. Containers which are
+    started in this way are claimed by their respective `pmr_*_container` fixtures,
+    rather than those fixtures starting them (one at a time) on first use.
+    """
+    if not use_parallel_startup(pytestconfig):
+        yield
+        return
+
+    configs = []
+    for kind in get_resource_kinds(request.session.items):
+        name = f"pmr_{kind}_config"
+        try:
+            config = request.getfixturevalue(name)
+        except (pytest.FixtureLookupError, pytest.fail.Exception):
+            # i.e. undefined or non-session-scoped configs. Such containers are instead
+            # started by their container fixtures, as usual.
+            log.debug("Skipping parallel startup of %s container", kind, exc_info=True)
+            continue
+
+        # Configs are resolved as they would be for the first test. Where they are overridden
+        # (e.g. in a subdirectory's conftest), other tests may resolve a different config, so
+        # these are likewise left to the tests' own container fixtures.
+        fixturedef = request._fixture_defs.get(name)
+        if get_fixturedefs(request.session.items, name) - {fixturedef}:
+            log.debug("Skipping parallel startup of overridden %s container", kind)
+            continue
+        configs.append(config)
+
+    started = start_containers(pytestconfig, configs)
+    try:
+        yield
+    finally:
+        discard_started_containers(pytestconfig, started)
+
+
+def get_fixturedefs(items, name: str) -> set:
+    """Produce the definitions of the fixture `name` which are used by any of the `items`."""
+    fixturedefs = set()
+    for item in items:
+        fixtureinfo = getattr(item, "_fixtureinfo", None)
+        if fixtureinfo is not None and fixtureinfo.name2fixturedefs.get(name):
+            fixturedefs.add(fixtureinfo.name2fixturedefs[name][-1])
+    return fixturedefs
+
+
+class ResourcePool(Generic[T]):
+    """Produce resources ahead of their use, in a background thread.
+
+    Up to `size` resources are kept ready at any given time. Each call to `get`
+    hands out a ready resource (waiting for one to be produced if there are none),
+    and signals the background thread to produce its replacement.
+
+    Examples:
+        >>> from itertools import count
+        >>> counter = count()
+        >>> pool = ResourcePool(lambda: next(counter), size=2)
+        >>> pool.get(), pool.get()
+        (0, 1)
+        >>> pool.close()
+    """
+
+    def __init__(
+        self,
+        produce: Callable[[], T],
+        *,
+        size: int,
+        discard: Optional[Callable[[T], None]] = None,
+    ):
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}.")
+
+        self.produce = produce
+        self.discard = discard
+
+        self._ready: queue.Queue = queue.Queue()
+        self._slots = threading.Semaphore(size)
+        self._closed = threading.Event()
+        self._error: Optional[BaseException] = None
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            self._slots.acquire()
+            if self._closed.is_set():
+                return
+
+            try:
+                resource = self.produce()
+            except Exception as e:
+                self._ready.put((None, e))
+                return
+
+            self._ready.put((resource, None))
+
+    def get(self) -> T:
+        if self._closed.is_set():
+            raise RuntimeError("Cannot get a resource from a closed pool.")
+
+        if self._error:
+            raise self._error
+
+        resource, error = self._ready.get()
+        if error is not None:
+            self._error = error
+            raise error
+
+        self._slots.release()
+        return resource
+
+    def close(self, timeout: Optional[float] = 30):
+        """Stop producing resources, and discard any which were never handed out."""
+        self._closed.set()
+        self._slots.release()
+        self._thread.join(timeout)
+
+        while True:
+            try:
+                resource, error = self._ready.get_nowait()
+            except queue.Empty:
+                break
+
+            if error is not None or self.discard is None:
+                continue
+
+            try:
+                self.discard(resource)
+            except Exception:
+                log.warning("Failed to discard pooled resource: %s", resource, exc_info=True)
+
+
+Isolation = Union[Literal["database"], Literal["savepoint"]]
+
 Scope = Union[
     Literal["session"],
     Literal["package"],
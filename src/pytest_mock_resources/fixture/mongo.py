@@ -1,9 +1,70 @@
+import itertools
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, Mapping, Optional, Sequence, Tuple
+
 import pytest
 
+from pytest_mock_resources.action import AbstractAction, validate_actions
 from pytest_mock_resources.compat import pymongo
 from pytest_mock_resources.container.base import get_container
 from pytest_mock_resources.container.mongo import MongoConfig
 from pytest_mock_resources.credentials import Credentials
+from pytest_mock_resources.fixture.base import generate_fixture_id, ResourcePool
+from pytest_mock_resources.sqlalchemy import bifurcate_actions
+from pytest_mock_resources.timing import get_timer
+
+PASSWORD = "password"  # noqa: S105
+
+INSERT_BATCH_SIZE = 1000
+
+
+@dataclass
+class MongoCollection(AbstractAction):
+    """Create a collection, with the given `documents` and `indexes`.
+
+    Examples:
+        >>> users = MongoCollection(
+        ...     "users",
+        ...     documents=[{"name": "John"}, {"name": "Viola"}],
+        ...     indexes=["name"],
+        ... )
+
+    Arguments:
+        name: The name of the collection.
+        documents: The documents to insert into the collection. The documents themselves are
+            not modified (i.e. no `_id` is added to them).
+        indexes: The indexes to create on the collection. Each may be anything accepted
+            by `pymongo.IndexModel` (e.g. a key name, or a list of `(key, direction)` pairs),
+            or an `IndexModel` itself.
+    """
+
+    fixtures: ClassVar[Tuple[str, ...]] = ("mongo",)
+    static_safe: ClassVar[bool] = True
+
+    name: str
+    documents: Sequence[Mapping] = ()
+    indexes: Sequence[Any] = ()
+
+    def apply(self, database):
+        if self.name not in database.list_collection_names():
+            database.create_collection(self.name)
+
+        collection = database[self.name]
+        if self.indexes:
+            collection.create_indexes(
+                [
+                    index if isinstance(index, pymongo.IndexModel) else pymongo.IndexModel(index)
+                    for index in self.indexes
+                ]
+            )
+
+        documents = iter(self.documents)
+        while True:
+            batch = [dict(document) for document in itertools.islice(documents, INSERT_BATCH_SIZE)]
+            if not batch:
+                break
+            collection.insert_many(batch, ordered=False)
 
 
 @pytest.fixture(scope="session")
@@ -20,28 +81,178 @@ def pmr_mongo_config():
 
 @pytest.fixture(scope="session")
 def pmr_mongo_container(pytestconfig, pmr_mongo_config):
-    yield from get_container(pytestconfig, pmr_mongo_config)
+    try:
+        yield from get_container(pytestconfig, pmr_mongo_config)
+    finally:
+        close_session_resources(pmr_mongo_config)
 
 
-def create_mongo_fixture(scope="function"):
+def create_mongo_fixture(
+    *ordered_actions, scope="function", database_pool_size=0, template_database=True
+):
     """Produce a mongo fixture.
 
     Any number of fixture functions can be created. Under the hood they will all share the same
     database server.
 
     Arguments:
+        ordered_actions: Any number of ordered actions to be run on test setup. Either
+            `MongoCollection` instances, or callables which accept the test's database.
         scope: Passthrough pytest's fixture scope.
+        database_pool_size: Defaults to 0 (disabled). When greater than 0, that many per-test
+            databases (and their owning users) are created ahead of time in a background
+            thread, so that tests are handed an already-created database rather than waiting
+            on a `createUser`.
+        template_database: Defaults to True. When True, amortizes the cost of `ordered_actions`
+            by performing them once into a "template" database, which is then copied
+            (server-side, where supported) into each per-test database.
     """
+    validate_actions(ordered_actions, fixture="mongo", additional_types=(Callable,))
+    static_actions, dynamic_actions = bifurcate_actions(ordered_actions)
+
+    fixture_id = None
+    if template_database and static_actions:
+        fixture_id = generate_fixture_id(name="mongo")
+    else:
+        dynamic_actions = [*static_actions, *dynamic_actions]
+        static_actions = []
 
     @pytest.fixture(scope=scope)
     def _(pmr_mongo_container, pmr_mongo_config):
-        return _create_clean_database(pmr_mongo_config)
+        yield from _create_clean_database(
+            pmr_mongo_config,
+            database_pool_size=database_pool_size,
+            fixture_id=fixture_id,
+            static_actions=static_actions,
+            dynamic_actions=dynamic_actions,
+        )
 
     return _
 
 
-def _create_clean_database(config):
-    root_client = pymongo.MongoClient(config.host, config.port)
+_root_clients: Dict[MongoConfig, Any] = {}
+_database_pools: Dict[MongoConfig, ResourcePool[str]] = {}
+_template_databases: Dict[Tuple[MongoConfig, str], str] = {}
+_cross_database_out: Dict[MongoConfig, bool] = {}
+
+
+def get_root_client(config: MongoConfig):
+    """Get the client used to perform administrative commands.
+
+    A single client (and therefore connection pool and set of monitor threads) is shared
+    by all fixtures using the same config, until the container is torn down.
+    """
+    client = _root_clients.get(config)
+    if client is None:
+        client = _root_clients[config] = pymongo.MongoClient(config.host, config.port)
+    return client
+
+
+def get_database_pool(config: MongoConfig, *, size: int) -> ResourcePool[str]:
+    """Get (or start) the pool of clean databases, each with its own owning user."""
+    pool = _database_pools.get(config)
+    if pool is not None:
+        return pool
+
+    root_client = get_root_client(config)
+
+    def discard(db_id):
+        database = root_client[db_id]
+        database.command("dropUser", db_id)
+        root_client.drop_database(db_id)
+
+    pool = _database_pools[config] = ResourcePool(
+        lambda: _produce_clean_database(root_client, config), size=size, discard=discard
+    )
+    return pool
+
+
+def close_session_resources(config: MongoConfig):
+    """Release the state held on behalf of the given config's container."""
+    pool = _database_pools.pop(config, None)
+    if pool is not None:
+        pool.close()
+
+    _cross_database_out.pop(config, None)
+
+    client = _root_clients.pop(config, None)
+    for key in [key for key in _template_databases if key[0] is config]:
+        template_database = _template_databases.pop(key)
+        if client is not None:
+            client.drop_database(template_database)
+
+    if client is not None:
+        client.close()
+
+
+def get_template_database(config: MongoConfig, fixture_id: str, static_actions) -> str:
+    """Get (or create) the database into which a fixture's `static_actions` were applied."""
+    key = (config, fixture_id)
+    template_database = _template_databases.get(key)
+    if template_database is None:
+        database = get_root_client(config)[fixture_id]
+        for action in static_actions:
+            action.apply(database)
+
+        template_database = _template_databases[key] = fixture_id
+    return template_database
+
+
+def supports_cross_database_out(config: MongoConfig) -> bool:
+    """Whether `$out` may write to a different database (MongoDB 4.4+).
+
+    The server's version is only requested once per config, until the container is torn down.
+    """
+    supported = _cross_database_out.get(config)
+    if supported is None:
+        version = get_root_client(config).server_info()["versionArray"]
+        supported = _cross_database_out[config] = tuple(version[:2]) >= (4, 4)
+    return supported
+
+
+def copy_database(root_client, source_name: str, target_name: str, *, use_out: bool = False):
+    """Copy all collections (their options, documents and indexes) between databases.
+
+    With `use_out`, documents are copied server-side through an `$out` stage (which requires
+    `supports_cross_database_out`). Otherwise they are read back and inserted in unordered
+    batches.
+    """
+    source = root_client[source_name]
+    target = root_client[target_name]
+
+    # Views are created last, after the collections they may be defined upon.
+    collections = sorted(source.list_collections(), key=lambda info: info.get("type") == "view")
+    for info in collections:
+        name = info["name"]
+        if name.startswith("system."):
+            continue
+
+        options = info.get("options", {})
+        target.command("create", name, **options)
+        if info.get("type") == "view":
+            continue
+
+        # `$out` cannot write to capped collections.
+        if use_out and not options.get("capped"):
+            source[name].aggregate([{"$out": {"db": target_name, "coll": name}}])
+        else:
+            documents = source[name].find(batch_size=INSERT_BATCH_SIZE)
+            while True:
+                batch = list(itertools.islice(documents, INSERT_BATCH_SIZE))
+                if not batch:
+                    break
+                target[name].insert_many(batch, ordered=False)
+
+        indexes = [
+            {key: value for key, value in index.items() if key not in ("v", "ns")}
+            for index in source[name].list_indexes()
+            if index["name"] != "_id_"
+        ]
+        if indexes:
+            target.command("createIndexes", name, indexes=indexes)
+
+
+def _produce_clean_database(root_client, config: MongoConfig) -> str:
     root_db = root_client[config.root_database]
 
     # Create a collection called `pytestMockResourceDbs' in the admin tab if not already created.
@@ -55,12 +266,40 @@ def _create_clean_database(config):
     new_database = root_client[db_id]
 
     #  Create a user as that databases owner
-    password = "password"  # noqa: S105
-    new_database.command("createUser", db_id, pwd=password, roles=["dbOwner"])
+    new_database.command("createUser", db_id, pwd=PASSWORD, roles=["dbOwner"])
+    return db_id
+
+
+def _create_clean_database(
+    config: MongoConfig,
+    *,
+    database_pool_size=0,
+    fixture_id: Optional[str] = None,
+    static_actions=(),
+    dynamic_actions=(),
+):
+    timer = get_timer()
+    root_client = get_root_client(config)
+
+    template_database = None
+    if fixture_id:
+        with timer("template"):
+            template_database = get_template_database(config, fixture_id, static_actions)
+
+    with timer("create_database"):
+        if database_pool_size:
+            db_id = get_database_pool(config, size=database_pool_size).get()
+        else:
+            db_id = _produce_clean_database(root_client, config)
+
+    if template_database:
+        with timer("static_actions"):
+            use_out = supports_cross_database_out(config)
+            copy_database(root_client, template_database, db_id, use_out=use_out)
 
     #  pass back an authenticated db connection
     limited_client = pymongo.MongoClient(
-        config.host, config.port, username=db_id, password=password, authSource=db_id
+        config.host, config.port, username=db_id, password=PASSWORD, authSource=db_id
     )
     limited_db = limited_client[db_id]
 
@@ -70,7 +309,19 @@ def _create_clean_database(config):
         host=config.host,
         port=config.port,
         username=db_id,
-        password=password,
+        password=PASSWORD,
         database=db_id,
     )
-    return limited_db
+
+    with timer("dynamic_actions"):
+        for action in dynamic_actions:
+            if isinstance(action, AbstractAction):
+                action.apply(limited_db)
+            else:
+                action(limited_db)
+
+    try:
+        yield limited_db
+    finally:
+        with timer("dispose"):
+            limited_client.close()
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import contextlib
 import io
+import itertools
+import os
 from dataclasses import dataclass
-from typing import BinaryIO, ClassVar, Iterable, TextIO, TYPE_CHECKING, Union
+from typing import BinaryIO, ClassVar, Iterable, Iterator, Sequence, TextIO, TYPE_CHECKING, Union
 
 from pytest_mock_resources.action import AbstractAction, validate_actions
 
@@ -10,7 +13,11 @@ if TYPE_CHECKING:
     from pytest_mock_resources.fixture.moto.base import Session
 
 
-ObjectContent = Union[bytes, str, BinaryIO, TextIO]
+ObjectContent = Union[bytes, str, BinaryIO, TextIO, os.PathLike]
+
+# Objects larger than the threshold are uploaded in parts.
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MAX_UPLOAD_CONCURRENCY = 10
 
 
 @dataclass
@@ -24,7 +31,7 @@ class S3Bucket(AbstractAction):
         return S3Object(self, key, data)
 
     def apply(self, session: Session):
-        client = session.resource("s3")
+        client = session.client("s3")
         client.create_bucket(Bucket=self.name)
 
 
@@ -38,28 +45,112 @@ class S3Object(AbstractAction):
     data: ObjectContent
     encoding: str = "utf-8"
 
+    @property
+    def bucket_name(self) -> str:
+        return self.bucket.name if isinstance(self.bucket, S3Bucket) else self.bucket
+
     def apply(self, session: Session):
-        resource = session.resource("s3")
-        bucket_name = self.bucket.name if isinstance(self.bucket, S3Bucket) else self.bucket
-
-        if isinstance(self.data, str):
-            data = io.BytesIO(self.data.encode(self.encoding))
-        elif isinstance(self.data, bytes):
-            data = io.BytesIO(self.data)
-        elif isinstance(self.data, io.StringIO):
-            data = io.BytesIO(self.data.getvalue().encode(self.encoding))
-        elif isinstance(self.data, io.BytesIO):
-            data = io.BytesIO(self.data.getbuffer().tobytes())
+        upload_objects(session, [self])
+
+    @contextlib.contextmanager
+    def open(self) -> Iterator[BinaryIO]:
+        """Produce a binary file object of the object's `data`, avoiding copies where possible.
+
+        Paths are streamed from disk, and file objects are read from their start.
+        """
+        data = self.data
+        if isinstance(data, str):
+            yield io.BytesIO(data.encode(self.encoding))
+        elif isinstance(data, bytes):
+            yield io.BytesIO(data)
+        elif isinstance(data, os.PathLike):
+            with open(data, "rb") as f:
+                yield f
+        elif isinstance(data, io.BytesIO):
+            # `getvalue` shares (rather than copies) the underlying buffer.
+            yield io.BytesIO(data.getvalue())
+        elif isinstance(data, io.StringIO):
+            yield io.BytesIO(data.getvalue().encode(self.encoding))
+        elif isinstance(data, io.TextIOBase):
+            if data.seekable():
+                data.seek(0)
+            yield io.BytesIO(data.read().encode(self.encoding))
+        elif isinstance(data, io.IOBase):
+            if data.seekable():
+                data.seek(0)
+            yield BorrowedFile(data)
         else:
             raise NotImplementedError()
 
-        resource.Object(bucket_name=bucket_name, key=self.key).upload_fileobj(data)
+
+class BorrowedFile(io.BufferedIOBase):
+    """Read from a file object owned by the caller, which is left open when this is closed.
+
+    The upload closes the file objects it is given.
+    """
+
+    def __init__(self, f: BinaryIO):
+        self.f = f
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        return self.f.read(size)
+
+    def seekable(self):
+        return self.f.seekable()
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self.f.seek(offset, whence)
+
+    def tell(self):
+        return self.f.tell()
+
+
+def upload_objects(session: Session, objects: Sequence[S3Object]):
+    """Upload `objects` concurrently, through the session's s3 client.
+
+    Large objects are uploaded in parts, which are themselves uploaded concurrently.
+    """
+    from boto3.s3.transfer import create_transfer_manager, TransferConfig
+
+    config = TransferConfig(
+        multipart_threshold=MULTIPART_THRESHOLD, max_concurrency=MAX_UPLOAD_CONCURRENCY
+    )
+    client = session.client("s3")
+
+    with contextlib.ExitStack() as stack:
+        files = [stack.enter_context(s3_object.open()) for s3_object in objects]
+
+        # The manager waits on (or cancels) all uploads on exit, before the files are closed.
+        with create_transfer_manager(client, config) as manager:
+            futures = [
+                manager.upload(f, s3_object.bucket_name, s3_object.key)
+                for f, s3_object in zip(files, objects)
+            ]
+
+            # Raise the first error encountered, if any.
+            for future in futures:
+                future.result()
 
 
 MotoAction = Union[S3Bucket, S3Object]
 
 
 def apply_ordered_actions(session: Session, ordered_actions: Iterable[MotoAction]):
+    """Apply each action in order.
+
+    Actions all share the session's (memoized) clients, rather than producing their own.
+    Runs of consecutive `S3Object` actions are uploaded concurrently.
+    """
     validate_actions(ordered_actions, fixture="moto")
-    for action in ordered_actions:
-        action.apply(session)
+
+    for is_object, actions in itertools.groupby(
+        ordered_actions, key=lambda action: isinstance(action, S3Object)
+    ):
+        if is_object:
+            upload_objects(session, [action for action in actions if isinstance(action, S3Object)])
+        else:
+            for action in actions:
+                action.apply(session)
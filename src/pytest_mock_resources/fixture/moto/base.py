@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-import time
+import dataclasses
+import os
+import threading
+import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import Any
 
 import pytest
 
@@ -9,9 +14,12 @@ from pytest_mock_resources.action import validate_actions
 from pytest_mock_resources.compat import boto3
 from pytest_mock_resources.container.base import get_container
 from pytest_mock_resources.container.moto import endpoint_url, MotoConfig
-from pytest_mock_resources.fixture.base import Scope
+from pytest_mock_resources.fixture.base import ResourcePool, Scope
 from pytest_mock_resources.fixture.moto.action import apply_ordered_actions, MotoAction
 
+ACCOUNT_POOL_SIZE = 0
+CLIENT_CACHE_SIZE = 32
+
 
 @pytest.fixture(scope="session")
 def pmr_moto_config():
@@ -27,13 +35,17 @@ def pmr_moto_config():
 
 @pytest.fixture(scope="session")
 def pmr_moto_container(pytestconfig, pmr_moto_config):
-    yield from get_container(pytestconfig, pmr_moto_config)
+    try:
+        yield from get_container(pytestconfig, pmr_moto_config)
+    finally:
+        close_session_resources(pmr_moto_config)
 
 
 def create_moto_fixture(
     *ordered_actions: MotoAction,
     region_name: str = "us-east-1",
     scope: Scope = "function",
+    account_pool_size: int = ACCOUNT_POOL_SIZE,
 ):
     """Produce a Moto fixture.
 
@@ -58,21 +70,22 @@ def create_moto_fixture(
         ordered_actions: Any number of ordered actions to be run on test setup.
         region_name (str): The name of the AWS region to use, defaults to "us-east-1".
         scope (str): The scope of the fixture can be specified by the user, defaults to "function".
+        account_pool_size (int): The number of (fake) AWS accounts to assume roles in ahead of
+            their use, in a background thread. Defaults to 0, in which case a role is instead
+            assumed as each test is set up.
     """
     validate_actions(ordered_actions, fixture="moto")
 
     @pytest.fixture(scope=scope)
     def _fixture(pmr_moto_container, pmr_moto_config) -> Session:
-        url = endpoint_url(pmr_moto_config)
-        credentials = Credentials.from_endpoint_url(url, region_name=region_name)
+        if account_pool_size:
+            credentials = get_account_pool(pmr_moto_config, size=account_pool_size).get()
+        else:
+            credentials = Credentials.from_endpoint_url(endpoint_url(pmr_moto_config))
 
+        credentials = dataclasses.replace(credentials, region_name=region_name)
         session = Session(
-            boto3.Session(
-                aws_access_key_id=credentials.aws_access_key_id,
-                aws_secret_access_key=credentials.aws_secret_access_key,
-                aws_session_token=credentials.aws_session_token,
-                region_name=region_name,
-            ),
+            create_boto3_session(credentials),
             endpoint_url=credentials.endpoint_url,
             pmr_credentials=credentials,
         )
@@ -82,6 +95,101 @@ def create_moto_fixture(
     return _fixture
 
 
+_data_loader: Any = None
+_data_loader_lock = threading.Lock()
+_sts_clients: dict[tuple[str, str], Any] = {}
+_account_pools: dict[MotoConfig, ResourcePool[Credentials]] = {}
+
+
+def get_data_loader():
+    """Get the botocore loader shared by all sessions, so service models are only parsed once."""
+    global _data_loader
+
+    with _data_loader_lock:
+        if _data_loader is None:
+            import botocore.loaders
+
+            loader = botocore.loaders.create_loader()
+            loader.search_paths.append(os.path.join(os.path.dirname(boto3.__file__), "data"))
+            _data_loader = loader
+    return _data_loader
+
+
+class SessionDataLoader:
+    """Load data through the shared botocore loader, on behalf of a single session.
+
+    boto3 appends its data path to each session's loader, so each is given its own list of
+    search paths, rather than modifying the shared loader's (which already includes it).
+    """
+
+    def __init__(self, loader):
+        self._loader = loader
+        self.search_paths = list(loader.search_paths)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+def create_boto3_session(credentials: Credentials) -> boto3.Session:
+    """Create a session for the given credentials, which shares the botocore loader."""
+    import botocore.session
+
+    botocore_session = botocore.session.get_session()
+    botocore_session.register_component("data_loader", SessionDataLoader(get_data_loader()))
+    return boto3.Session(
+        aws_access_key_id=credentials.aws_access_key_id,
+        aws_secret_access_key=credentials.aws_secret_access_key,
+        aws_session_token=credentials.aws_session_token,
+        region_name=credentials.region_name,
+        botocore_session=botocore_session,
+    )
+
+
+def get_sts_client(url: str, region_name: str = "us-east-1"):
+    """Get the (thread-safe) STS client used to assume roles in new accounts."""
+    key = (url, region_name)
+    client = _sts_clients.get(key)
+    if client is None:
+        session = create_boto3_session(
+            Credentials(
+                aws_access_key_id="test",
+                aws_secret_access_key="test",  # noqa: S106
+                aws_session_token="",
+                endpoint_url=url,
+                region_name=region_name,
+            )
+        )
+        client = _sts_clients[key] = session.client("sts", endpoint_url=url)
+    return client
+
+
+def get_account_pool(config: MotoConfig, *, size: int) -> ResourcePool[Credentials]:
+    """Get (or start) the pool of credentials, each for a role in a distinct account."""
+    pool = _account_pools.get(config)
+    if pool is None:
+        url = endpoint_url(config)
+        pool = _account_pools[config] = ResourcePool(
+            lambda: Credentials.from_endpoint_url(url), size=size
+        )
+    return pool
+
+
+def close_session_resources(config: MotoConfig):
+    """Release the state held on behalf of the given config's container."""
+    pool = _account_pools.pop(config, None)
+    if pool is not None:
+        pool.close()
+
+    url = endpoint_url(config)
+    for key in [key for key in _sts_clients if key[0] == url]:
+        _sts_clients.pop(key).close()
+
+
+def generate_account_id() -> str:
+    """Generate a (practically) unique 12-digit account id, across processes."""
+    return str(uuid.uuid4().int % 10**12).zfill(12)
+
+
 @dataclass
 class Credentials:
     aws_access_key_id: str
@@ -95,16 +203,9 @@ class Credentials:
         cls, url: str, account_id: str | None = None, region_name: str = "us-east-1"
     ):
         if account_id is None:
-            # Attempt at a cross-process way of generating unique 12-character integers.
-            account_id = str(time.time_ns())[:12]
+            account_id = generate_account_id()
 
-        sts = boto3.client(
-            "sts",
-            endpoint_url=url,
-            aws_access_key_id="test",
-            aws_secret_access_key="test",  # noqa: S106
-            region_name=region_name,
-        )
+        sts = get_sts_client(url, region_name=region_name)
         response = sts.assume_role(
             RoleArn=f"arn:aws:iam::{account_id}:role/my-role",
             RoleSessionName="test-session-name",
@@ -131,14 +232,40 @@ class Credentials:
 
 @dataclass
 class Session:
-    """Wrap the vanilla boto3 Session object, automatically inserting the endpoint_url field."""
+    """Wrap the vanilla boto3 Session object, automatically inserting the endpoint_url field.
+
+    Clients and resources are memoized per `service_name` (and kwargs), such that repeated
+    calls hand back the same object. Calls with unhashable kwargs are never memoized.
+    """
 
     session: boto3.Session
     endpoint_url: str
     pmr_credentials: Credentials
+    cache_size: int = CLIENT_CACHE_SIZE
+
+    _cache: OrderedDict = dataclasses.field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
 
     def client(self, service_name, **kwargs):
-        return self.session.client(service_name, endpoint_url=self.endpoint_url, **kwargs)
+        return self._memoize(self.session.client, service_name, kwargs)
 
     def resource(self, service_name, **kwargs):
-        return self.session.resource(service_name, endpoint_url=self.endpoint_url, **kwargs)
+        return self._memoize(self.session.resource, service_name, kwargs)
+
+    def _memoize(self, create, service_name, kwargs):
+        try:
+            key = (create.__name__, service_name, frozenset(kwargs.items()))
+            hash(key)
+        except TypeError:
+            return create(service_name, endpoint_url=self.endpoint_url, **kwargs)
+
+        value = self._cache.get(key)
+        if value is not None:
+            self._cache.move_to_end(key)
+            return value
+
+        value = self._cache[key] = create(service_name, endpoint_url=self.endpoint_url, **kwargs)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return value
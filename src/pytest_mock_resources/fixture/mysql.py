@@ -1,10 +1,33 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
 import pytest
 import sqlalchemy
-from sqlalchemy import text
+from sqlalchemy import MetaData, text
+from sqlalchemy.engine import Engine
 
-from pytest_mock_resources.container.base import get_container
+from pytest_mock_resources.container.base import (
+    async_retry,
+    ContainerCheckFailed,
+    DEFAULT_RETRIES,
+    get_container,
+)
 from pytest_mock_resources.container.mysql import get_sqlalchemy_engine, MysqlConfig
-from pytest_mock_resources.sqlalchemy import EngineManager
+from pytest_mock_resources.fixture.base import asyncio_fixture, generate_fixture_id
+from pytest_mock_resources.sqlalchemy import bifurcate_actions, EngineManager, normalize_actions
+from pytest_mock_resources.timing import get_timer
+
+MAX_COPY_WORKERS = 8
+
+# Database objects which are not copied by `MysqlTemplate`.
+UNCOPYABLE_OBJECT_QUERIES = [
+    "SELECT COUNT(*) FROM information_schema.VIEWS WHERE TABLE_SCHEMA = :database",
+    "SELECT COUNT(*) FROM information_schema.ROUTINES WHERE ROUTINE_SCHEMA = :database",
+    "SELECT COUNT(*) FROM information_schema.TRIGGERS WHERE TRIGGER_SCHEMA = :database",
+    "SELECT COUNT(*) FROM information_schema.EVENTS WHERE EVENT_SCHEMA = :database",
+]
 
 
 @pytest.fixture(scope="session")
@@ -21,7 +44,10 @@ def pmr_mysql_config():
 
 @pytest.fixture(scope="session")
 def pmr_mysql_container(pytestconfig, pmr_mysql_config):
-    yield from get_container(pytestconfig, pmr_mysql_config, interval=1, retries=60)
+    try:
+        yield from get_container(pytestconfig, pmr_mysql_config, interval=1, retries=60)
+    finally:
+        close_session_resources(pmr_mysql_config)
 
 
 def create_mysql_fixture(
@@ -30,6 +56,8 @@ def create_mysql_fixture(
     tables=None,
     session=None,
     engine_kwargs=None,
+    template_database=True,
+    async_=False,
 ):
     """Produce a MySQL fixture.
 
@@ -44,56 +72,373 @@ def create_mysql_fixture(
         session: Whether to return a session instead of an engine directly. This can
             either be a bool or a callable capable of producing a session.
         engine_kwargs: Optional set of kwargs to send into the engine on creation.
+        template_database: Defaults to True. When True, amortizes the cost of performing database
+            setup through `ordered_actions`, by performing them once into a "template"
+            database, then copying its tables (and their rows) into each per-test database.
+            Templates which contain views, routines, triggers or events (or tables outside
+            of the template database itself) cannot be copied, in which case the actions are
+            instead performed per-test.
+        async_: Whether to return an async fixture/client. Requires either `asyncmy` or
+            `aiomysql` to be installed (or the `drivername` of `MysqlConfig` to be configured).
     """
+    fixture_id = generate_fixture_id(enabled=template_database, name="mysql")
+    fixture_kwargs = {
+        "tables": tables,
+        "session": session,
+        "engine_kwargs": engine_kwargs or {},
+        "fixture_id": fixture_id,
+    }
 
     @pytest.fixture(scope=scope)
-    def _(pmr_mysql_container, pmr_mysql_config):
-        database_name = _create_clean_database(pmr_mysql_config)
-        engine = get_sqlalchemy_engine(
-            pmr_mysql_config,
-            database_name,
-            **(engine_kwargs or {}),
-        )
+    def _sync(pmr_mysql_container, pmr_mysql_config):
+        fixture = _sync_fixture(pmr_mysql_config, ordered_actions, **fixture_kwargs)
+        for _, conn in fixture:
+            yield conn
 
-        engine_manager = EngineManager.create(
-            fixture="mysql",
-            dynamic_actions=ordered_actions,
-            tables=tables,
-            session=session,
-        )
-        for _, conn in engine_manager.manage_sync(engine):
+    async def _async(pmr_mysql_container, pmr_mysql_config):
+        fixture = _async_fixture(pmr_mysql_config, ordered_actions, **fixture_kwargs)
+        async for _, conn in fixture:
             yield conn
 
-    return _
+    if async_:
+        return asyncio_fixture(_async, scope=scope)
+    return _sync
 
 
-def _create_clean_database(config):
-    root_engine = get_sqlalchemy_engine(config, config.root_database, isolation_level="AUTOCOMMIT")
+def _sync_fixture(config, ordered_actions, *, tables, session, engine_kwargs, fixture_id):
+    timer = get_timer()
 
-    with root_engine.begin() as conn:
+    normalized_actions = normalize_actions(ordered_actions, fixture="mysql")
+    static_actions, dynamic_actions = bifurcate_actions(normalized_actions)
+
+    template = None
+    if fixture_id and static_actions:
+        with timer("template"):
+            template = get_template(config, fixture_id, static_actions, tables=tables)
+
+    with timer("create_database"):
+        database_name = _create_clean_database(config)
+        engine = get_sqlalchemy_engine(config, database_name, **engine_kwargs)
+
+        if template:
+            template.copy_to(engine)
+            static_actions = []
+
+    engine_manager = EngineManager(
+        dynamic_actions,
+        static_actions=static_actions,
+        tables=tables,
+        session=session,
+    )
+    yield from engine_manager.manage_sync(engine)
+
+
+async def _async_fixture(config, ordered_actions, *, tables, session, engine_kwargs, fixture_id):
+    timer = get_timer()
+
+    with timer("connect"):
+        await async_retry(
+            config.async_check_fn, retries=DEFAULT_RETRIES, on_exc=ContainerCheckFailed
+        )
+
+    normalized_actions = normalize_actions(ordered_actions, fixture="mysql")
+    static_actions, dynamic_actions = bifurcate_actions(normalized_actions)
+
+    root_engine = get_sqlalchemy_engine(
+        config, config.root_database, async_=True, isolation_level="AUTOCOMMIT"
+    )
+    try:
+        template = None
+        if fixture_id and static_actions:
+            with timer("template"):
+                template = await get_template_async(
+                    config, fixture_id, static_actions, tables=tables, root_engine=root_engine
+                )
+
+        with timer("create_database"):
+            async with root_engine.begin() as conn:
+                database_name = await conn.run_sync(_produce_clean_database)
+    finally:
+        await root_engine.dispose()
+
+    engine = get_sqlalchemy_engine(config, database_name, async_=True, **engine_kwargs)
+    if template:
+        with timer("create_database"):
+            await template.copy_to_async(engine)
+        static_actions = []
+
+    engine_manager = EngineManager(
+        dynamic_actions,
+        static_actions=static_actions,
+        tables=tables,
+        session=session,
+    )
+    async for engine, conn in engine_manager.manage_async(engine):
+        yield engine, conn
+
+
+@dataclass
+class TemplateTable:
+    name: str
+    create_statement: str
+    columns: List[str]
+
+    def copy(self, conn, template_database: str):
+        columns = ", ".join(f"`{column}`" for column in self.columns)
+
+        # Tables are copied in no particular order.
+        conn.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
         try:
+            conn.execute(text(self.create_statement))
             conn.execute(
                 text(
-                    """
-                CREATE TABLE IF NOT EXISTS pytest_mock_resource_db(
-                    id serial
-                );
-                """
+                    f"INSERT INTO `{self.name}` ({columns}) "  # noqa: S608
+                    f"SELECT {columns} FROM `{template_database}`.`{self.name}`"
                 )
             )
-        except (sqlalchemy.exc.IntegrityError, sqlalchemy.exc.ProgrammingError):
-            # A race condition may occur during table creation if:
-            #  - another process has already created the table
-            #  - the current process begins creating the table
-            #  - the other process commits the table creation
-            #  - the current process tries to commit the table creation
-            pass
+        finally:
+            # The connection returns to the pool the test itself uses.
+            conn.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
+
+
+@dataclass
+class MysqlTemplate:
+    """A database into which a fixture's static actions have been performed.
+
+    MySQL has no equivalent to postgres' `CREATE DATABASE ... TEMPLATE`. Instead, each table
+    is recreated from its `SHOW CREATE TABLE` statement (which, unlike `CREATE TABLE ... LIKE`,
+    retains foreign keys), and populated through `INSERT ... SELECT`.
+    """
+
+    database: str
+    tables: List[TemplateTable]
+
+    @classmethod
+    def inspect(cls, conn, database: str) -> Optional["MysqlTemplate"]:
+        """Describe the tables of `database`, or produce `None` if it cannot be copied."""
+        for query in UNCOPYABLE_OBJECT_QUERIES:
+            result = conn.execute(text(query), {"database": database})
+            if result.scalar():
+                return None
+
+        result = conn.execute(
+            text(
+                "SELECT TABLE_NAME FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = :database AND TABLE_TYPE = 'BASE TABLE'"
+            ),
+            {"database": database},
+        )
+        table_names = [row[0] for row in result]
+
+        tables = []
+        for table_name in table_names:
+            create_statement = conn.execute(
+                text(f"SHOW CREATE TABLE `{database}`.`{table_name}`")
+            ).fetchone()[1]
+
+            # Generated columns cannot be inserted into.
+            result = conn.execute(
+                text(
+                    "SELECT COLUMN_NAME FROM information_schema.COLUMNS "
+                    "WHERE TABLE_SCHEMA = :database AND TABLE_NAME = :table "
+                    "AND EXTRA NOT LIKE '%GENERATED%' "
+                    "ORDER BY ORDINAL_POSITION"
+                ),
+                {"database": database, "table": table_name},
+            )
+            columns = [row[0] for row in result]
+            tables.append(TemplateTable(table_name, create_statement, columns))
+
+        return cls(database, tables)
+
+    def copy_to(self, engine):
+        """Copy the template's tables into the (empty) database of `engine`, in parallel."""
+        if not self.tables:
+            return
+
+        def copy(table: TemplateTable):
+            with engine.begin() as conn:
+                table.copy(conn, self.database)
+
+        max_workers = min(MAX_COPY_WORKERS, len(self.tables))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results to raise any error encountered.
+            list(executor.map(copy, self.tables))
+
+    async def copy_to_async(self, engine):
+        """Copy the template's tables into the database of the async `engine`, concurrently."""
+        semaphore = asyncio.Semaphore(MAX_COPY_WORKERS)
+
+        async def copy(table: TemplateTable):
+            async with semaphore:
+                async with engine.begin() as conn:
+                    await conn.run_sync(table.copy, self.database)
+
+        await asyncio.gather(*(copy(table) for table in self.tables))
+
 
-        conn.execute(text("INSERT INTO pytest_mock_resource_db VALUES (DEFAULT)"))
-        result = conn.execute(text("SELECT LAST_INSERT_ID()"))
-        id_ = next(iter(result))[0]
-        database_name = f"pytest_mock_resource_db_{id_}"
+_root_engines: Dict[MysqlConfig, Engine] = {}
+_templates: Dict[Tuple[MysqlConfig, str], Optional[MysqlTemplate]] = {}
+
+
+def get_root_engine(config: MysqlConfig) -> Engine:
+    """Get the (autocommit) engine used to execute administrative statements.
+
+    A single engine is shared by all fixtures using the same config, so that its pooled
+    connections are reused across tests.
+    """
+    engine = _root_engines.get(config)
+    if engine is None:
+        engine = _root_engines[config] = get_sqlalchemy_engine(
+            config, config.root_database, isolation_level="AUTOCOMMIT"
+        )
+    return engine
+
+
+def get_template(
+    config: MysqlConfig, fixture_id: str, static_actions, *, tables
+) -> Optional[MysqlTemplate]:
+    """Get (or create) the template database for a fixture.
+
+    Produces `None` when the fixture's static actions cannot be captured in a template.
+    """
+    key = (config, fixture_id)
+    if key in _templates:
+        return _templates[key]
+
+    template = None
+    if not _has_external_tables(static_actions):
+        template = _build_template(config, fixture_id, static_actions, tables=tables)
+
+    _templates[key] = template
+    return template
+
+
+async def get_template_async(
+    config: MysqlConfig, fixture_id: str, static_actions, *, tables, root_engine
+) -> Optional[MysqlTemplate]:
+    """Get (or create) the template database for a fixture, through async engines."""
+    key = (config, fixture_id)
+    if key in _templates:
+        return _templates[key]
+
+    template = None
+    if not _has_external_tables(static_actions):
+        async with root_engine.connect() as conn:
+            await conn.run_sync(_reset_database, fixture_id)
+
+        engine = get_sqlalchemy_engine(config, fixture_id, async_=True)
+        try:
+            template_manager = EngineManager([], static_actions=static_actions, tables=tables)
+            async with engine.begin() as conn:
+                await conn.run_sync(template_manager.run_static_actions)
+        finally:
+            await engine.dispose()
+
+        async with root_engine.connect() as conn:
+            template = await conn.run_sync(_inspect_template, fixture_id)
+
+    _templates[key] = template
+    return template
+
+
+def close_session_resources(config: MysqlConfig):
+    """Release the state held on behalf of the given config's container.
+
+    Template databases are dropped, and the root engine's connections are closed.
+    """
+    keys = [key for key in _templates if key[0] is config]
+    templates = [template for template in (_templates.pop(key) for key in keys) if template]
+
+    # Templates built by async fixtures are likewise dropped through the (sync) root engine.
+    if templates:
+        get_root_engine(config)
+
+    root_engine = _root_engines.pop(config, None)
+    if root_engine is None:
+        return
+
+    try:
+        with root_engine.connect() as conn:
+            for template in templates:
+                _drop_database(conn, template.database)
+    finally:
+        root_engine.dispose()
+
+
+def _has_external_tables(static_actions) -> bool:
+    """Whether any of the actions' tables live outside of the fixture's own database."""
+    return any(
+        table.schema
+        for action in static_actions
+        if isinstance(action, MetaData)
+        for table in action.tables.values()
+    )
+
+
+def _build_template(config, database_name, static_actions, *, tables):
+    root_engine = get_root_engine(config)
+    with root_engine.connect() as conn:
+        _reset_database(conn, database_name)
+
+    engine = get_sqlalchemy_engine(config, database_name)
+    try:
+        template_manager = EngineManager([], static_actions=static_actions, tables=tables)
+        with engine.begin() as conn:
+            template_manager.run_static_actions(conn)
+    finally:
+        engine.dispose()
+
+    with root_engine.connect() as conn:
+        return _inspect_template(conn, database_name)
+
+
+def _reset_database(conn, database_name):
+    _drop_database(conn, database_name)
+    conn.execute(text(f"CREATE DATABASE `{database_name}`"))
+
+
+def _drop_database(conn, database_name):
+    conn.execute(text(f"DROP DATABASE IF EXISTS `{database_name}`"))
+
+
+def _inspect_template(conn, database_name) -> Optional[MysqlTemplate]:
+    template = MysqlTemplate.inspect(conn, database_name)
+    if template is None:
+        _drop_database(conn, database_name)
+    return template
+
+
+def _create_clean_database(config):
+    root_engine = get_root_engine(config)
+
+    with root_engine.begin() as conn:
+        return _produce_clean_database(conn)
+
+
+def _produce_clean_database(conn):
+    try:
+        conn.execute(
+            text(
+                """
+            CREATE TABLE IF NOT EXISTS pytest_mock_resource_db(
+                id serial
+            );
+            """
+            )
+        )
+    except (sqlalchemy.exc.IntegrityError, sqlalchemy.exc.ProgrammingError):
+        # A race condition may occur during table creation if:
+        #  - another process has already created the table
+        #  - the current process begins creating the table
+        #  - the other process commits the table creation
+        #  - the current process tries to commit the table creation
+        pass
 
-        conn.execute(text(f"CREATE DATABASE {database_name}"))
+    conn.execute(text("INSERT INTO pytest_mock_resource_db VALUES (DEFAULT)"))
+    result = conn.execute(text("SELECT LAST_INSERT_ID()"))
+    id_ = next(iter(result))[0]
+    database_name = f"pytest_mock_resource_db_{id_}"
 
+    conn.execute(text(f"CREATE DATABASE {database_name}"))
     return database_name
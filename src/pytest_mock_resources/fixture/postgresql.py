@@ -1,5 +1,8 @@
+import hashlib
 import logging
-from typing import cast, Optional
+import os
+import uuid
+from typing import cast, Dict, Optional, Tuple
 
 import pytest
 import sqlalchemy
@@ -8,6 +11,7 @@ from sqlalchemy.engine import Connection, Engine
 
 from pytest_mock_resources.container.base import (
     async_retry,
+    ContainerCheckFailed,
     DEFAULT_RETRIES,
     get_container,
     retry,
@@ -16,12 +20,20 @@ from pytest_mock_resources.container.postgres import (
     get_sqlalchemy_engine,
     PostgresConfig,
 )
-from pytest_mock_resources.fixture.base import asyncio_fixture, generate_fixture_id, Scope
+from pytest_mock_resources.fixture.base import (
+    asyncio_fixture,
+    generate_fixture_id,
+    Isolation,
+    ResourcePool,
+    Scope,
+)
 from pytest_mock_resources.sqlalchemy import (
     bifurcate_actions,
     EngineManager,
+    fingerprint_actions,
     normalize_actions,
 )
+from pytest_mock_resources.timing import get_timer
 
 __all__ = [
     "DatabaseExistsError",
@@ -99,7 +111,10 @@ def create_postgres_container_fixture(
     @pytest.fixture(scope=scope)
     def fixture(pytestconfig, pmr_postgres_config: PostgresConfig):
         postgres_config = config or pmr_postgres_config
-        yield from get_container(pytestconfig, postgres_config)
+        try:
+            yield from get_container(pytestconfig, postgres_config)
+        finally:
+            close_session_resources(postgres_config)
 
     return fixture
 
@@ -114,6 +129,8 @@ def create_postgres_fixture(
     engine_kwargs=None,
     template_database=True,
     actions_share_transaction=None,
+    database_pool_size=0,
+    isolation: Isolation = "database",
 ):
     """Produce a Postgres fixture.
 
@@ -141,7 +158,16 @@ def create_postgres_fixture(
             fixtures for backwards compatibility; and disabled by default for
             asynchronous fixtures (the way v2-style/async features work in SQLAlchemy can lead
             to bad default behavior).
+        database_pool_size: Defaults to 0 (disabled). When greater than 0, that many per-test
+            databases are created ahead of time in a background thread, so that tests are handed
+            an already-created database rather than waiting on a `CREATE DATABASE`. Only applies
+            to synchronous fixtures.
+        isolation: How tests are isolated from one another. Defaults to "database", where each
+            test receives a brand new database. With "savepoint", all tests share a single
+            database, and each test receives a connection (or session) inside a transaction
+            which is rolled back at teardown. Only supported by synchronous fixtures.
     """
+    shared_database_id = validate_isolation(isolation, async_=async_)
     fixture_id = generate_fixture_id(enabled=template_database, name="pg")
 
     engine_kwargs_ = engine_kwargs or {}
@@ -156,7 +182,13 @@ def create_postgres_fixture(
 
     @pytest.fixture(scope=scope)
     def _sync(*_, pmr_postgres_container, pmr_postgres_config):
-        fixture = _sync_fixture(pmr_postgres_config, engine_manager_kwargs, engine_kwargs_)
+        fixture = _sync_fixture(
+            pmr_postgres_config,
+            engine_manager_kwargs,
+            engine_kwargs_,
+            database_pool_size=database_pool_size,
+            shared_database_id=shared_database_id,
+        )
         for _, conn in fixture:
             yield conn
 
@@ -170,91 +202,122 @@ def create_postgres_fixture(
     return _sync
 
 
-def _sync_fixture(pmr_config, engine_manager_kwargs, engine_kwargs, *, fixture="postgres"):
-    root_engine = cast(Engine, get_sqlalchemy_engine(pmr_config, pmr_config.root_database))
-    conn = retry(root_engine.connect, retries=DEFAULT_RETRIES)
-    conn.close()
-    root_engine.dispose()
-
-    root_engine = cast(
-        Engine,
-        get_sqlalchemy_engine(pmr_config, pmr_config.root_database, autocommit=True),
-    )
-    with root_engine.connect() as root_conn:
-        with root_conn.begin() as trans:
-            template_database, template_manager, engine_manager = create_engine_manager(
-                root_conn, **engine_manager_kwargs, fixture=fixture
-            )
-            trans.commit()
-    root_engine.dispose()
+def _sync_fixture(
+    pmr_config,
+    engine_manager_kwargs,
+    engine_kwargs,
+    *,
+    fixture="postgres",
+    database_pool_size=0,
+    shared_database_id=None,
+):
+    timer = get_timer()
+
+    root_engine = get_root_engine(pmr_config)
+    with timer("connect"):
+        conn = retry(root_engine.connect, retries=DEFAULT_RETRIES)
+        conn.close()
+
+    with timer("template"):
+        with root_engine.connect() as root_conn:
+            with root_conn.begin() as trans:
+                template_database, template_manager, engine_manager = create_engine_manager(
+                    root_conn, **engine_manager_kwargs, fixture=fixture
+                )
+                trans.commit()
 
-    if template_manager:
-        assert template_database
+        if template_manager:
+            assert template_database
 
-        template_engine = cast(
-            Engine,
-            get_sqlalchemy_engine(pmr_config, template_database, **engine_kwargs),
+            build_database = _template_build_database(template_database)
+            template_engine = cast(
+                Engine,
+                get_sqlalchemy_engine(pmr_config, build_database, **engine_kwargs),
+            )
+            with template_engine.connect() as conn:
+                with conn.begin() as trans:
+                    template_manager.run_static_actions(conn)
+                    trans.commit()
+            template_engine.dispose()
+
+            with root_engine.connect() as root_conn:
+                _publish_template_database(root_conn, build_database, template_database)
+
+    if shared_database_id:
+        engine = get_shared_engine(
+            pmr_config, template_database, shared_database_id, engine_kwargs=engine_kwargs
         )
-        with template_engine.connect() as conn:
-            with conn.begin() as trans:
-                template_manager.run_static_actions(conn)
-                trans.commit()
-        template_engine.dispose()
+        yield from engine_manager.manage_savepoint(engine)
+        return
 
     # Everything below is normal per-test context. We create a brand new database/engine/manager
     # distinct from what might have been used for the template database.
-    root_engine = cast(
-        Engine,
-        get_sqlalchemy_engine(pmr_config, pmr_config.root_database, autocommit=True),
-    )
-    with root_engine.connect() as root_conn:
-        with root_conn.begin() as trans:
-            database_name = _produce_clean_database(root_conn, createdb_template=template_database)
-            trans.commit()
-    root_engine.dispose()
+    with timer("create_database"):
+        if database_pool_size:
+            pool = get_database_pool(pmr_config, template_database, size=database_pool_size)
+            database_name = pool.get()
+        else:
+            with root_engine.connect() as root_conn:
+                with root_conn.begin() as trans:
+                    database_name = _produce_clean_database(
+                        root_conn, createdb_template=template_database
+                    )
+                    trans.commit()
 
     engine = get_sqlalchemy_engine(pmr_config, database_name, **engine_kwargs)
     yield from engine_manager.manage_sync(engine)
 
 
 async def _async_fixture(pmr_config, engine_manager_kwargs, engine_kwargs, *, fixture="postgres"):
+    timer = get_timer()
+
     root_engine = get_sqlalchemy_engine(
         pmr_config, pmr_config.root_database, async_=True, autocommit=True
     )
 
-    root_conn = await async_retry(root_engine.connect, retries=DEFAULT_RETRIES)
-    await root_conn.close()
-
-    async with root_engine.connect() as root_conn:
-        async with root_conn.begin() as trans:
-            (
-                template_database,
-                template_manager,
-                engine_manager,
-            ) = await root_conn.run_sync(
-                create_engine_manager, **engine_manager_kwargs, fixture=fixture
-            )
-            await trans.commit()
-
-    if template_manager:
-        assert template_database
+    with timer("connect"):
+        await async_retry(
+            pmr_config.async_check_fn, retries=DEFAULT_RETRIES, on_exc=ContainerCheckFailed
+        )
 
-        engine = get_sqlalchemy_engine(pmr_config, template_database, **engine_kwargs, async_=True)
-        async with engine.begin() as conn:
-            await conn.run_sync(template_manager.run_static_actions)
-            await conn.commit()
-        await engine.dispose()
+    with timer("template"):
+        async with root_engine.connect() as root_conn:
+            async with root_conn.begin() as trans:
+                (
+                    template_database,
+                    template_manager,
+                    engine_manager,
+                ) = await root_conn.run_sync(
+                    create_engine_manager, **engine_manager_kwargs, fixture=fixture
+                )
+                await trans.commit()
+
+        if template_manager:
+            assert template_database
+
+            build_database = _template_build_database(template_database)
+            engine = get_sqlalchemy_engine(pmr_config, build_database, **engine_kwargs, async_=True)
+            async with engine.begin() as conn:
+                await conn.run_sync(template_manager.run_static_actions)
+                await conn.commit()
+            await engine.dispose()
+
+            async with root_engine.connect() as root_conn:
+                await root_conn.run_sync(
+                    _publish_template_database, build_database, template_database
+                )
 
     # Everything below is normal per-test context. We create a brand new database/engine/manager
     # distinct from what might have been used for the template database.
-    async with root_engine.connect() as root_conn:
-        async with root_conn.begin() as trans:
-            database_name = await root_conn.run_sync(
-                _produce_clean_database, createdb_template=template_database
-            )
-            await trans.commit()
+    with timer("create_database"):
+        async with root_engine.connect() as root_conn:
+            async with root_conn.begin() as trans:
+                database_name = await root_conn.run_sync(
+                    _produce_clean_database, createdb_template=template_database
+                )
+                await trans.commit()
 
-    await root_engine.dispose()
+        await root_engine.dispose()
 
     engine = get_sqlalchemy_engine(pmr_config, database_name, **engine_kwargs, async_=True)
     async for engine, conn in engine_manager.manage_async(engine):
@@ -278,18 +341,26 @@ def create_engine_manager(
     template_database = createdb_template
     template_manager = None
     if fixture_id:
-        try:
-            template_database = _produce_clean_database(
+        template_database = get_template_database(
+            root_connection,
+            fixture_id,
+            static_actions,
+            tables=tables,
+            createdb_template=createdb_template,
+            fixture=fixture,
+        )
+
+        if not _database_exists(root_connection, template_database):
+            # The template is built under a process-specific name, and only renamed to
+            # `template_database` once complete. Concurrent test processes can therefore
+            # never observe (or clone) a partially populated template.
+            build_database = _template_build_database(template_database)
+            root_connection.execute(text(f'DROP DATABASE IF EXISTS "{build_database}"'))
+            _produce_clean_database(
                 root_connection,
                 createdb_template=createdb_template,
-                database_name=fixture_id,
-                ignore_failure=True,
+                database_name=build_database,
             )
-        except DatabaseExistsError:
-            # This implies it's been created during a prior test, and the template should already be
-            # populated.
-            pass
-        else:
             template_manager = EngineManager(
                 dynamic_actions,
                 static_actions=static_actions,
@@ -297,10 +368,6 @@ def create_engine_manager(
                 tables=tables,
             )
 
-        # The template to be used needs to be changed for the downstream database to the template
-        # we created earlier.
-        template_database = fixture_id
-
         # With template databases, static actions must be zeroed out so they're only executed once.
         # It only happens in this condition, so that when template databases are **not** used, we
         # execute them during the normal `manage_sync` flow per-test.
@@ -340,6 +407,181 @@ def _produce_clean_database(
     return database_name
 
 
+_template_databases: Dict[str, str] = {}
+
+
+def get_template_database(
+    root_connection: Connection,
+    fixture_id: str,
+    static_actions,
+    *,
+    tables,
+    createdb_template: str,
+    fixture: str,
+) -> str:
+    """Get the name of the template database for the fixture identified by `fixture_id`.
+
+    Where possible, templates are named after a digest of the static actions used to
+    populate them. A long-lived container (e.g. started through the `pmr` CLI) can then
+    reuse a template across test runs, so long as the schema has not changed.
+
+    Templates which cannot be content-addressed (custom static actions, or a custom
+    `createdb_template` whose own content is unknown) are named after `fixture_id`.
+    """
+    template_database = _template_databases.get(fixture_id)
+    if template_database:
+        return template_database
+
+    digest = None
+    if createdb_template in ("template0", "template1"):
+        digest = fingerprint_actions(
+            static_actions, dialect_name=root_connection.dialect.name, tables=tables
+        )
+
+    if digest:
+        key = ":".join([fixture, createdb_template, digest])
+        template_database = "_".join(
+            ["pmr_template", "pg", hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]]
+        )
+    else:
+        template_database = fixture_id
+
+    _template_databases[fixture_id] = template_database
+    return template_database
+
+
+def _template_build_database(template_database: str) -> str:
+    return f"{template_database}_{os.getpid()}"
+
+
+def _database_exists(root_conn: Connection, database_name: str) -> bool:
+    result = root_conn.execute(
+        text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": database_name}
+    )
+    return result.scalar() is not None
+
+
+def _publish_template_database(root_conn: Connection, build_database: str, template_database: str):
+    """Atomically rename the fully populated `build_database` into place."""
+    try:
+        root_conn.execute(
+            text(f'ALTER DATABASE "{build_database}" RENAME TO "{template_database}"')
+        )
+    except (sqlalchemy.exc.IntegrityError, sqlalchemy.exc.ProgrammingError):
+        # Another process published the same template first.
+        root_conn.execute(text(f'DROP DATABASE IF EXISTS "{build_database}"'))
+
+
+_root_engines: Dict[Tuple[PostgresConfig, Optional[str]], Engine] = {}
+_database_pools: Dict[Tuple[PostgresConfig, str], ResourcePool[str]] = {}
+_shared_engines: Dict[Tuple[PostgresConfig, str], Engine] = {}
+
+
+def get_root_engine(pmr_config: PostgresConfig) -> Engine:
+    """Get the (autocommit) engine used to execute administrative statements.
+
+    A single engine is shared by all fixtures using the same config, so that its pooled
+    connections are reused across tests, rather than reconnecting to the root database
+    multiple times per test.
+    """
+    key = (pmr_config, pmr_config.drivername)
+    engine = _root_engines.get(key)
+    if engine is None:
+        engine = _root_engines[key] = cast(
+            Engine,
+            get_sqlalchemy_engine(pmr_config, pmr_config.root_database, autocommit=True),
+        )
+    return engine
+
+
+def get_database_pool(pmr_config: PostgresConfig, template_database: str, *, size: int):
+    """Get (or start) the pool of clean databases cloned from `template_database`.
+
+    Pools live until the container they produce databases on is torn down, at which point
+    any databases which were never handed out are dropped.
+    """
+    key = (pmr_config, template_database)
+    pool = _database_pools.get(key)
+    if pool is not None:
+        return pool
+
+    root_engine = get_root_engine(pmr_config)
+
+    def produce():
+        with root_engine.connect() as root_conn:
+            with root_conn.begin() as trans:
+                database_name = _produce_clean_database(
+                    root_conn, createdb_template=template_database
+                )
+                trans.commit()
+        return database_name
+
+    def discard(database_name):
+        with root_engine.connect() as root_conn:
+            root_conn.execute(text(f'DROP DATABASE IF EXISTS "{database_name}"'))
+
+    pool = _database_pools[key] = ResourcePool(produce, size=size, discard=discard)
+    return pool
+
+
+def get_shared_engine(
+    pmr_config: PostgresConfig, template_database: str, shared_database_id: str, *, engine_kwargs
+) -> Engine:
+    """Get the engine for the single database shared by all tests of a savepoint-isolated fixture."""
+    key = (pmr_config, shared_database_id)
+    engine = _shared_engines.get(key)
+    if engine is None:
+        with get_root_engine(pmr_config).connect() as root_conn:
+            # The transaction is committed as the block exits.
+            with root_conn.begin():
+                database_name = _produce_clean_database(
+                    root_conn, createdb_template=template_database
+                )
+
+        engine = _shared_engines[key] = cast(
+            Engine, get_sqlalchemy_engine(pmr_config, database_name, **engine_kwargs)
+        )
+    return engine
+
+
+def validate_isolation(isolation, *, async_=False) -> Optional[str]:
+    """Validate the `isolation` fixture argument.
+
+    Returns a unique id for the fixture's shared database, when one is required.
+    """
+    if isolation == "database":
+        return None
+
+    if isolation != "savepoint":
+        raise ValueError(
+            f"Unsupported isolation '{isolation}', expected one of: 'database', 'savepoint'."
+        )
+
+    if async_:
+        raise ValueError("`isolation='savepoint'` is not supported by async fixtures.")
+
+    return uuid.uuid4().hex
+
+
+def close_session_resources(pmr_config: PostgresConfig):
+    """Release the state held on behalf of the given config's container.
+
+    This is called as the container fixture is torn down, because the container itself
+    (and therefore all connections/databases on it) may be going away with it.
+    """
+    for pool_key in [key for key in _database_pools if key[0] is pmr_config]:
+        pool = _database_pools.pop(pool_key)
+        pool.close()
+
+    for shared_key in [key for key in _shared_engines if key[0] is pmr_config]:
+        engine = _shared_engines.pop(shared_key)
+        engine.dispose()
+
+    for root_key in [key for key in _root_engines if key[0] is pmr_config]:
+        engine = _root_engines.pop(root_key)
+        engine.dispose()
+
+
 def _generate_database_name(conn):
     try:
         conn.execute(text("CREATE TABLE IF NOT EXISTS pytest_mock_resource_db (id serial);"))
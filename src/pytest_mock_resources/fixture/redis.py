@@ -1,3 +1,7 @@
+import json
+import os
+from typing import Any, Dict, Optional
+
 import pytest
 
 from pytest_mock_resources.compat import redis
@@ -20,10 +24,168 @@ def pmr_redis_config():
 
 @pytest.fixture(scope="session")
 def pmr_redis_container(pytestconfig, pmr_redis_config):
-    yield from get_container(pytestconfig, pmr_redis_config)
+    try:
+        yield from get_container(pytestconfig, pmr_redis_config)
+    finally:
+        try:
+            wait_for_namespace_cleanup()
+        finally:
+            release_database_number(pytestconfig, pmr_redis_config)
+
+
+_database_numbers: Dict[RedisConfig, int] = {}
+_command_tables: Dict[RedisConfig, Any] = {}
+_namespace_cleanup: Optional[Any] = None
+
+
+def get_database_count(config: RedisConfig) -> int:
+    """Get the number of databases the server was actually started with.
+
+    An already running server (for example one started outside of PMR) may have been started
+    with a different number of databases than the config describes.
+    """
+    client = redis.Redis(host=config.host, port=config.port)
+    try:
+        databases = client.config_get("databases").get("databases")
+    except redis.RedisError:
+        databases = None
+    finally:
+        client.close()
+
+    try:
+        return int(databases) if databases is not None else int(config.databases)
+    except ValueError:
+        return int(config.databases)
+
+
+def get_database_number(pytestconfig, config: RedisConfig) -> int:
+    """Lease a database number for the current process, for the rest of the session.
+
+    Without pytest-xdist, database 0 is always used. Otherwise, leases are recorded in a file
+    shared by all workers, behind a file lock. Each worker prefers the database matching its
+    worker number, but takes the lowest free database when that one is taken (for example
+    by a worker which is being replaced after a crash).
+    """
+    if config in _database_numbers:
+        return _database_numbers[config]
+
+    if not hasattr(pytestconfig, "workerinput"):
+        return 0
+
+    from filelock import FileLock
+
+    worker_id = pytestconfig.workerinput["workerid"]  # For example "gw0".
+    preferred = int(worker_id[2:])
+    database_count = get_database_count(config)
+
+    path = _get_lease_path(pytestconfig, config)
+    with FileLock(str(path) + ".lock"):
+        leases = _load_leases(path)
+
+        database_number = _choose_database_number(leases, preferred, database_count)
+        if database_number is None:
+            raise ValueError(
+                f"All {database_count} redis databases are leased by other workers. "
+                "Run fewer workers, or increase `RedisConfig.databases`."
+            )
+
+        leases[str(database_number)] = os.getpid()
+        path.write_text(json.dumps(leases))
+
+    _database_numbers[config] = database_number
+    return database_number
+
+
+def release_database_number(pytestconfig, config: RedisConfig):
+    database_number = _database_numbers.pop(config, None)
+    if database_number is None:
+        return
+
+    from filelock import FileLock
+
+    path = _get_lease_path(pytestconfig, config)
+    with FileLock(str(path) + ".lock"):
+        leases = _load_leases(path)
+        if leases.pop(str(database_number), None) is not None:
+            path.write_text(json.dumps(leases))
+
+
+def _get_lease_path(pytestconfig, config: RedisConfig):
+    # The temp directory shared by all workers.
+    root_tmp_dir = pytestconfig._tmp_path_factory.getbasetemp().parent
+    return root_tmp_dir / f"pmr_redis_{config.port}_databases.json"
 
 
-def create_redis_fixture(scope="function", decode_responses: bool = False):
+def _load_leases(path) -> Dict[str, int]:
+    """Load the current leases, dropping any held by processes which no longer exist."""
+    if not path.is_file():
+        return {}
+
+    leases = json.loads(path.read_text())
+    return {database: pid for database, pid in leases.items() if _is_running(pid)}
+
+
+def _choose_database_number(
+    leases: Dict[str, int], preferred: int, database_count: int
+) -> Optional[int]:
+    """Choose the database to lease.
+
+    Examples:
+        >>> _choose_database_number({}, 3, 16)
+        3
+        >>> _choose_database_number({"0": 1, "3": 2}, 3, 16)
+        1
+        >>> _choose_database_number({}, 20, 16)
+        0
+        >>> _choose_database_number({"0": 1}, 1, 1) is None
+        True
+    """
+    if preferred < database_count and str(preferred) not in leases:
+        return preferred
+
+    for database_number in range(database_count):
+        if str(database_number) not in leases:
+            return database_number
+    return None
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def get_command_table(config: RedisConfig):
+    from pytest_mock_resources.fixture.redis_namespace import CommandTable
+
+    command_table = _command_tables.get(config)
+    if command_table is None:
+        client = redis.Redis(host=config.host, port=config.port)
+        command_table = _command_tables[config] = CommandTable(client)
+    return command_table
+
+
+def cleanup_namespace(client):
+    """Delete the namespace of the given client in the background."""
+    global _namespace_cleanup
+
+    from pytest_mock_resources.fixture.redis_namespace import NamespaceCleanup
+
+    if _namespace_cleanup is None:
+        _namespace_cleanup = NamespaceCleanup()
+    _namespace_cleanup.submit(client)
+
+
+def wait_for_namespace_cleanup():
+    if _namespace_cleanup is not None:
+        _namespace_cleanup.wait()
+
+
+def create_redis_fixture(scope="function", decode_responses: bool = False, namespace: bool = False):
     """Produce a Redis fixture.
 
     Any number of fixture functions can be created. Under the hood they will all share the same
@@ -31,9 +193,11 @@ def create_redis_fixture(scope="function", decode_responses: bool = False):
 
     .. note::
 
-       If running tests in parallel, the implementation fans out to different redis "database"s,
-       up to a 16 (which is the default container fixed limit). This means you can only run
-       up to 16 simultaneous tests.
+       If running tests in parallel, the implementation fans out to different redis "database"s.
+       Each worker leases its own database for the session, so the number of simultaneous
+       workers is bounded by the number of databases the server was started with. Containers
+       started by PMR are given at least as many databases as there are workers (see
+       :class:`RedisConfig`'s `databases`).
 
        Additionally, any calls to `flushall` or any other cross-database calls **will** still
        represent cross-test state.
@@ -45,6 +209,12 @@ def create_redis_fixture(scope="function", decode_responses: bool = False):
     Args:
         scope (str): The scope of the fixture can be specified by the user, defaults to "function".
         decode_responses (bool): Whether to decode the responses from redis.
+        namespace (bool): Whether to confine the client's keys to a key prefix unique to
+            the fixture instance, rather than flushing the database. The prefix is applied
+            (and removed from `KEYS`/`SCAN` results) transparently, and the namespace's keys
+            are deleted in the background after the test. Commands which do not address
+            keys (e.g. `FLUSHALL`, `DBSIZE`) still observe the whole database, as do clients
+            created from the fixture's `pmr_credentials`.
 
     Raises:
         KeyError: If any additional arguments are provided to the function than what is necessary.
@@ -52,24 +222,22 @@ def create_redis_fixture(scope="function", decode_responses: bool = False):
 
     @pytest.fixture(scope=scope)
     def _(request, pmr_redis_container, pmr_redis_config):
-        database_number = 0
-        if hasattr(request.config, "workerinput"):
-            worker_input = request.config.workerinput
-            worker_id = worker_input["workerid"]  # For example "gw0".
-            database_number = int(worker_id[2:])
+        database_number = get_database_number(request.config, pmr_redis_config)
+        client_kwargs = {
+            "host": pmr_redis_config.host,
+            "port": pmr_redis_config.port,
+            "db": database_number,
+            "decode_responses": decode_responses or pmr_redis_config.decode_responses,
+        }
 
-        if database_number >= 16:
-            raise ValueError(
-                "The redis fixture currently only supports up to 16 parallel executions"
-            )
+        if namespace:
+            from pytest_mock_resources.fixture.redis_namespace import Namespace, NamespacedRedis
 
-        db = redis.Redis(
-            host=pmr_redis_config.host,
-            port=pmr_redis_config.port,
-            db=database_number,
-            decode_responses=decode_responses or pmr_redis_config.decode_responses,
-        )
-        db.flushdb()
+            command_table = get_command_table(pmr_redis_config)
+            db = NamespacedRedis(namespace=Namespace.create(command_table), **client_kwargs)
+        else:
+            db = redis.Redis(**client_kwargs)
+            db.flushdb()
 
         Credentials.assign_from_credentials(
             db,
@@ -80,6 +248,11 @@ def create_redis_fixture(scope="function", decode_responses: bool = False):
             username=None,
             password=None,
         )
-        return db
+
+        try:
+            yield db
+        finally:
+            if namespace:
+                cleanup_namespace(db)
 
     return _
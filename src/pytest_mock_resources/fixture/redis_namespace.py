@@ -0,0 +1,263 @@
+"""Clients which transparently confine all of their keys to a namespace.
+
+A namespace is a key prefix, unique to a single fixture instance. Rather than flushing the
+whole database between tests, only the keys under a test's namespace are deleted.
+
+Key positions are determined from the server's own `COMMAND` table, so that the prefix is
+applied to keys (and only keys) for any command the server supports.
+"""
+from __future__ import annotations
+
+import itertools
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterable
+
+# Classes below subclass those of `redis` as this module is imported, so (unlike the fixture
+# modules) it must only be imported once redis is in use.
+from pytest_mock_resources.compat import redis
+
+SCRIPT_COMMANDS = {"eval", "evalsha", "eval_ro", "evalsha_ro", "fcall", "fcall_ro"}
+
+# Commands whose responses include (namespaced) key names, mapped to a function which
+# strips the namespace from the response.
+KEY_RESPONSES = {
+    "keys": lambda strip, response: [strip(key) for key in response],
+    "scan": lambda strip, response: (response[0], [strip(key) for key in response[1]]),
+    "blpop": lambda strip, response: response and (strip(response[0]), *response[1:]),
+    "brpop": lambda strip, response: response and (strip(response[0]), *response[1:]),
+    "bzpopmin": lambda strip, response: response and (strip(response[0]), *response[1:]),
+    "bzpopmax": lambda strip, response: response and (strip(response[0]), *response[1:]),
+}
+
+DELETE_BATCH_SIZE = 1000
+
+
+class CommandTable:
+    """The key positions of the commands supported by a given server."""
+
+    def __init__(self, client: redis.Redis):
+        self.client = client
+        self.commands = client.command()
+
+    def key_positions(self, args: list) -> Iterable[int]:
+        """Produce the indices of `args` (a full command, including its name) which are keys.
+
+        Examples:
+            >>> table = CommandTable.__new__(CommandTable)
+            >>> table.commands = {
+            ...     "get": {"first_key_pos": 1, "last_key_pos": 1, "step_count": 1, "flags": []},
+            ...     "mset": {"first_key_pos": 1, "last_key_pos": -1, "step_count": 2, "flags": []},
+            ...     "ping": {"first_key_pos": 0, "last_key_pos": 0, "step_count": 0, "flags": []},
+            ... }
+            >>> list(table.key_positions(["GET", "foo"]))
+            [1]
+            >>> list(table.key_positions(["MSET", "a", 1, "b", 2]))
+            [1, 3]
+            >>> list(table.key_positions(["EVAL", "return 1", "2", "a", "b", "arg"]))
+            [3, 4]
+            >>> list(table.key_positions(["PING"]))
+            []
+        """
+        name = str(args[0]).lower()
+        if name in SCRIPT_COMMANDS:
+            return range(3, 3 + int(args[2]))
+
+        info = self.commands.get(name)
+        if info is None or "movablekeys" in info["flags"]:
+            return self._find_key_positions(args)
+
+        first = info["first_key_pos"]
+        if first == 0:
+            # Container commands (e.g. `OBJECT ENCODING`) describe their keys per subcommand.
+            if info.get("subcommands") and len(args) > 1:
+                return self._find_key_positions(args)
+            return []
+
+        last = info["last_key_pos"]
+        if last < 0:
+            last = len(args) + last
+        return range(first, last + 1, info["step_count"])
+
+    def _find_key_positions(self, args: list) -> list[int]:
+        """Ask the server which arguments are keys, and locate them among `args`."""
+        try:
+            keys = self.client.command_getkeys(*args)
+        except redis.ResponseError:
+            # The command has no keys.
+            return []
+
+        encoder = self.client.get_encoder()
+        encoded_args = [encoder.encode(arg) for arg in args]
+
+        positions = []
+        for key in keys:
+            encoded_key = encoder.encode(key)
+            position = next(
+                (
+                    index
+                    for index, arg in enumerate(encoded_args)
+                    if index and index not in positions and arg == encoded_key
+                ),
+                None,
+            )
+            if position is not None:
+                positions.append(position)
+        return sorted(positions)
+
+
+class Namespace:
+    def __init__(self, commands: CommandTable, prefix: str):
+        self.commands = commands
+        self.prefix = prefix
+        self.encoded_prefix = prefix.encode()
+
+    @classmethod
+    def create(cls, commands: CommandTable):
+        return cls(commands, f"pmr:{uuid.uuid4().hex}:")
+
+    def add(self, key):
+        if isinstance(key, (bytes, memoryview)):
+            return self.encoded_prefix + bytes(key)
+        return f"{self.prefix}{key}"
+
+    def strip(self, key):
+        if isinstance(key, bytes):
+            prefix: Any = self.encoded_prefix
+        else:
+            prefix = self.prefix
+
+        if key is not None and key.startswith(prefix):
+            return key[len(prefix) :]
+        return key
+
+    def apply(self, args: tuple) -> tuple:
+        """Prefix the keys (and key patterns) among a command's `args`.
+
+        Multi-word command names (e.g. `"OBJECT ENCODING"`) are left intact, because
+        redis-py selects response callbacks by the name as it was given.
+        """
+        words = str(args[0]).split()
+        full_args = [*words, *args[1:]]
+        name = words[0].lower()
+
+        if name == "keys":
+            full_args[1] = self.add(full_args[1])
+        elif name == "scan":
+            full_args = self._apply_scan(full_args)
+        else:
+            for position in self.commands.key_positions(full_args):
+                full_args[position] = self.add(full_args[position])
+
+        return (args[0], *full_args[len(words) :])
+
+    def _apply_scan(self, args: list) -> list:
+        for index, arg in enumerate(args):
+            if str(arg).lower() == "match":
+                args[index + 1] = self.add(args[index + 1])
+                return args
+        return [*args, "MATCH", f"{self.prefix}*"]
+
+    def strip_response(self, command_name, response):
+        name = str(command_name).split()[0].lower()
+        strip_keys = KEY_RESPONSES.get(name)
+        if strip_keys is None or isinstance(response, Exception):
+            return response
+        return strip_keys(self.strip, response)
+
+
+class NamespacedRedis(redis.Redis):
+    """A `redis.Redis` client whose keys are all confined to a `Namespace`.
+
+    Commands which do not address keys (`FLUSHALL`, `DBSIZE`, `RANDOMKEY`, etc) are passed
+    through unchanged and still observe the whole database. `flushdb` deletes only the
+    keys in the namespace.
+    """
+
+    namespace: Namespace
+
+    def __init__(self, *args, namespace: Namespace, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.namespace = namespace
+
+    def execute_command(self, *args, **options):
+        args = self.namespace.apply(args)
+        response = super().execute_command(*args, **options)
+        return self.namespace.strip_response(args[0], response)
+
+    def pipeline(self, transaction=True, shard_hint=None):
+        pipeline = NamespacedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+        pipeline.namespace = self.namespace
+        return pipeline
+
+    def flushdb(self, asynchronous=False, **kwargs):
+        delete_namespace(self.connection_pool, self.namespace.prefix)
+        return True
+
+
+class NamespacedPipeline(redis.client.Pipeline):
+    namespace: Namespace
+
+    def execute_command(self, *args, **options):
+        args = self.namespace.apply(args)
+        response = super().execute_command(*args, **options)
+        if response is self:
+            # The command was queued, rather than executed immediately (i.e. after `WATCH`).
+            return response
+        return self.namespace.strip_response(args[0], response)
+
+    def execute(self, raise_on_error=True):
+        command_names = [args[0] for args, _ in self.command_stack]
+        responses = super().execute(raise_on_error=raise_on_error)
+        return [
+            self.namespace.strip_response(command_name, response)
+            for command_name, response in zip(command_names, responses)
+        ]
+
+
+def delete_namespace(connection_pool: redis.ConnectionPool, prefix: str):
+    """Incrementally delete the keys under `prefix`, without blocking the server."""
+    client = redis.Redis(connection_pool=connection_pool)
+    keys = client.scan_iter(match=f"{prefix}*", count=DELETE_BATCH_SIZE)
+    while True:
+        batch = list(itertools.islice(keys, DELETE_BATCH_SIZE))
+        if not batch:
+            break
+        client.unlink(*batch)
+
+
+class NamespaceCleanup:
+    """Delete namespaces in the background, so teardown does not wait on the server."""
+
+    def __init__(self):
+        self.executor: ThreadPoolExecutor | None = None
+        self.futures: list[Future] = []
+
+    def submit(self, client: NamespacedRedis):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="pmr-redis-cleanup"
+            )
+
+        def cleanup():
+            try:
+                delete_namespace(client.connection_pool, client.namespace.prefix)
+            finally:
+                client.close()
+
+        self.futures = [future for future in self.futures if not future.done()]
+        self.futures.append(self.executor.submit(cleanup))
+
+    def wait(self):
+        """Wait for all pending deletions, raising the first error encountered."""
+        if self.executor is None:
+            return
+
+        futures, self.futures = self.futures, []
+        self.executor.shutdown(wait=True)
+        self.executor = None
+
+        for future in futures:
+            future.result()
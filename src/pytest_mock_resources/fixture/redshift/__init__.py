@@ -2,8 +2,13 @@ import pytest
 
 from pytest_mock_resources.container.base import get_container
 from pytest_mock_resources.container.redshift import RedshiftConfig
-from pytest_mock_resources.fixture.base import asyncio_fixture, generate_fixture_id
-from pytest_mock_resources.fixture.postgresql import _async_fixture, _sync_fixture
+from pytest_mock_resources.fixture.base import asyncio_fixture, generate_fixture_id, Isolation
+from pytest_mock_resources.fixture.postgresql import (
+    _async_fixture,
+    _sync_fixture,
+    close_session_resources,
+    validate_isolation,
+)
 from pytest_mock_resources.patch.redshift import psycopg2, sqlalchemy
 
 
@@ -23,7 +28,10 @@ def pmr_redshift_config():
 
 @pytest.fixture(scope="session")
 def pmr_redshift_container(pytestconfig, pmr_redshift_config):
-    yield from get_container(pytestconfig, pmr_redshift_config)
+    try:
+        yield from get_container(pytestconfig, pmr_redshift_config)
+    finally:
+        close_session_resources(pmr_redshift_config)
 
 
 def create_redshift_fixture(
@@ -36,6 +44,8 @@ def create_redshift_fixture(
     engine_kwargs=None,
     template_database=True,
     actions_share_transaction=None,
+    database_pool_size=0,
+    isolation: Isolation = "database",
 ):
     """Produce a Redshift fixture.
 
@@ -67,9 +77,19 @@ def create_redshift_fixture(
             fixtures for backwards compatibility; and disabled by default for
             asynchronous fixtures (the way v2-style/async features work in SQLAlchemy can lead
             to bad default behavior).
+        database_pool_size: Defaults to 0 (disabled). When greater than 0, that many per-test
+            databases are created ahead of time in a background thread, so that tests are handed
+            an already-created database rather than waiting on a `CREATE DATABASE`. Only applies
+            to synchronous fixtures.
+        isolation: How tests are isolated from one another. Defaults to "database", where each
+            test receives a brand new database. With "savepoint", all tests share a single
+            database, and each test receives a connection (or session) inside a transaction
+            which is rolled back at teardown. Only supported by synchronous fixtures.
     """
     from pytest_mock_resources.fixture.redshift.udf import REDSHIFT_UDFS
 
+    shared_database_id = validate_isolation(isolation, async_=async_)
+
     fixture_id = generate_fixture_id(enabled=template_database, name="pg")
 
     ordered_actions = (*ordered_actions, REDSHIFT_UDFS)
@@ -91,6 +111,8 @@ def create_redshift_fixture(
             engine_manager_kwargs,
             engine_kwargs_,
             fixture="redshift",
+            database_pool_size=database_pool_size,
+            shared_database_id=shared_database_id,
         ):
             sqlalchemy.register_redshift_behavior(engine)
             with psycopg2.patch_connect(pmr_redshift_config, engine.url.database):
@@ -14,10 +14,11 @@ stand in for postgresql.
 import contextlib
 import datetime
 import json
+import sqlite3
 import warnings
 
 import pytest
-from sqlalchemy import create_engine, dialects, event
+from sqlalchemy import create_engine, dialects, event, MetaData
 from sqlalchemy.dialects.postgresql import JSON, JSONB
 from sqlalchemy.dialects.sqlite import base as sqlite_base
 from sqlalchemy.dialects.sqlite.pysqlite import SQLiteDialect_pysqlite
@@ -25,7 +26,11 @@ from sqlalchemy.exc import SAWarning
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import sqltypes
 
-from pytest_mock_resources.sqlalchemy import EngineManager
+from pytest_mock_resources.sqlalchemy import (
+    bifurcate_actions,
+    EngineManager,
+    normalize_actions,
+)
 
 
 class PMRSQLiteDDLCompiler(sqlite_base.SQLiteDDLCompiler):
@@ -194,6 +199,71 @@ def filter_sqlalchemy_warnings(decimal_warnings_enabled=True):
         yield
 
 
+def create_sqlite_engine(driver_name, template=None, **engine_kwargs):
+    # XXX: Ideally we eventually make use of the shared memory cache to enable connecting by
+    #      credentials with sqlite.
+    # database_name = "file:{}?mode=memory&cache=shared".format(next(_database_names))
+    database_name = ""
+
+    engine = create_engine(f"{driver_name}:///{database_name}", **engine_kwargs)
+
+    if template is not None:
+
+        def copy_template(dbapi_connection, connection_record):
+            template.copy_to(dbapi_connection)
+
+        event.listen(engine, "connect", copy_template)
+
+    # This *must* happen before the connection occurs (implicitly in `EngineManager`).
+    event.listen(engine, "connect", enable_foreign_key_checks)
+
+    # https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#pysqlite-serializable
+    event.listen(engine, "connect", do_connect)
+    event.listen(engine, "begin", do_begin)
+    return engine
+
+
+class SQLiteTemplate:
+    """An in-memory database, populated once, and copied into each new connection.
+
+    The main database is copied through the sqlite3 backup API. Attached (schema)
+    databases can only be copied through `Connection.deserialize` (python 3.11+).
+    """
+
+    def __init__(self, driver_name, static_actions, *, tables=None):
+        self.connection = sqlite3.connect(":memory:", check_same_thread=False)
+
+        # The engine is intentionally never disposed, which would close `connection`.
+        self.engine = create_sqlite_engine(driver_name, creator=lambda: self.connection)
+        with self.engine.begin() as conn:
+            EngineManager(static_actions=static_actions, tables=tables).run_static_actions(conn)
+
+        schemas = [
+            name
+            for _, name, _ in self.connection.execute("PRAGMA database_list").fetchall()
+            if name not in ("main", "temp")
+        ]
+
+        self.supported = not schemas or hasattr(self.connection, "serialize")
+        self.schemas = {}
+        if self.supported:
+            for schema in schemas:
+                # Empty databases (i.e. where `tables` excluded all of the schema's tables)
+                # cannot be serialized, but only need to be attached.
+                (page_count,) = self.connection.execute(f'PRAGMA "{schema}".page_count').fetchone()
+                self.schemas[schema] = (
+                    self.connection.serialize(name=schema) if page_count else None
+                )
+
+    def copy_to(self, dbapi_connection):
+        self.connection.backup(dbapi_connection)
+
+        for schema, data in self.schemas.items():
+            dbapi_connection.execute(f"ATTACH DATABASE ':memory:' AS \"{schema}\"")
+            if data is not None:
+                dbapi_connection.deserialize(data, name=schema)
+
+
 def _database_producer():
     i = 1
     while True:
@@ -211,6 +281,7 @@ def create_sqlite_fixture(
     session=None,
     decimal_warnings=False,
     postgres_like=True,
+    template_database=True,
 ):
     """Produce a SQLite fixture.
 
@@ -228,6 +299,9 @@ def create_sqlite_fixture(
             default `False` suppresses these warnings.
         postgres_like: Whether to add extra SQLite features which attempt to mimic postgres
             enough to stand in for it for testing.
+        template_database: Defaults to True. When True, amortizes the cost of performing database
+            setup through `ordered_actions`, by performing them once into an in-memory "template"
+            database, then copying that template into each per-test database.
     """
     dialect_name = "sqlite"
 
@@ -239,28 +313,36 @@ def create_sqlite_fixture(
 
     driver_name = f"sqlite+{dialect_name}"
 
-    @pytest.fixture(scope=scope)
-    def _():
-        # XXX: Ideally we eventually make use of the shared memory cache to enable connecting by
-        #      credentials with sqlite.
-        # database_name = "file:{}?mode=memory&cache=shared".format(next(_database_names))
-        database_name = ""
+    template = None
+
+    def get_engine_manager():
+        nonlocal template
 
-        raw_engine = create_engine(f"{driver_name}:///{database_name}")
+        if template_database:
+            normalized_actions = normalize_actions(ordered_actions, fixture="sqlite")
+            static_actions, dynamic_actions = bifurcate_actions(normalized_actions)
 
-        # This *must* happen before the connection occurs (implicitly in `EngineManager`).
-        event.listen(raw_engine, "connect", enable_foreign_key_checks)
+            if template is None:
+                template = SQLiteTemplate(driver_name, static_actions, tables=tables)
 
-        # https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#pysqlite-serializable
-        event.listen(raw_engine, "connect", do_connect)
-        event.listen(raw_engine, "begin", do_begin)
+            # Attaching schemas in dynamic actions would conflict with those copied from the
+            # template.
+            if template.supported and not (
+                template.schemas and any(isinstance(a, MetaData) for a in dynamic_actions)
+            ):
+                engine_manager = EngineManager(dynamic_actions, tables=tables, session=session)
+                return engine_manager, template
 
         engine_manager = EngineManager.create(
-            fixture="sqlite",
-            dynamic_actions=ordered_actions,
-            tables=tables,
-            session=session,
+            fixture="sqlite", dynamic_actions=ordered_actions, tables=tables, session=session
         )
+        return engine_manager, None
+
+    @pytest.fixture(scope=scope)
+    def _():
+        engine_manager, sqlite_template = get_engine_manager()
+        raw_engine = create_sqlite_engine(driver_name, template=sqlite_template)
+
         for _, conn in engine_manager.manage_sync(raw_engine):
             with filter_sqlalchemy_warnings(decimal_warnings_enabled=(not decimal_warnings)):
                 yield conn
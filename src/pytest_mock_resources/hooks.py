@@ -1,6 +1,8 @@
 import os
 import warnings
 
+import pytest
+
 _resource_kinds = ["postgres", "redshift", "mongo", "redis", "mysql", "moto"]
 
 
@@ -23,6 +25,24 @@ def pytest_addoption(parser):
         type="string",
         default=None,
     )
+    parser.addini(
+        "pmr_timings",
+        "Report the time spent in each phase of fixture setup/teardown",
+        type="bool",
+        default=False,
+    )
+    parser.addini(
+        "pmr_timings_json",
+        "Optional path to which fixture setup/teardown timings are written, as JSON",
+        type="string",
+        default=None,
+    )
+    parser.addini(
+        "pmr_parallel_startup",
+        "Start the containers required by the collected tests concurrently, at session start",
+        type="bool",
+        default=False,
+    )
 
     group = parser.getgroup("collect")
     group.addoption(
@@ -45,6 +65,26 @@ def pytest_addoption(parser):
         help="Optional docker client name to use: docker, podman, nerdctl",
         dest="pmr_docker_client",
     )
+    group.addoption(
+        "--pmr-timings",
+        action="store_true",
+        default=False,
+        help="Report the time spent in each phase of fixture setup/teardown",
+        dest="pmr_timings",
+    )
+    group.addoption(
+        "--pmr-timings-json",
+        default=None,
+        help="Optional path to which fixture setup/teardown timings are written, as JSON",
+        dest="pmr_timings_json",
+    )
+    group.addoption(
+        "--pmr-parallel-startup",
+        action="store_true",
+        default=False,
+        help="Start the containers required by the collected tests concurrently, at session start",
+        dest="pmr_parallel_startup",
+    )
 
 
 def get_pytest_flag(config, name, *, default=None):
@@ -59,6 +99,25 @@ def use_multiprocess_safe_mode(config):
     return bool(get_pytest_flag(config, "pmr_multiprocess_safe"))
 
 
+def use_timings(config):
+    return bool(
+        get_pytest_flag(config, "pmr_timings") or get_pytest_flag(config, "pmr_timings_json")
+    )
+
+
+def use_parallel_startup(config):
+    return bool(get_pytest_flag(config, "pmr_parallel_startup"))
+
+
+def get_resource_kinds(items):
+    """Produce the resource kinds (in `_resource_kinds` order) used by any of the `items`."""
+    kinds = set()
+    for item in items:
+        for marker in item.iter_markers():
+            kinds.add(marker.name)
+    return [kind for kind in _resource_kinds if kind in kinds]
+
+
 def get_docker_client_name(config) -> str:
     pmr_docker_client = os.getenv("PMR_DOCKER_CLIENT")
     if pmr_docker_client:
@@ -96,6 +155,62 @@ def pytest_configure(config):
         )
 
     config._pmr_containers = []
+    config._pmr_pending_containers = {}
+
+    config._pmr_timings = None
+    if use_timings(config):
+        from pytest_mock_resources.timing import enable
+
+        config._pmr_timings = enable()
+
+
+def pytest_unconfigure(config):
+    if getattr(config, "_pmr_timings", None) is not None:
+        from pytest_mock_resources.timing import disable
+
+        disable()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """Attribute any timings recorded during a fixture's setup to that fixture."""
+    recorder = getattr(request.config, "_pmr_timings", None)
+    if recorder is None:
+        yield
+        return
+
+    with recorder.fixture(fixturedef.argname):
+        yield
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect the timings recorded by pytest-xdist workers."""
+    recorder = getattr(node.config, "_pmr_timings", None)
+    workeroutput = getattr(node, "workeroutput", None)
+    if recorder is not None and workeroutput:
+        recorder.extend(workeroutput.get("pmr_timings", []))
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    recorder = getattr(config, "_pmr_timings", None)
+    if recorder is None:
+        return
+
+    rows = recorder.summarize()
+    if get_pytest_flag(config, "pmr_timings"):
+        terminalreporter.write_sep("=", "pmr fixture timings")
+        terminalreporter.write_line(
+            f"{'total (s)':>10} {'max (s)':>9} {'count':>6}  fixture: phase"
+        )
+        for fixture, phase, count, total, max_ in rows[:20]:
+            terminalreporter.write_line(
+                f"{total:>10.3f} {max_:>9.3f} {count:>6}  {fixture}: {phase}"
+            )
+
+    timings_json = get_pytest_flag(config, "pmr_timings_json")
+    if timings_json:
+        recorder.write_json(timings_json)
 
 
 def pytest_itemcollected(item):
@@ -113,6 +228,11 @@ def pytest_itemcollected(item):
 def pytest_sessionfinish(session, exitstatus):
     config = session.config
 
+    # Hand timings recorded by pytest-xdist workers back to the controller process.
+    workeroutput = getattr(config, "workeroutput", None)
+    if workeroutput is not None and getattr(config, "_pmr_timings", None) is not None:
+        workeroutput["pmr_timings"] = config._pmr_timings.dump()
+
     if not use_multiprocess_safe_mode(config):
         return
 
@@ -1,11 +1,34 @@
-import binascii
+import collections
+import contextlib
 import csv
+import functools
 import gzip
 import io
+import itertools
+import json
+import shutil
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
-from pytest_mock_resources.compat import boto3
+from pytest_mock_resources.compat import boto3, pyarrow
+
+# The magic number which identifies gzip compressed files.
+GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+
+# The size of the chunks in which objects are streamed into the database.
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Objects which must be read with random access (i.e. parquet) are held in memory up to this
+# size, after which they are written to disk.
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+# The number of objects fetched ahead of the one currently being copied.
+PREFETCH_COUNT = 4
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 @dataclass
@@ -19,6 +42,8 @@ class S3CopyCommand:
     columns: List[str]
     format: str = "CSV"
     schema_name: Optional[str] = None
+    manifest: bool = False
+    json_ignorecase: bool = False
 
 
 def mock_s3_copy_command(statement, cursor):
@@ -68,6 +93,9 @@ def _parse_s3_command(statement):
     params["s3_uri"] = strip(tokens.pop(0))
     empty_as_null = False
     delimiter = None
+    manifest = False
+    format = "CSV"
+    json_ignorecase = False
     # Fetching credentials
     for token in tokens:
         if "aws_access_key_id" in token.lower() or "aws_secret_access_key" in token.lower():
@@ -105,10 +133,35 @@ def _parse_s3_command(statement):
             empty_as_null = True
         if "csv" == token.lower():
             delimiter = ","
+        if "manifest" == token.lower():
+            manifest = True
+        if "parquet" == token.lower():
+            format = "PARQUET"
+
+    # Fetching JSON 'auto'
+    for index, token in enumerate(tokens):
+        if "json" == token.lower():
+            argument = [strip(arg).lower() for arg in tokens[index + 1 : index + 3]]
+            if argument[:1] != ["auto"]:
+                raise ValueError(
+                    "Possibly malformed JSON Format. "
+                    f"Statement = {statement}"
+                    "Redshift fixture only supports JSON data with the following syntax: "
+                    "[FORMAT [AS]] JSON 'auto' | 'auto ignorecase'"
+                )
+            format = "JSON"
+            json_ignorecase = argument[1:] == ["ignorecase"]
 
     if delimiter is None:
         delimiter = "|"
-    return S3CopyCommand(**params, empty_as_null=empty_as_null, delimiter=delimiter)
+    return S3CopyCommand(
+        **params,
+        empty_as_null=empty_as_null,
+        delimiter=delimiter,
+        manifest=manifest,
+        format=format,
+        json_ignorecase=json_ignorecase,
+    )
 
 
 def _split_table_name(table_name):
@@ -127,35 +180,259 @@ def _mock_s3_copy(
     cursor,
     copy_command,
 ):
-    """Execute patched 'copy' command."""
+    """Execute patched 'copy' command.
+
+    As with Redshift, every object whose key begins with the given prefix is copied (or
+    with `MANIFEST`, every object listed in the given manifest). Objects are fetched
+    concurrently, ahead of each being copied in turn.
+    """
     s3 = boto3.client(
         "s3",
         aws_access_key_id=copy_command.aws_access_key_id,
         aws_secret_access_key=copy_command.aws_secret_access_key,
     )
-    ending_index = len(copy_command.s3_uri)
-    path_to_file = copy_command.s3_uri[5:ending_index]
-    bucket, key = path_to_file.split("/", 1)
-    response = s3.get_object(Bucket=bucket, Key=key)
-
-    # the following lins of code is used to check if the file is gzipped or not.
-    # To do so we use magic numbers.
-    # A mgic number is a constant numerical or text value used to identify a file format or protocol
-    # The magic number for gzip compressed files is 1f 8b.
-    is_gzipped = binascii.hexlify(response["Body"].read(2)) == b"1f8b"
-
-    response = s3.get_object(Bucket=bucket, Key=key)
-    data = get_raw_file(response["Body"].read(), is_gzipped)
-
-    cursor.copy_expert(
-        "COPY {cc.table_name} FROM STDIN WITH DELIMITER AS '{cc.delimiter}' {cc.format} HEADER {non_null_clause}".format(
-            cc=copy_command,
-            non_null_clause=("FORCE NOT NULL " + ", ".join(copy_command.columns))
-            if copy_command.columns
-            else "",
-        ),
-        data,
+    bucket, key = _split_s3_uri(copy_command.s3_uri)
+    if copy_command.manifest:
+        locations = _read_manifest(s3, bucket, key)
+    else:
+        locations = _list_objects(s3, bucket, key)
+
+    statement = "COPY {cc.table_name} FROM STDIN WITH DELIMITER AS '{cc.delimiter}' {cc.format} HEADER {non_null_clause}".format(
+        cc=copy_command,
+        non_null_clause=("FORCE NOT NULL " + ", ".join(copy_command.columns))
+        if copy_command.columns
+        else "",
+    )
+
+    def get_object(location):
+        bucket, key, mandatory = location
+        try:
+            return s3.get_object(Bucket=bucket, Key=key)["Body"]
+        except s3.exceptions.NoSuchKey:
+            if not mandatory:
+                return None
+            if copy_command.manifest:
+                raise ValueError(f"Mandatory manifest entry does not exist: s3://{bucket}/{key}")
+            raise ValueError(f"The specified S3 object does not exist: s3://{bucket}/{key}")
+
+    def close_object(body):
+        if body is not None:
+            body.close()
+
+    with ThreadPoolExecutor(max_workers=PREFETCH_COUNT) as executor:
+        bodies = prefetch(
+            executor, get_object, locations, count=PREFETCH_COUNT, discard=close_object
+        )
+        try:
+            for body in bodies:
+                if body is None:
+                    continue
+
+                with contextlib.closing(body):
+                    if copy_command.format == "CSV":
+                        data = open_object_stream(body)
+                        cursor.copy_expert(statement, data, size=COPY_CHUNK_SIZE)
+                    else:
+                        _copy_arrow(cursor, copy_command, body)
+        finally:
+            bodies.close()
+
+
+def _copy_arrow(cursor, copy_command, body):
+    """Copy parquet/JSON data, read as Arrow record batches, and streamed into the table as CSV.
+
+    As with Redshift, parquet columns are matched with the table's columns by position, and
+    JSON fields by name.
+    """
+    # Fail with a helpful error, when pyarrow is not installed.
+    pyarrow.__version__
+
+    from pyarrow import csv as arrow_csv
+    from pyarrow import json as arrow_json
+    from pyarrow import parquet as arrow_parquet
+
+    if copy_command.format == "PARQUET":
+        file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        shutil.copyfileobj(body, file, COPY_CHUNK_SIZE)
+        file.seek(0)
+
+        batches = arrow_parquet.ParquetFile(file).iter_batches()
+        columns = copy_command.columns
+    else:
+        file = open_object_stream(body)
+        table = arrow_json.read_json(file)
+
+        def key(name):
+            return name.lower() if copy_command.json_ignorecase else name
+
+        fields = {key(name): name for name in table.column_names}
+        columns = copy_command.columns or _get_table_columns(cursor, copy_command.table_name)
+        columns = [column for column in columns if key(column) in fields]
+        batches = table.select([fields[key(column)] for column in columns]).to_batches()
+
+    def write_csv():
+        options = arrow_csv.WriteOptions(include_header=False)
+        for batch in batches:
+            sink = pyarrow.BufferOutputStream()
+            arrow_csv.write_csv(batch, sink, write_options=options)
+            yield sink.getvalue().to_pybytes()
+
+    column_list = "({})".format(", ".join(columns)) if columns else ""
+    with file:
+        cursor.copy_expert(
+            f"COPY {copy_command.table_name} {column_list} FROM STDIN WITH CSV",
+            io.BufferedReader(ChunkedStream(write_csv()), buffer_size=COPY_CHUNK_SIZE),
+            size=COPY_CHUNK_SIZE,
+        )
+
+
+def _get_table_columns(cursor, table_name: str) -> List[str]:
+    cursor.execute(
+        "SELECT attname FROM pg_attribute "
+        "WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped "
+        "ORDER BY attnum",
+        (table_name,),
     )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def _split_s3_uri(s3_uri: str) -> Tuple[str, str]:
+    """Split 's3://bucket/key' into (bucket, key)."""
+    bucket, key = s3_uri[5:].split("/", 1)
+    return bucket, key
+
+
+def _list_objects(s3, bucket: str, prefix: str) -> List[Tuple[str, str, bool]]:
+    paginator = s3.get_paginator("list_objects_v2")
+    locations = [
+        (bucket, item["Key"], True)
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix)
+        for item in page.get("Contents", [])
+    ]
+    if not locations:
+        raise ValueError(f"The specified S3 prefix does not exist: s3://{bucket}/{prefix}")
+    return locations
+
+
+def _read_manifest(s3, bucket: str, key: str) -> List[Tuple[str, str, bool]]:
+    """Read the (bucket, key, mandatory) locations listed by a COPY manifest.
+
+    A manifest is a JSON object of the form:
+    `{"entries": [{"url": "s3://bucket/key", "mandatory": true}, ...]}`.
+    """
+    body = s3.get_object(Bucket=bucket, Key=key)["Body"].read()
+    manifest = json.loads(body)
+    return [
+        (*_split_s3_uri(entry["url"]), entry.get("mandatory", False))
+        for entry in manifest["entries"]
+    ]
+
+
+def prefetch(
+    executor: ThreadPoolExecutor,
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    count: int,
+    discard: Optional[Callable[[R], None]] = None,
+) -> Iterator[R]:
+    """Produce `fn(item)` for each of `items` (in order), computing up to `count` ahead.
+
+    If not exhausted (e.g. upon an error), the results computed ahead of time are passed
+    to `discard` (once computed, for those which cannot be cancelled).
+
+    Examples:
+        >>> with ThreadPoolExecutor() as executor:
+        ...     list(prefetch(executor, lambda x: x * 2, range(5), count=2))
+        [0, 2, 4, 6, 8]
+    """
+    items = iter(items)
+    futures = collections.deque(
+        executor.submit(fn, item) for item in itertools.islice(items, count)
+    )
+    try:
+        while futures:
+            result = futures.popleft().result()
+            for item in itertools.islice(items, 1):
+                futures.append(executor.submit(fn, item))
+            yield result
+    finally:
+        for future in futures:
+            if not future.cancel() and discard is not None:
+                future.add_done_callback(functools.partial(_discard_result, discard))
+
+
+def _discard_result(discard: Callable[[R], None], future: Future):
+    if future.exception() is None:
+        discard(future.result())
+
+
+class PrefixedStream(io.RawIOBase):
+    """Read `prefix`, followed by the remainder of `stream`.
+
+    Allows the start of a (non-seekable) stream to be inspected, without being lost.
+
+    Examples:
+        >>> stream = io.BytesIO(b"abcdef")
+        >>> prefix = stream.read(2)
+        >>> PrefixedStream(prefix, stream).read()
+        b'abcdef'
+    """
+
+    def __init__(self, prefix: bytes, stream):
+        self.prefix = prefix
+        self.stream = stream
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self.prefix:
+            data, self.prefix = self.prefix[: len(buffer)], self.prefix[len(buffer) :]
+        else:
+            data = self.stream.read(len(buffer))
+
+        buffer[: len(data)] = data
+        return len(data)
+
+
+class ChunkedStream(io.RawIOBase):
+    """Read the concatenation of an iterable of `chunks` (bytes), as they are produced.
+
+    Examples:
+        >>> ChunkedStream(iter([b"abc", b"", b"def"])).read()
+        b'abcdef'
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self.chunks = chunks
+        self.chunk = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self.chunk:
+            self.chunk = next(self.chunks, None)
+            if self.chunk is None:
+                self.chunk = b""
+                return 0
+
+        data, self.chunk = self.chunk[: len(buffer)], self.chunk[len(buffer) :]
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def open_object_stream(body):
+    """Stream an S3 object's `body`, transparently decompressing gzipped objects.
+
+    Only a single chunk of the object is held in memory at a time.
+    """
+    prefix = body.read(len(GZIP_MAGIC_NUMBER))
+    stream = io.BufferedReader(PrefixedStream(prefix, body), buffer_size=COPY_CHUNK_SIZE)
+    if prefix == GZIP_MAGIC_NUMBER:
+        return gzip.GzipFile(fileobj=stream, mode="rb")
+    return stream
 
 
 def get_raw_file(file, is_gzipped=False):
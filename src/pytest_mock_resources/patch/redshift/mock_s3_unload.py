@@ -1,10 +1,22 @@
+import contextlib
 import csv
 import gzip
 import io
+import tempfile
+import uuid
+from typing import Optional
 
 from pytest_mock_resources.compat import boto3
 from pytest_mock_resources.patch.redshift.mock_s3_copy import strip
 
+# The number of rows fetched from the database at a time.
+UNLOAD_BATCH_SIZE = 10000
+
+# Files are held in memory up to this size, after which they are written to disk.
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+FILE_SIZE_UNITS = {"mb": 1024**2, "gb": 1024**3}
+
 
 def mock_s3_unload_command(statement, cursor):
     params = _parse_s3_command(statement)
@@ -17,6 +29,8 @@ def mock_s3_unload_command(statement, cursor):
         cursor=cursor,
         delimiter=params.get("delimiter", "|"),
         is_gzipped=params["gzip"],
+        parallel=params["parallel"],
+        max_file_size=params["max_file_size"],
     )
 
 
@@ -119,6 +133,31 @@ def _parse_s3_command(statement):
                     "aws_secret_access_key=<aws_secret_access_key>'"
                     "[GZIP] [DELIMITER [ AS ] 'delimiter-char']"
                 )
+
+    # Fetching PARALLEL/MAXFILESIZE
+    params["parallel"] = None
+    params["max_file_size"] = None
+    for index, token in enumerate(tokens):
+        if strip(token.lower()) == "parallel":
+            value = strip(tokens[index + 1].lower()) if index + 1 < len(tokens) else "on"
+            params["parallel"] = value not in ("off", "false")
+
+        if strip(token.lower()) == "maxfilesize":
+            arguments = [strip(argument.lower()) for argument in tokens[index + 1 : index + 4]]
+            if arguments[:1] == ["as"]:
+                arguments = arguments[1:]
+
+            try:
+                size = float(arguments[0])
+            except (IndexError, ValueError):
+                raise ValueError(
+                    "Possibly malformed MAXFILESIZE Format. "
+                    f"Statement = {statement}"
+                    "Redshift fixture only supports MAXFILESIZE with the following syntax: "
+                    "MAXFILESIZE [ AS ] max-size [ MB | GB ]"
+                )
+            unit = arguments[1] if arguments[1:2] in (["mb"], ["gb"]) else "mb"
+            params["max_file_size"] = int(size * FILE_SIZE_UNITS[unit])
     return params
 
 
@@ -130,55 +169,150 @@ def _mock_s3_unload(
     cursor,
     delimiter,
     is_gzipped,
+    parallel: Optional[bool] = None,
+    max_file_size: Optional[int] = None,
 ):
-    """Execute patched 'unload' command."""
+    """Execute patched 'unload' command.
+
+    Unless `PARALLEL` or `MAXFILESIZE` are given, a single file is written to exactly the
+    given key. Otherwise, part files are written (as Redshift would, from a single slice),
+    and uploaded concurrently.
+    """
+    from boto3.s3.transfer import create_transfer_manager, TransferConfig
+
     # Parsing s3 uri
     ending_index = len(s3_uri)
     path_to_file = s3_uri[5:ending_index]
     bucket, key = path_to_file.split("/", 1)
 
-    cursor.execute(select_statement)
-    result = cursor.fetchall()
-    column_names = [desc[0] for desc in cursor.description]
-    buffer = get_data_csv(
-        result, column_names=column_names, is_gzipped=is_gzipped, delimiter=delimiter
-    )
+    # Redshift unloads in parallel by default, if splitting files by size.
+    if parallel is None and max_file_size:
+        parallel = True
 
-    # Push the data to the S3 Bucket.
-    conn = boto3.resource(
+    client = boto3.client(
         "s3", aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key
     )
-    conn.create_bucket(Bucket=bucket)
-    obj = conn.Object(bucket, key)
-    obj.put(Body=buffer)
+    client.create_bucket(Bucket=bucket)
 
+    with contextlib.ExitStack() as stack:
+        server_cursor = stack.enter_context(server_side_cursor(cursor))
+        server_cursor.execute(select_statement)
+        rows = server_cursor.fetchmany(UNLOAD_BATCH_SIZE)
+        column_names = [desc[0] for desc in server_cursor.description]
 
-def get_data_csv(rows, column_names, is_gzipped=False, delimiter="|", **additional_to_csv_options):
-    result = io.BytesIO()
-    buffer = result
-    if is_gzipped:
-        buffer = gzip.GzipFile(fileobj=buffer, mode="wb")
-
-    wrapper = io.TextIOWrapper(buffer)
-
-    writer = csv.DictWriter(
-        wrapper,
-        fieldnames=column_names,
-        delimiter=delimiter,
-        quoting=csv.QUOTE_MINIMAL,
-        quotechar='"',
-        lineterminator="\n",
-        skipinitialspace=True,
-        doublequote=True,
-    )
-    writer.writeheader()
-    for row in rows:
-        writer.writerow(dict(zip(column_names, row)))
+        # The part files are entered on the outer stack, so that the manager waits on (or
+        # cancels) all uploads on exit, before the files are closed.
+        with create_transfer_manager(client, TransferConfig()) as manager:
+            futures = []
+
+            part = 0
+            writer = CsvFileWriter(column_names, is_gzipped=is_gzipped, delimiter=delimiter)
+            while True:
+                writer.write(rows)
+
+                rows = server_cursor.fetchmany(UNLOAD_BATCH_SIZE)
+                if not rows or (max_file_size and writer.size() >= max_file_size):
+                    file = stack.enter_context(writer.close())
+                    part_key = get_part_key(key, part, parallel=parallel, is_gzipped=is_gzipped)
+                    futures.append(manager.upload(file, bucket, part_key))
+
+                    if not rows:
+                        break
+
+                    part += 1
+                    writer = CsvFileWriter(column_names, is_gzipped=is_gzipped, delimiter=delimiter)
+
+            # Raise the first error encountered, if any.
+            for future in futures:
+                future.result()
 
-    wrapper.detach()
+
+@contextlib.contextmanager
+def server_side_cursor(cursor):
+    """Produce a server-side (named) cursor on the connection of `cursor`, where supported.
+
+    Otherwise (i.e. for drivers other than psycopg2), `cursor` itself is produced.
+    """
+    try:
+        # Held cursors may be declared whether or not a transaction is in progress.
+        server_cursor = cursor.connection.cursor(
+            name=f"pmr_unload_{uuid.uuid4().hex}", withhold=True
+        )
+    except (AttributeError, TypeError):
+        yield cursor
+        return
+
+    with server_cursor:
+        yield server_cursor
+
+
+def get_part_key(key: str, part: int, *, parallel: Optional[bool], is_gzipped=False):
+    """Produce the key of the given part file, following Redshift's naming.
+
+    Examples:
+        >>> get_part_key("unload/file.csv", 0, parallel=None)
+        'unload/file.csv'
+        >>> get_part_key("unload/", 1, parallel=True, is_gzipped=True)
+        'unload/0000_part_01.gz'
+        >>> get_part_key("unload/", 1, parallel=False)
+        'unload/001'
+    """
+    if parallel is None:
+        return key
+
+    if parallel:
+        key = f"{key}0000_part_{part:02}"
+    else:
+        key = f"{key}{part:03}"
 
     if is_gzipped:
-        buffer.close()
+        key += ".gz"
+    return key
+
+
+class CsvFileWriter:
+    """Write rows (as tuples) as CSV, into an (optionally gzipped) spooled temporary file."""
+
+    def __init__(self, column_names, is_gzipped=False, delimiter="|", **additional_to_csv_options):
+        self.file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+
+        self.buffer = self.file
+        if is_gzipped:
+            self.buffer = gzip.GzipFile(fileobj=self.file, mode="wb")
+
+        self.wrapper = io.TextIOWrapper(self.buffer, newline="")
+        self.writer = csv.writer(
+            self.wrapper,
+            delimiter=delimiter,
+            quoting=csv.QUOTE_MINIMAL,
+            quotechar='"',
+            lineterminator="\n",
+            skipinitialspace=True,
+            doublequote=True,
+        )
+        self.writer.writerow(column_names)
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+
+    def size(self) -> int:
+        """Produce the size of the file written so far."""
+        self.wrapper.flush()
+        return self.file.tell()
+
+    def close(self):
+        """Finish writing, and produce the file (rewound, to be read from its start)."""
+        self.wrapper.detach()
+        if self.buffer is not self.file:
+            self.buffer.close()
+
+        self.file.seek(0)
+        return self.file
+
+
+def get_data_csv(rows, column_names, is_gzipped=False, delimiter="|", **additional_to_csv_options):
+    writer = CsvFileWriter(column_names, is_gzipped=is_gzipped, delimiter=delimiter)
+    writer.write(rows)
 
-    result.seek(0)
-    return result
+    with writer.close() as file:
+        return io.BytesIO(file.read())
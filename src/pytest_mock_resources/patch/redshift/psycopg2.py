@@ -4,8 +4,12 @@ from unittest import mock
 from sqlalchemy.sql.base import Executable
 
 from pytest_mock_resources.container.postgres import PostgresConfig
-from pytest_mock_resources.patch.redshift.mock_s3_copy import mock_s3_copy_command, strip
+from pytest_mock_resources.patch.redshift.mock_s3_copy import mock_s3_copy_command
 from pytest_mock_resources.patch.redshift.mock_s3_unload import mock_s3_unload_command
+from pytest_mock_resources.patch.redshift.statement import (
+    classify_statement,
+    strip_leading_comments,
+)
 
 
 @contextlib.contextmanager
@@ -39,12 +43,13 @@ def mock_psycopg2_connect(config: PostgresConfig, database: str, _connect):
             if isinstance(sql, Executable):
                 return super().execute(sql, args)
 
-            if strip(sql).lower().startswith("copy"):
-                mock_s3_copy_command(sql, self)
+            command = classify_statement(sql)
+            if command == "copy":
+                mock_s3_copy_command(strip_leading_comments(sql), self)
                 sql = "commit"
 
-            if strip(sql).lower().startswith("unload"):
-                mock_s3_unload_command(sql, self)
+            if command == "unload":
+                mock_s3_unload_command(strip_leading_comments(sql), self)
                 sql = "commit"
 
             return super().execute(sql, args)
@@ -6,10 +6,18 @@ from sqlalchemy.sql.base import Executable
 from pytest_mock_resources.compat import sqlparse
 from pytest_mock_resources.patch.redshift.mock_s3_copy import mock_s3_copy_command
 from pytest_mock_resources.patch.redshift.mock_s3_unload import mock_s3_unload_command
+from pytest_mock_resources.patch.redshift.statement import (
+    classify_statement,
+    strip_leading_comments,
+)
 
 
 def register_redshift_behavior(engine):
     """Substitute the default execute method with a custom execute for copy and unload command."""
+    # Engines may be shared across tests (i.e. `isolation="savepoint"`).
+    if event.contains(engine, "before_execute", receive_before_execute):
+        return
+
     event.listen(engine, "before_execute", receive_before_execute, retval=True)
     event.listen(engine, "before_cursor_execute", receive_before_cursor_execute, retval=True)
 
@@ -46,13 +54,13 @@ def receive_before_cursor_execute(_, cursor, statement: str, parameters, context
     we return a no-op query to be executed by sqlalchemy for certain kinds of supported
     extra features.
     """
-    normalized_statement = _preprocess(statement).lower()
-    if normalized_statement.startswith("unload"):
-        mock_s3_unload_command(statement, cursor)
+    command = classify_statement(statement)
+    if command == "unload":
+        mock_s3_unload_command(strip_leading_comments(statement), cursor)
         return "SELECT 1", {}
 
-    if normalized_statement.startswith("copy"):
-        mock_s3_copy_command(statement, cursor)
+    if command == "copy":
+        mock_s3_copy_command(strip_leading_comments(statement), cursor)
         context.should_autocommit = True
         return "SELECT 1", {}
     return statement, parameters
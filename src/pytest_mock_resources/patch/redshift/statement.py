@@ -0,0 +1,62 @@
+"""Classify statements as the redshift-specific commands which are mocked (COPY/UNLOAD).
+
+Every statement executed against a redshift fixture is classified, so this avoids copying
+(e.g. stripping or lowercasing) the statement: only a bounded prefix of it is inspected.
+"""
+import functools
+import re
+from typing import Optional
+
+MOCKED_COMMANDS = frozenset({"copy", "unload"})
+
+# The length of the prefix of a statement which is inspected (and cached) at first.
+CLASSIFY_PREFIX_LENGTH = 256
+
+# Leading whitespace and comments, followed by the first token.
+LEADING_TOKEN = re.compile(r"(?:\s+|--[^\n]*(?:\n|$)|/\*.*?\*/)*([A-Za-z_]*)", re.DOTALL)
+
+
+def classify_statement(statement) -> Optional[str]:
+    r"""Produce the (lowercase) mocked command `statement` executes, if any.
+
+    Examples:
+        >>> classify_statement("  Copy x FROM 's3://bucket/key'")
+        'copy'
+        >>> classify_statement("-- comment\n/* block\ncomment */ UNLOAD ('select 1')")
+        'unload'
+        >>> classify_statement("SELECT 'copy'")
+        >>> classify_statement("copyright")
+    """
+    if not isinstance(statement, str):
+        return None
+
+    prefix = statement[:CLASSIFY_PREFIX_LENGTH]
+    token, end = _first_token(prefix)
+    if (not token or end == len(prefix)) and len(statement) > len(prefix):
+        # The prefix may end within leading comments, or within the first token. The full
+        # statement is not cached, to avoid retaining (potentially large) statements. The
+        # match stops at the first token, so only the leading comments are scanned.
+        token, end = _first_token.__wrapped__(statement)
+
+    if token in MOCKED_COMMANDS:
+        return token
+    return None
+
+
+def strip_leading_comments(statement: str) -> str:
+    """Remove any comments (and whitespace) which precede the first token of `statement`.
+
+    Examples:
+        >>> strip_leading_comments("/* comment */ COPY x")
+        'COPY x'
+    """
+    match = LEADING_TOKEN.match(statement)
+    assert match
+    return statement[match.start(1) :]
+
+
+@functools.lru_cache(maxsize=1024)
+def _first_token(statement: str):
+    match = LEADING_TOKEN.match(statement)
+    assert match
+    return match.group(1).lower(), match.end()
@@ -1,18 +1,24 @@
+import datetime
+import decimal
+import enum
 import fnmatch
+import hashlib
 import logging
+import uuid
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Set, TypeVar, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, TypeVar, Union
 
 import sqlalchemy
-from sqlalchemy import MetaData, text
+from sqlalchemy import event, MetaData, text
 from sqlalchemy.orm import scoped_session, Session, sessionmaker
-from sqlalchemy.sql.ddl import CreateSchema
+from sqlalchemy.sql.ddl import CreateSchema, sort_tables
 from sqlalchemy.sql.schema import Table
 
 from pytest_mock_resources import compat
 from pytest_mock_resources.action import AbstractAction, validate_actions
 from pytest_mock_resources.credentials import Credentials
+from pytest_mock_resources.timing import get_timer, timed
 
 log = logging.getLogger(__name__)
 
@@ -25,6 +31,19 @@ class Rows(AbstractAction):
         self.rows = rows
 
     def apply(self, conn):
+        inserts = self._get_bulk_inserts(self.rows)
+        if inserts is None:
+            self._apply_orm(conn)
+            return
+
+        connection = conn.connection() if isinstance(conn, Session) else conn
+        for table, params in inserts:
+            connection.execute(table.insert(), params)
+
+        if isinstance(conn, Session):
+            commit(conn)
+
+    def _apply_orm(self, conn):
         rows = self._get_stateless_rows(self.rows)
 
         if isinstance(conn, Session):
@@ -35,6 +54,53 @@ class Rows(AbstractAction):
         session.add_all(rows)
         commit(session)
 
+    @staticmethod
+    def _get_bulk_inserts(rows) -> Optional[List[Tuple[Table, List[dict]]]]:
+        """Group `rows` into Core (executemany) inserts, in table dependency order.
+
+        Returns `None` when any row requires the ORM's unit of work, i.e. it sets a
+        relationship, uses a mapper with inheritance or versioning, or has insert
+        events attached.
+        """
+        runs: Dict[Table, List[Tuple[frozenset, List[dict]]]] = {}
+        for row in rows:
+            mapper = sqlalchemy.inspect(type(row), raiseerr=False)
+            if (
+                mapper is None
+                or mapper.inherits is not None
+                or mapper.polymorphic_on is not None
+                or mapper.version_id_col is not None
+                or not isinstance(mapper.local_table, Table)
+                or mapper.dispatch.before_insert
+                or mapper.dispatch.after_insert
+            ):
+                return None
+
+            params = {}
+            for key, value in row.__dict__.items():
+                if key == "_sa_instance_state" or key not in mapper.attrs:
+                    continue
+
+                prop = mapper.column_attrs.get(key)
+                if prop is None or len(prop.columns) != 1:
+                    return None
+
+                column = prop.columns[0]
+                if column.table is not mapper.local_table:
+                    return None
+                params[column.key] = value
+
+            # Consecutive rows with the same columns share a single executemany. Rows
+            # otherwise retain their relative order, i.e. for self-referential tables.
+            table_runs = runs.setdefault(mapper.local_table, [])
+            keys = frozenset(params)
+            if table_runs and table_runs[-1][0] == keys:
+                table_runs[-1][1].append(params)
+            else:
+                table_runs.append((keys, [params]))
+
+        return [(table, params) for table in sort_tables(runs) for _, params in runs[table]]
+
     @staticmethod
     def _get_stateless_rows(rows):
         """Create rows that aren't associated with any other SQLAlchemy session."""
@@ -102,6 +168,7 @@ class EngineManager:
         )
 
     def manage_sync(self, engine):
+        timer = get_timer()
         try:
             if self.session:
                 if isinstance(self.session, sessionmaker):
@@ -136,11 +203,13 @@ class EngineManager:
                 yield engine, engine
 
         finally:
-            engine.dispose()
+            with timer("dispose"):
+                engine.dispose()
 
     async def manage_async(self, engine, session=None):
         from sqlalchemy.ext.asyncio.session import AsyncSession
 
+        timer = get_timer()
         try:
             if self.session:
                 if isinstance(self.session, (sessionmaker, AsyncSession)):
@@ -170,19 +239,67 @@ class EngineManager:
                 Credentials.assign_from_connection(engine.sync_engine)
                 yield engine, engine
         finally:
-            await engine.dispose()
+            with timer("dispose"):
+                await engine.dispose()
+
+    def manage_savepoint(self, engine):
+        """Produce a connection (or session) isolated by a transaction which is never committed.
+
+        Unlike `manage_sync`, the given `engine` is expected to be shared across tests. The
+        actions and the test itself are run inside an outer transaction which is rolled back
+        on teardown, rather than relying on the engine's database being discarded.
+        """
+        with engine.connect() as conn:
+            trans = conn.begin()
+            try:
+                if self.session:
+                    if isinstance(self.session, sessionmaker):
+                        session_factory = self.session
+                    elif isinstance(self.session, Session):
+                        raise ValueError(
+                            "A `Session` instance cannot be rebound to the per-test transaction, "
+                            "supply a `sessionmaker` or `session=True` instead."
+                        )
+                    else:
+                        session_factory = sessionmaker()
+
+                    session = create_savepoint_session(session_factory, conn)
+                    try:
+                        self.run_actions(session)
+                        commit(session)
+
+                        Credentials.assign_from_connection(session)
+                        yield engine, session
+                    finally:
+                        session.close()
+                else:
+                    nested = conn.begin_nested()
+                    self.run_actions(conn)
+                    nested.commit()
+
+                    event.listen(conn, "commit", _forbid_commit)
+                    try:
+                        Credentials.assign_from_connection(conn)
+                        yield engine, conn
+                    finally:
+                        event.remove(conn, "commit", _forbid_commit)
+            finally:
+                if trans.is_active:
+                    trans.rollback()
 
     def run_actions(self, conn):
         self.run_static_actions(conn)
         self.run_dynamic_actions(conn)
 
     def run_static_actions(self, conn):
-        for action in self.static_actions:
-            self.execute_action(conn, action, allow_function=False)
+        with timed("static_actions"):
+            for action in self.static_actions:
+                self.execute_action(conn, action, allow_function=False)
 
     def run_dynamic_actions(self, conn):
-        for action in self.dynamic_actions:
-            self.execute_action(conn, action, allow_function=True)
+        with timed("dynamic_actions"):
+            for action in self.dynamic_actions:
+                self.execute_action(conn, action, allow_function=True)
 
     def _create_schemas(self, conn, metadata):
         if metadata in self._ddl_created:
@@ -288,6 +405,87 @@ def bifurcate_actions(ordered_actions):
     return (static_actions, dynamic_actions)
 
 
+def fingerprint_actions(static_actions, *, dialect_name: str, tables=()) -> Optional[str]:
+    """Produce a digest identifying the database state produced by the `static_actions`.
+
+    The DDL for `MetaData` is captured (as it would be executed) through a mock engine,
+    so that it includes DDL produced by event listeners, such as enum types.
+
+    Returns `None` if the effect of any action cannot be determined ahead of time, or if
+    any value involved has no representation which is stable between runs.
+    """
+    mock_engine = None
+    statements: List[str] = []
+
+    def record(sql, *multiparams, **params):
+        compiled = sql.compile(dialect=mock_engine.dialect)
+        statements.append(str(compiled))
+        statements.append(stable_repr((compiled.params, multiparams, params)))
+
+    mock_engine = compat.sqlalchemy.create_mock_engine(f"{dialect_name}://", record)
+    manager = EngineManager(tables=tables)
+
+    try:
+        for action in static_actions:
+            if isinstance(action, (MetaData, StaticStatements)):
+                manager.execute_action(mock_engine, action)
+            elif isinstance(action, Rows):
+                for row in action.rows:
+                    state = {k: v for k, v in row.__dict__.items() if k != "_sa_instance_state"}
+                    statements.append(f"{row.__table__.fullname}: {stable_repr(state)}")
+            else:
+                return None
+    except Exception:
+        log.debug("Unable to fingerprint static actions", exc_info=True)
+        return None
+
+    return hashlib.sha256("\n".join(statements).encode("utf-8")).hexdigest()
+
+
+STABLE_REPR_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    str,
+    bytes,
+    decimal.Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    uuid.UUID,
+    enum.Enum,
+)
+
+
+def stable_repr(value) -> str:
+    """Produce a representation of `value` which is the same between runs.
+
+    Raises `TypeError` for values (such as arbitrary objects, whose default `repr` includes
+    their address) whose representation may not be.
+
+    Examples:
+        >>> stable_repr({"b": {2, 1}, "a": [datetime.date(2020, 1, 1)]})
+        "{'a': [datetime.date(2020, 1, 1)], 'b': {1, 2}}"
+        >>> stable_repr(object())
+        Traceback (most recent call last):
+        ...
+        TypeError: Value of type object has no stable representation
+    """
+    if isinstance(value, STABLE_REPR_TYPES):
+        return repr(value)
+    if isinstance(value, dict):
+        items = sorted(f"{stable_repr(k)}: {stable_repr(v)}" for k, v in value.items())
+        return "{" + ", ".join(items) + "}"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(sorted(stable_repr(item) for item in value)) + "}"
+    if isinstance(value, list):
+        return "[" + ", ".join(stable_repr(item) for item in value) + "]"
+    if isinstance(value, tuple):
+        return "(" + ", ".join(stable_repr(item) for item in value) + ")"
+    raise TypeError(f"Value of type {type(value).__name__} has no stable representation")
+
+
 def identify_matching_tables(metadata, table_specifier):
     if isinstance(table_specifier, compat.sqlalchemy.DeclarativeMeta):
         return [table_specifier.__table__]
@@ -315,7 +513,36 @@ def commit(conn):
         if isinstance(conn, Session):
             return conn.commit()
 
+        # A raw COMMIT would end the enclosing transaction, rather than the savepoint.
+        in_nested_transaction = getattr(conn, "in_nested_transaction", None)
+        if in_nested_transaction and in_nested_transaction():
+            return None
+
         return conn.execute(text("COMMIT"))
     except sqlalchemy.exc.InvalidRequestError:
         # In autocommit mode, we won't be able to commit.
         pass
+
+
+def create_savepoint_session(session_factory, conn):
+    """Create a session whose `commit` calls release SAVEPOINTs on `conn`, rather than commit."""
+    if compat.sqlalchemy.version.startswith("2."):
+        return session_factory(bind=conn, join_transaction_mode="create_savepoint")
+
+    session = session_factory(bind=conn)
+    session.begin_nested()
+
+    @event.listens_for(session, "after_transaction_end")
+    def restart_savepoint(session, transaction):
+        if transaction.nested and not transaction._parent.nested:
+            session.expire_all()
+            session.begin_nested()
+
+    return session
+
+
+def _forbid_commit(conn):
+    raise sqlalchemy.exc.InvalidRequestError(
+        "Connections produced by fixtures with `isolation='savepoint'` are rolled back after "
+        "each test, and cannot be committed. Use `begin_nested()` instead."
+    )
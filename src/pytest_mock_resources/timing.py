@@ -0,0 +1,126 @@
+"""Record how long each phase of fixture setup/teardown takes.
+
+Enabled through the `pmr_timings` option. Phases are recorded against the fixture being
+set up at the time a `Timer` is produced (see `get_timer`), so that teardown phases are
+attributed to the same fixture as their setup.
+"""
+from __future__ import annotations
+
+import contextlib
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Iterator
+
+
+@dataclass
+class Timing:
+    fixture: str
+    phase: str
+    duration: float
+
+
+@dataclass
+class Recorder:
+    timings: list[Timing] = field(default_factory=list)
+    fixtures: list[str] = field(default_factory=list)
+
+    @property
+    def current_fixture(self) -> str:
+        if self.fixtures:
+            return self.fixtures[-1]
+        return "<unknown>"
+
+    @contextlib.contextmanager
+    def fixture(self, name: str) -> Iterator[None]:
+        self.fixtures.append(name)
+        try:
+            yield
+        finally:
+            self.fixtures.pop()
+
+    def record(self, fixture: str, phase: str, duration: float):
+        self.timings.append(Timing(fixture, phase, duration))
+
+    def extend(self, timings: list[dict]):
+        self.timings.extend(Timing(**timing) for timing in timings)
+
+    def dump(self) -> list[dict]:
+        return [asdict(timing) for timing in self.timings]
+
+    def summarize(self) -> list[tuple[str, str, int, float, float]]:
+        """Produce (fixture, phase, count, total, max) rows, slowest (total) first.
+
+        Examples:
+            >>> recorder = Recorder()
+            >>> recorder.record("pg", "connect", 1.0)
+            >>> recorder.record("pg", "create_database", 2.0)
+            >>> recorder.record("pg", "connect", 3.0)
+            >>> recorder.summarize()
+            [('pg', 'connect', 2, 4.0, 3.0), ('pg', 'create_database', 1, 2.0, 2.0)]
+        """
+        groups: dict[tuple[str, str], list[float]] = {}
+        for timing in self.timings:
+            groups.setdefault((timing.fixture, timing.phase), []).append(timing.duration)
+
+        rows = [
+            (fixture, phase, len(durations), sum(durations), max(durations))
+            for (fixture, phase), durations in groups.items()
+        ]
+        return sorted(rows, key=lambda row: row[3], reverse=True)
+
+    def write_json(self, path: str):
+        summary = [
+            {"fixture": fixture, "phase": phase, "count": count, "total": total, "max": max_}
+            for fixture, phase, count, total, max_ in self.summarize()
+        ]
+        with open(path, "w") as f:
+            json.dump({"summary": summary, "timings": self.dump()}, f, indent=2)
+
+
+class Timer:
+    def __init__(self, recorder: Recorder | None = None, fixture: str = ""):
+        self.recorder = recorder
+        self.fixture = fixture
+
+    @contextlib.contextmanager
+    def __call__(self, phase: str) -> Iterator[None]:
+        if self.recorder is None:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.recorder.record(self.fixture, phase, time.perf_counter() - start)
+
+
+_recorder: Recorder | None = None
+
+
+def enable() -> Recorder:
+    global _recorder
+    _recorder = Recorder()
+    return _recorder
+
+
+def disable():
+    global _recorder
+    _recorder = None
+
+
+def get_recorder() -> Recorder | None:
+    return _recorder
+
+
+def get_timer() -> Timer:
+    """Get a `Timer` which records phases against the fixture currently being set up."""
+    if _recorder is None:
+        return Timer()
+    return Timer(_recorder, _recorder.current_fixture)
+
+
+def timed(phase: str):
+    """Record the duration of `phase`, against the fixture currently being set up."""
+    return get_timer()(phase)
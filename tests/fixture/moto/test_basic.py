@@ -1,6 +1,9 @@
 from pytest_mock_resources import create_moto_fixture
+from pytest_mock_resources.fixture.moto.base import get_data_loader
 
 moto = create_moto_fixture()
+moto_other = create_moto_fixture()
+moto_pooled = create_moto_fixture(account_pool_size=2)
 
 
 def test_create_bucket(moto):
@@ -9,3 +12,41 @@ def test_create_bucket(moto):
     buckets = s3.list_buckets()["Buckets"]
     assert len(buckets) == 1
     assert buckets[0]["Name"] == "foo"
+
+
+def test_accounts_isolated(moto, moto_other, moto_pooled):
+    moto.client("s3").create_bucket(Bucket="foo")
+
+    assert moto_other.client("s3").list_buckets()["Buckets"] == []
+    assert moto_pooled.client("s3").list_buckets()["Buckets"] == []
+
+
+def test_data_loader_shared(moto, moto_other):
+    loader = get_data_loader()
+    search_paths = list(loader.search_paths)
+
+    session_loader = moto.session._session.get_component("data_loader")
+    assert session_loader is not moto_other.session._session.get_component("data_loader")
+
+    moto.client("sqs")
+    moto_other.client("sqs")
+    model = loader.load_service_model("sqs", "service-2")
+    assert session_loader.load_service_model("sqs", "service-2") is model
+
+    # boto3 appends its data path to each session's own loader, not to the shared one.
+    assert loader.search_paths == search_paths
+    assert len(search_paths) == len(set(search_paths))
+
+
+def test_clients_memoized(moto):
+    assert moto.client("s3") is moto.client("s3")
+    assert moto.resource("s3") is moto.resource("s3")
+    assert moto.client("s3", verify=False) is moto.client("s3", verify=False)
+    assert moto.client("s3") is not moto.client("s3", region_name="us-west-2")
+
+
+def test_client_cache_bounded(moto):
+    moto.cache_size = 1
+    s3 = moto.client("s3")
+    moto.client("sqs")
+    assert moto.client("s3") is not s3
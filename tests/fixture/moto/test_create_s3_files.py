@@ -1,6 +1,9 @@
 import io
 
+import pytest
+
 from pytest_mock_resources import create_moto_fixture, S3Bucket, S3Object
+from pytest_mock_resources.fixture.moto import action
 
 bucket = S3Bucket("foo")
 moto = create_moto_fixture(
@@ -51,3 +54,32 @@ def test_separate_fixture_state(moto2):
     resource = moto2.resource("s3")
     objects = sorted(resource.Bucket("foo").objects.all(), key=lambda o: o.key)
     assert len(objects) == 0
+
+
+@pytest.fixture(scope="module")
+def data_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("data") / "data.bin"
+    path.write_bytes(b"0123456789" * 100)
+    return path
+
+
+def test_path_and_file_objects(data_path, moto2, monkeypatch):
+    # Force a multipart upload, without needing a large payload.
+    monkeypatch.setattr(action, "MULTIPART_THRESHOLD", 5 * 1024 * 1024)
+
+    with open(data_path, "rb") as f:
+        objects = [
+            bucket.object("path.bin", data_path),
+            bucket.object("file.bin", f),
+            bucket.object("large.bin", b"x" * (6 * 1024 * 1024)),
+        ]
+        action.apply_ordered_actions(moto2, [bucket, *objects])
+        action.apply_ordered_actions(moto2, objects)
+
+    client = moto2.client("s3")
+    for key in ("path.bin", "file.bin"):
+        assert client.get_object(Bucket="foo", Key=key)["Body"].read() == data_path.read_bytes()
+
+    large = client.head_object(Bucket="foo", Key="large.bin")
+    assert large["ContentLength"] == 6 * 1024 * 1024
+    assert "-" in large["ETag"]
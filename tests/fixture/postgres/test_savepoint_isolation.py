@@ -0,0 +1,84 @@
+import pytest
+import sqlalchemy
+from sqlalchemy import Column, Integer, text
+
+from pytest_mock_resources import create_postgres_fixture, create_redshift_fixture, Rows
+from pytest_mock_resources.compat.sqlalchemy import declarative_base
+
+Base = declarative_base()
+
+
+class Thing(Base):
+    __tablename__ = "thing"
+
+    id = Column(Integer, autoincrement=True, primary_key=True)
+
+
+def insert_row(conn):
+    conn.execute(Thing.__table__.insert().values({"id": 2}))
+
+
+pg = create_postgres_fixture(Base, Rows(Thing(id=1)), isolation="savepoint")
+pg_session = create_postgres_fixture(
+    Base, Rows(Thing(id=1)), insert_row, isolation="savepoint", session=True
+)
+redshift = create_redshift_fixture(Base, Rows(Thing(id=1)), isolation="savepoint")
+
+
+@pytest.mark.parametrize("run", range(2))
+def test_connection_rolled_back(pg, run):
+    rows = pg.execute(text("select id from thing")).fetchall()
+    assert rows == [(1,)]
+
+    pg.execute(Thing.__table__.insert().values({"id": 2}))
+    pg.execute(text("CREATE TABLE other (id integer)"))
+
+
+def test_connection_commit_forbidden(pg):
+    with pytest.raises(sqlalchemy.exc.InvalidRequestError):
+        pg.commit()
+
+
+def test_connection_nested(pg):
+    with pg.begin_nested():
+        pg.execute(Thing.__table__.insert().values({"id": 2}))
+
+    rows = pg.execute(text("select id from thing order by id")).fetchall()
+    assert rows == [(1,), (2,)]
+
+
+@pytest.mark.parametrize("run", range(2))
+def test_session_commit_uses_savepoint(pg_session, run):
+    rows = pg_session.execute(text("select id from thing order by id")).fetchall()
+    assert rows == [(1,), (2,)]
+
+    pg_session.add(Thing(id=3))
+    pg_session.commit()
+
+    pg_session.add(Thing(id=4))
+    pg_session.rollback()
+
+    rows = pg_session.execute(text("select id from thing order by id")).fetchall()
+    assert rows == [(1,), (2,), (3,)]
+
+
+@pytest.mark.parametrize("run", range(2))
+def test_redshift(redshift, run):
+    rows = redshift.execute(text("select id from thing")).fetchall()
+    assert rows == [(1,)]
+
+    redshift.execute(Thing.__table__.insert().values({"id": 2}))
+
+
+def test_credentials(pg):
+    assert pg.pmr_credentials.database == pg.engine.url.database
+
+
+def test_invalid_isolation():
+    with pytest.raises(ValueError):
+        create_postgres_fixture(isolation="table")
+
+
+def test_async_unsupported():
+    with pytest.raises(ValueError):
+        create_postgres_fixture(isolation="savepoint", async_=True)
@@ -0,0 +1,120 @@
+import uuid
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, text
+
+from pytest_mock_resources import create_postgres_fixture, Rows, StaticStatements
+from pytest_mock_resources.compat.sqlalchemy import declarative_base
+from pytest_mock_resources.fixture.postgresql import (
+    _database_exists,
+    _publish_template_database,
+    get_root_engine,
+    get_template_database,
+)
+from pytest_mock_resources.sqlalchemy import fingerprint_actions
+
+Base = declarative_base()
+
+
+class Thing(Base):
+    __tablename__ = "thing"
+
+    id = Column(Integer, autoincrement=True, primary_key=True)
+    name = Column(String)
+
+
+pg = create_postgres_fixture(Base, Rows(Thing(id=1, name="one")))
+pg_same = create_postgres_fixture(Base, Rows(Thing(id=1, name="one")))
+
+
+def fingerprint(*actions, tables=()):
+    return fingerprint_actions(actions, dialect_name="postgresql", tables=tables)
+
+
+def test_fingerprint_stable():
+    assert fingerprint(Base.metadata) == fingerprint(Base.metadata)
+
+
+def test_fingerprint_schema_change():
+    metadata = MetaData()
+    Table("thing", metadata, Column("id", Integer, primary_key=True))
+
+    assert fingerprint(Base.metadata) != fingerprint(metadata)
+
+
+def test_fingerprint_tables():
+    metadata = MetaData()
+    Table("thing", metadata, Column("id", Integer, primary_key=True))
+    Table("other", metadata, Column("id", Integer, primary_key=True))
+
+    assert fingerprint(metadata) != fingerprint(metadata, tables=["thing"])
+
+
+def test_fingerprint_contents():
+    one = fingerprint(Base.metadata, Rows(Thing(id=1, name="one")))
+    two = fingerprint(Base.metadata, Rows(Thing(id=1, name="two")))
+    statements = fingerprint(Base.metadata, StaticStatements("select 1"))
+
+    assert len({one, two, statements}) == 3
+
+
+def test_fingerprint_unknown_action():
+    assert fingerprint(Base.metadata, lambda conn: None) is None
+
+
+def test_fingerprint_unstable_value():
+    """Assert values whose `repr` differs between runs (e.g. by address) disable templating."""
+    assert fingerprint(Base.metadata, Rows(Thing(id=1, name=object()))) is None
+    assert (
+        fingerprint(Base.metadata, StaticStatements(text("select :x").bindparams(x=object())))
+        is None
+    )
+
+
+def test_template_content_addressed(pmr_postgres_config, pg, pg_same):
+    """Assert fixtures with identical static actions share a persistent template database."""
+    root_engine = get_root_engine(pmr_postgres_config)
+    with root_engine.connect() as conn:
+        names = {
+            get_template_database(
+                conn,
+                fixture_id,
+                [Base.metadata],
+                tables=(),
+                createdb_template="template1",
+                fixture="postgres",
+            )
+            for fixture_id in ("one", "two")
+        }
+        assert len(names) == 1
+
+        custom_template = get_template_database(
+            conn,
+            "three",
+            [Base.metadata],
+            tables=(),
+            createdb_template="custom",
+            fixture="postgres",
+        )
+        assert custom_template == "three"
+
+    for engine in (pg, pg_same):
+        with engine.connect() as conn:
+            rows = conn.execute(text("select id, name from thing")).fetchall()
+        assert rows == [(1, "one")]
+
+
+def test_publish_template_race(pmr_postgres_config):
+    """Assert that a template published by another process is kept."""
+    template_database = f"pmr_test_template_{uuid.uuid4().hex}"
+    build_database = f"{template_database}_build"
+
+    root_engine = get_root_engine(pmr_postgres_config)
+    with root_engine.connect() as conn:
+        conn.execute(text(f'CREATE DATABASE "{template_database}"'))
+        conn.execute(text(f'CREATE DATABASE "{build_database}"'))
+
+        _publish_template_database(conn, build_database, template_database)
+        assert _database_exists(conn, template_database)
+        assert not _database_exists(conn, build_database)
+
+        conn.execute(text(f'DROP DATABASE "{template_database}"'))
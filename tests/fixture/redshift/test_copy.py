@@ -1,10 +1,17 @@
+import gzip
+import io
+import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 
+import pytest
 from sqlalchemy import Column, Integer, text
 
 from pytest_mock_resources import create_redshift_fixture
 from pytest_mock_resources.compat import boto3, moto
 from pytest_mock_resources.compat.sqlalchemy import declarative_base
+from pytest_mock_resources.patch.redshift import mock_s3_copy
+from pytest_mock_resources.patch.redshift.mock_s3_copy import COPY_CHUNK_SIZE, open_object_stream
 from tests import skip_if_sqlalchemy2
 from tests.fixture.redshift.utils import (
     COPY_TEMPLATE,
@@ -317,3 +324,164 @@ def test_redshift_auto_schema_creation(redshift):
                 )
 
         fetch_values_from_table_and_assert(redshift)
+
+
+def put_part_files(s3):
+    """Put the original data, split across part files (one of which is gzipped)."""
+    s3.create_bucket(Bucket="mybucket")
+    for index, row in enumerate(original_data):
+        s3.put_object(
+            Bucket="mybucket",
+            Key=f"parts/file_{index:04}",
+            Body=get_data_csv([row], data_columns, is_gzipped=bool(index % 2)),
+        )
+
+
+def copy_from(redshift, location, optional_args=""):
+    with redshift.begin() as conn:
+        conn.execute(
+            text(
+                COPY_TEMPLATE.format(
+                    COMMAND="COPY",
+                    LOCATION=location,
+                    COLUMNS="",
+                    FROM="from",
+                    CREDENTIALS="credentials",
+                    OPTIONAL_ARGS=optional_args,
+                )
+            )
+        )
+
+
+def test_s3_copy_from_prefix(redshift, monkeypatch):
+    monkeypatch.setattr(mock_s3_copy, "PREFETCH_COUNT", 2)
+
+    with moto.mock_s3():
+        setup_table_and_bucket(redshift)
+        s3 = boto3.client("s3", region_name="us-east-1")
+        put_part_files(s3)
+
+        copy_from(redshift, "s3://mybucket/parts/")
+        fetch_values_from_table_and_assert(redshift)
+
+        with pytest.raises(ValueError, match="prefix does not exist"):
+            copy_from(redshift, "s3://mybucket/missing/")
+
+
+def test_s3_copy_from_manifest(redshift):
+    with moto.mock_s3():
+        setup_table_and_bucket(redshift)
+        s3 = boto3.client("s3", region_name="us-east-1")
+        put_part_files(s3)
+
+        entries = [
+            {"url": f"s3://mybucket/parts/file_{index:04}", "mandatory": True}
+            for index in range(len(original_data))
+        ]
+        entries.insert(1, {"url": "s3://mybucket/parts/optional", "mandatory": False})
+        s3.put_object(Bucket="mybucket", Key="load.manifest", Body=json.dumps({"entries": entries}))
+
+        copy_from(redshift, "s3://mybucket/load.manifest", optional_args="MANIFEST")
+        fetch_values_from_table_and_assert(redshift)
+
+        entries = [{"url": "s3://mybucket/parts/missing", "mandatory": True}]
+        s3.put_object(Bucket="mybucket", Key="bad.manifest", Body=json.dumps({"entries": entries}))
+        with pytest.raises(ValueError, match="Mandatory manifest entry"):
+            copy_from(redshift, "s3://mybucket/bad.manifest", optional_args="MANIFEST")
+
+
+def test_s3_copy_from_prefix_missing_object(redshift, monkeypatch):
+    """Assert objects listed under a prefix, but since deleted, are not called manifest entries."""
+    list_objects = mock_s3_copy._list_objects
+
+    def _list_objects(s3, bucket, prefix):
+        return [*list_objects(s3, bucket, prefix), (bucket, f"{prefix}deleted", True)]
+
+    monkeypatch.setattr(mock_s3_copy, "_list_objects", _list_objects)
+
+    with moto.mock_s3():
+        setup_table_and_bucket(redshift)
+        s3 = boto3.client("s3", region_name="us-east-1")
+        put_part_files(s3)
+
+        with pytest.raises(
+            ValueError, match="S3 object does not exist: s3://mybucket/parts/deleted"
+        ):
+            copy_from(redshift, "s3://mybucket/parts/")
+
+
+def test_prefetch_discards_results_on_error():
+    computed = []
+    produced = []
+    discarded = []
+
+    def double(x):
+        computed.append(x * 2)
+        return x * 2
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = mock_s3_copy.prefetch(
+            executor, double, range(5), count=2, discard=discarded.append
+        )
+        with pytest.raises(ValueError):
+            for result in results:
+                produced.append(result)
+                if result == 2:
+                    raise ValueError()
+        results.close()
+
+    # Every result computed ahead (rather than cancelled) is discarded, once computed.
+    assert produced == [0, 2]
+    assert sorted(discarded) == sorted(set(computed) - set(produced))
+
+
+def test_s3_copy_parquet(redshift):
+    pyarrow = pytest.importorskip("pyarrow")
+    from pyarrow import parquet
+
+    table = pyarrow.table(list(zip(*original_data)), names=data_columns)
+    body = pyarrow.BufferOutputStream()
+    parquet.write_table(table, body, row_group_size=1)
+
+    with moto.mock_s3():
+        setup_table_and_bucket(redshift)
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.put_object(Bucket="mybucket", Key="file.parquet", Body=body.getvalue().to_pybytes())
+
+        copy_from(redshift, "s3://mybucket/file.parquet", optional_args="FORMAT AS PARQUET")
+        fetch_values_from_table_and_assert(redshift)
+
+
+@pytest.mark.parametrize(
+    "optional_args, keys",
+    [
+        ("FORMAT AS JSON 'auto'", data_columns),
+        ("JSON 'auto ignorecase'", [column.upper() for column in data_columns]),
+    ],
+)
+def test_s3_copy_json(redshift, optional_args, keys):
+    pytest.importorskip("pyarrow")
+
+    # Fields are matched by name, regardless of their order, and unknown fields are ignored.
+    rows = [{"extra": 1, **dict(reversed(list(zip(keys, row))))} for row in original_data]
+    body = gzip.compress("\n".join(json.dumps(row) for row in rows).encode())
+
+    with moto.mock_s3():
+        setup_table_and_bucket(redshift)
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.put_object(Bucket="mybucket", Key="file.json.gz", Body=body)
+
+        copy_from(redshift, "s3://mybucket/file.json.gz", optional_args=optional_args)
+        fetch_values_from_table_and_assert(redshift)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_open_object_stream(compress):
+    data = b"1|2.0|a|b\n" * (COPY_CHUNK_SIZE // 4)
+    body = io.BytesIO(gzip.compress(data) if compress else data)
+
+    stream = open_object_stream(body)
+    chunks = list(iter(lambda: stream.read(COPY_CHUNK_SIZE), b""))
+
+    assert len(chunks) > 1
+    assert b"".join(chunks) == data
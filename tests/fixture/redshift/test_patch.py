@@ -1,8 +1,13 @@
+import types
+
 import pytest
 import sqlalchemy.exc
 from sqlalchemy import text
 
 from pytest_mock_resources import create_postgres_fixture, create_redshift_fixture
+from pytest_mock_resources.patch.redshift import sqlalchemy as redshift_sqlalchemy
+from pytest_mock_resources.patch.redshift import statement
+from pytest_mock_resources.patch.redshift.statement import classify_statement
 from tests import skip_if_sqlalchemy2
 from tests.fixture.redshift.utils import (
     copy_fn_to_test_create_engine_patch,
@@ -117,3 +122,54 @@ async def test_event_listener_registration_async_session(async_redshift_session)
     result = await async_redshift_session.execute(text("select 1"))
     value = result.scalar()
     assert value == 1
+
+
+def test_classify_long_leading_comment():
+    comment = "/* " + "x" * statement.CLASSIFY_PREFIX_LENGTH + " */"
+    assert classify_statement(f"{comment} unload ('select 1')") == "unload"
+    assert classify_statement(f"{comment} select 1") is None
+
+    # The first token straddles the end of the prefix.
+    padding = " " * (statement.CLASSIFY_PREFIX_LENGTH - 2)
+    assert classify_statement(f"{padding}copy x") == "copy"
+
+
+class MatchSpy:
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.lengths = []
+
+    def match(self, string):
+        self.lengths.append(len(string))
+        return self.pattern.match(string)
+
+
+def test_classify_statement_inspects_prefix(monkeypatch):
+    """Assert classification does not scale with the size of the statement."""
+    spy = MatchSpy(statement.LEADING_TOKEN)
+    monkeypatch.setattr(statement, "LEADING_TOKEN", spy)
+    statement._first_token.cache_clear()
+
+    values = ", ".join(f"({i}, 'value {i}')" for i in range(100_000))
+    large_statement = f"INSERT INTO foo (id, value) VALUES {values}"
+
+    assert classify_statement(large_statement) is None
+    assert spy.lengths == [statement.CLASSIFY_PREFIX_LENGTH]
+
+
+def test_receive_before_cursor_execute_skips_sqlparse(monkeypatch):
+    """Assert (potentially large) statements which are not mocked are passed through, unparsed."""
+
+    def split(statement):
+        raise AssertionError("sqlparse was called")
+
+    monkeypatch.setattr(
+        redshift_sqlalchemy, "sqlparse", types.SimpleNamespace(split=split, parse=split)
+    )
+
+    values = ", ".join(f"({i}, 'value {i}')" for i in range(100_000))
+    large_statement = f"INSERT INTO foo (id, value) VALUES {values}"
+    result = redshift_sqlalchemy.receive_before_cursor_execute(
+        None, None, large_statement, (), None, False
+    )
+    assert result == (large_statement, ())
@@ -1,11 +1,16 @@
+import pytest
 import sqlalchemy
 from sqlalchemy.sql import text
 
 from pytest_mock_resources import create_redshift_fixture
-from pytest_mock_resources.compat import moto
+from pytest_mock_resources.compat import boto3, moto
+from pytest_mock_resources.patch.redshift import mock_s3_unload
+from pytest_mock_resources.patch.redshift.mock_s3_copy import read_data_csv
 from tests import skip_if_sqlalchemy2
 from tests.fixture.redshift.utils import (
+    empty_as_string,
     fetch_values_from_s3_and_assert,
+    original_data,
     randomcase,
     setup_table_and_insert_data,
     UNLOAD_TEMPLATE,
@@ -176,6 +181,57 @@ def test_ignores_sqlalchmey_text_obj(redshift):
             return
 
 
+@pytest.mark.parametrize(
+    "optional_args, keys",
+    [
+        ("PARALLEL OFF", ["myfile.csv000"]),
+        ("PARALLEL ON GZIP", ["myfile.csv0000_part_00.gz"]),
+        (
+            "MAXFILESIZE AS 0.00001 MB",
+            ["myfile.csv0000_part_00", "myfile.csv0000_part_01", "myfile.csv0000_part_02"],
+        ),
+        ("PARALLEL FALSE MAXFILESIZE 0.00001", ["myfile.csv000", "myfile.csv001", "myfile.csv002"]),
+    ],
+)
+def test_unload_parts(redshift, monkeypatch, optional_args, keys):
+    """Test part files are written when PARALLEL or MAXFILESIZE are given."""
+    monkeypatch.setattr(mock_s3_unload, "UNLOAD_BATCH_SIZE", 1)
+
+    with moto.mock_s3():
+        setup_table_and_insert_data(redshift)
+
+        with redshift.begin() as conn:
+            conn.execute(
+                text(
+                    UNLOAD_TEMPLATE.format(
+                        COMMAND="UNLOAD",
+                        SELECT_STATEMENT="select * from test_s3_unload_from_redshift",
+                        TO="TO",
+                        LOCATION="s3://mybucket/myfile.csv",
+                        AUTHORIZATION="AUTHORIZATION",
+                        OPTIONAL_ARGS=optional_args,
+                    )
+                )
+            )
+
+        s3 = boto3.client(
+            "s3",
+            aws_access_key_id="AAAAAAAAAAAAAAAAAAAA",
+            aws_secret_access_key="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA",
+        )
+        objects = s3.list_objects_v2(Bucket="mybucket")["Contents"]
+        assert [o["Key"] for o in objects] == keys
+
+        data = []
+        for key in keys:
+            body = s3.get_object(Bucket="mybucket", Key=key)["Body"].read()
+            data.extend(read_data_csv(body, is_gzipped=key.endswith(".gz")))
+
+        assert data == [
+            empty_as_string(row, stringify_value=True, c_space=False) for row in original_data
+        ]
+
+
 @skip_if_sqlalchemy2
 def test_multiple_sql_statemts(redshift):
     with moto.mock_s3():
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from sqlalchemy import create_engine, text
 
@@ -8,6 +10,7 @@ from pytest_mock_resources import (
     create_redshift_fixture,
     create_sqlite_fixture,
 )
+from pytest_mock_resources.fixture.postgresql import _async_fixture
 from pytest_mock_resources.sqlalchemy import EngineManager
 from tests import skip_if_not_sqlalchemy2
 
@@ -141,3 +144,20 @@ def test_engine_reuse(postgres_async, event_loop):
             await conn.execute(text("select 1"))
 
     event_loop.run_until_complete(execute(postgres_async))
+
+
+@pytest.mark.asyncio
+@skip_if_not_sqlalchemy2
+async def test_concurrent_async_setup(pmr_postgres_container, pmr_postgres_config):
+    """Assert async fixture setup yields to the event loop, so can happen concurrently."""
+    engine_manager_kwargs = {"ordered_actions": (), "tables": None, "session": None}
+    fixtures = [_async_fixture(pmr_postgres_config, engine_manager_kwargs, {}) for _ in range(3)]
+
+    engines = await asyncio.gather(*(fixture.__anext__() for fixture in fixtures))
+    try:
+        for engine, _ in engines:
+            async with engine.connect() as conn:
+                await conn.execute(text("select 1"))
+    finally:
+        for fixture in fixtures:
+            await fixture.aclose()
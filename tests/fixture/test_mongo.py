@@ -1,6 +1,27 @@
-from pytest_mock_resources import create_mongo_fixture
+import pytest
+
+from pytest_mock_resources import create_mongo_fixture, MongoCollection
+from pytest_mock_resources.fixture import mongo as mongo_module
+from pytest_mock_resources.fixture.mongo import (
+    copy_database,
+    get_root_client,
+    supports_cross_database_out,
+)
 
 mongo = create_mongo_fixture()
+mongo_pooled = create_mongo_fixture(database_pool_size=2)
+
+customers = MongoCollection(
+    "customers",
+    documents=[{"name": "John", "address": "Highway 37"}, {"name": "Viola", "address": "Sideway"}],
+    indexes=["name"],
+)
+mongo_actions = create_mongo_fixture(
+    customers,
+    MongoCollection("empty"),
+    lambda db: db["customers"].insert_one({"name": "Amy"}),
+)
+mongo_actions_no_template = create_mongo_fixture(customers, template_database=False)
 
 
 def test_basic_mongo_fixture(mongo):
@@ -134,3 +155,86 @@ def test_create_custom_connection(mongo):
     returned = list(result)
 
     assert returned == to_insert
+
+
+def test_pooled_database(mongo_pooled, mongo):
+    assert mongo_pooled.name != mongo.name
+    assert mongo_pooled.list_collection_names() == []
+
+    mongo_pooled["customers"].insert_one({"name": "John"})
+    assert mongo_pooled["customers"].count_documents({}) == 1
+
+
+def test_root_client_shared(pmr_mongo_config, mongo):
+    assert get_root_client(pmr_mongo_config) is get_root_client(pmr_mongo_config)
+
+
+def test_collection_actions(mongo_actions):
+    assert sorted(mongo_actions.list_collection_names()) == ["customers", "empty"]
+
+    names = [doc["name"] for doc in mongo_actions["customers"].find().sort("name")]
+    assert names == ["Amy", "John", "Viola"]
+    assert "name_1" in mongo_actions["customers"].index_information()
+
+    # The action's documents are left unmodified.
+    assert customers.documents[0] == {"name": "John", "address": "Highway 37"}
+
+
+def test_collection_actions_isolated(mongo_actions):
+    mongo_actions["customers"].delete_many({})
+    assert mongo_actions["customers"].count_documents({}) == 0
+
+
+def test_collection_actions_no_template(mongo_actions_no_template):
+    assert mongo_actions_no_template["customers"].count_documents({}) == 2
+    assert "name_1" in mongo_actions_no_template["customers"].index_information()
+
+
+def test_supports_cross_database_out_cached(pmr_mongo_config, mongo, monkeypatch):
+    supported = supports_cross_database_out(pmr_mongo_config)
+
+    def server_info():
+        raise AssertionError("The server's version was requested again")
+
+    monkeypatch.setattr(get_root_client(pmr_mongo_config), "server_info", server_info)
+    assert supports_cross_database_out(pmr_mongo_config) is supported
+
+
+@pytest.mark.parametrize("use_out", [False, True])
+def test_copy_database(pmr_mongo_config, mongo, use_out):
+    if use_out and not supports_cross_database_out(pmr_mongo_config):
+        pytest.skip("`$out` cannot write to another database before MongoDB 4.4")
+
+    root_client = get_root_client(pmr_mongo_config)
+    source = root_client[f"{mongo.name}_source"]
+    source["customers"].insert_many([{"name": "John"}, {"name": "Viola"}])
+    source["customers"].create_index("name")
+    source.create_collection("capped", capped=True, size=4096)
+    source["capped"].insert_one({"name": "Amy"})
+
+    try:
+        copy_database(root_client, source.name, mongo.name, use_out=use_out)
+    finally:
+        root_client.drop_database(source.name)
+
+    names = [doc["name"] for doc in mongo["customers"].find().sort("name")]
+    assert names == ["John", "Viola"]
+    assert "name_1" in mongo["customers"].index_information()
+    assert mongo["capped"].options()["capped"]
+    assert mongo["capped"].count_documents({}) == 1
+
+
+def test_template_copy_uses_out(pmr_mongo_config, mongo, monkeypatch):
+    """Assert templates are copied through `$out`, where it is supported."""
+    copies = []
+    monkeypatch.setitem(mongo_module._cross_database_out, pmr_mongo_config, True)
+    monkeypatch.setattr(
+        mongo_module, "copy_database", lambda *args, use_out: copies.append(use_out)
+    )
+
+    databases = mongo_module._create_clean_database(
+        pmr_mongo_config, fixture_id="pmr_template_out", static_actions=[customers]
+    )
+    next(databases)
+    databases.close()
+    assert copies == [True]
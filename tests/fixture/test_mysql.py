@@ -0,0 +1,188 @@
+import importlib.util
+import socket
+import threading
+
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, String, Table, text
+
+from pytest_mock_resources import create_mysql_fixture, MysqlConfig, Rows, StaticStatements
+from pytest_mock_resources.compat.sqlalchemy import declarative_base
+from pytest_mock_resources.container.base import ContainerCheckFailed
+from pytest_mock_resources.container.mysql import detect_driver
+from pytest_mock_resources.fixture import mysql as mysql_module
+from pytest_mock_resources.fixture.mysql import (
+    _has_external_tables,
+    close_session_resources,
+    get_root_engine,
+)
+
+Base = declarative_base()
+
+
+class Parent(Base):
+    __tablename__ = "parent"
+
+    id = Column(Integer, autoincrement=True, primary_key=True)
+    name = Column(String(32))
+
+
+class Child(Base):
+    __tablename__ = "child"
+
+    id = Column(Integer, autoincrement=True, primary_key=True)
+    parent_id = Column(Integer, ForeignKey("parent.id"))
+
+
+rows = Rows(Parent(id=1, name="one"), Child(id=1, parent_id=1))
+
+mysql_template = create_mysql_fixture(Base, rows)
+mysql_no_template = create_mysql_fixture(Base, rows, template_database=False)
+mysql_async = create_mysql_fixture(Base, rows, async_=True)
+mysql_view = create_mysql_fixture(
+    Base, rows, StaticStatements("CREATE VIEW parent_names AS SELECT name FROM parent")
+)
+
+
+def test_external_tables():
+    metadata = MetaData()
+    Table("thing", metadata, Column("id", Integer, primary_key=True), schema="other")
+
+    assert _has_external_tables([metadata])
+    assert not _has_external_tables([Base.metadata, rows])
+
+
+def assert_contents(engine):
+    with engine.connect() as conn:
+        parents = conn.execute(text("SELECT id, name FROM parent")).fetchall()
+        assert parents == [(1, "one")]
+
+        children = conn.execute(text("SELECT id, parent_id FROM child")).fetchall()
+        assert children == [(1, 1)]
+
+        # Foreign keys are retained.
+        references = conn.execute(
+            text(
+                "SELECT REFERENCED_TABLE_NAME FROM information_schema.KEY_COLUMN_USAGE "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'child' "
+                "AND REFERENCED_TABLE_NAME IS NOT NULL"
+            )
+        ).fetchall()
+        assert references == [("parent",)]
+
+        # Auto-increment counters carry on from the copied rows.
+        conn.execute(text("INSERT INTO parent (name) VALUES ('two')"))
+        new_id = conn.execute(text("SELECT MAX(id) FROM parent")).scalar()
+        assert new_id == 2
+
+
+def test_template(mysql_template):
+    assert_contents(mysql_template)
+
+
+def test_template_isolated(mysql_template):
+    assert_contents(mysql_template)
+
+
+def test_no_template(mysql_no_template):
+    assert_contents(mysql_no_template)
+
+
+def test_uncopyable_template(mysql_view):
+    assert_contents(mysql_view)
+
+    with mysql_view.connect() as conn:
+        names = conn.execute(text("SELECT name FROM parent_names ORDER BY name")).fetchall()
+    assert names == [("one",), ("two",)]
+
+
+requires_async_driver = pytest.mark.skipif(
+    not any(importlib.util.find_spec(driver) for driver in ("asyncmy", "aiomysql")),
+    reason="Requires an async MySQL driver (asyncmy or aiomysql).",
+)
+
+
+@requires_async_driver
+@pytest.mark.asyncio
+async def test_async_template(mysql_async):
+    async with mysql_async.connect() as conn:
+        parents = (await conn.execute(text("SELECT id, name FROM parent"))).fetchall()
+        children = (await conn.execute(text("SELECT id, parent_id FROM child"))).fetchall()
+
+    assert parents == [(1, "one")]
+    assert children == [(1, 1)]
+
+
+@requires_async_driver
+@pytest.mark.asyncio
+async def test_async_template_teardown(pmr_mysql_config, mysql_async):
+    """Assert templates built by async fixtures are dropped, while an event loop is running."""
+    databases = [
+        template.database
+        for key, template in mysql_module._templates.items()
+        if key[0] is pmr_mysql_config and template
+    ]
+    assert databases
+
+    close_session_resources(pmr_mysql_config)
+
+    with get_root_engine(pmr_mysql_config).connect() as conn:
+        result = conn.execute(text("SELECT SCHEMA_NAME FROM information_schema.SCHEMATA"))
+        assert not set(databases) & {row[0] for row in result}
+
+
+def test_detect_driver():
+    assert detect_driver() == "mysql+pymysql"
+    assert detect_driver("mysql+mysqldb", async_=True) == "mysql+mysqldb"
+
+
+@pytest.fixture(
+    params=[
+        (b"", False),
+        (b"J\x00\x00\x00\x0a5.6.51\x00" + b"\x00" * 64, True),
+    ],
+    ids=["silent", "handshake"],
+)
+def greeting_server(request):
+    """Produce the config of a server which sends the given greeting, and whether it is ready."""
+    greeting, ready = request.param
+
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+
+    def greet():
+        conn, _ = server.accept()
+        conn.sendall(greeting)
+        conn.close()
+
+    thread = threading.Thread(target=greet)
+    thread.start()
+    try:
+        yield MysqlConfig(host="127.0.0.1", port=server.getsockname()[1]), ready
+    finally:
+        thread.join()
+        server.close()
+
+
+def test_check_fn_handshake(greeting_server):
+    """Assert only a server which sends a handshake is considered ready."""
+    config, ready = greeting_server
+    if ready:
+        config.check_fn()
+    else:
+        with pytest.raises(ContainerCheckFailed):
+            config.check_fn()
+
+
+@pytest.mark.asyncio
+async def test_async_check_fn_handshake(greeting_server):
+    config, ready = greeting_server
+    if ready:
+        await config.async_check_fn()
+    else:
+        with pytest.raises(ContainerCheckFailed):
+            await config.async_check_fn()
+
+
+def test_root_engine_shared(pmr_mysql_config, mysql_template):
+    assert get_root_engine(pmr_mysql_config) is get_root_engine(pmr_mysql_config)
@@ -3,7 +3,11 @@ from sqlalchemy import Column, event, Integer
 from pytest_mock_resources import create_postgres_fixture, PostgresConfig
 from pytest_mock_resources.compat.sqlalchemy import declarative_base
 from pytest_mock_resources.container.postgres import get_sqlalchemy_engine
-from pytest_mock_resources.fixture.postgresql import _produce_clean_database
+from pytest_mock_resources.fixture.postgresql import (
+    _produce_clean_database,
+    close_session_resources,
+    get_root_engine,
+)
 
 Base = declarative_base()
 
@@ -62,3 +66,33 @@ def test_check_fn_env_based_port(nested_transaction):
     creds = nested_transaction.pmr_credentials
     config = PostgresConfig(host=creds.host, port=str(creds.port))
     config.check_fn()
+
+
+pooled_pg = create_postgres_fixture(Base, database_pool_size=2)
+
+
+class Test_database_pool:
+    def test_first(self, pooled_pg):
+        with pooled_pg.begin() as conn:
+            conn.execute(Thing.__table__.insert().values({"id": 1}))
+
+    def test_second(self, pooled_pg):
+        """Assert each test is handed its own, clean, template-populated database."""
+        with pooled_pg.begin() as conn:
+            rows = conn.execute(Thing.__table__.select()).fetchall()
+            assert rows == []
+            conn.execute(Thing.__table__.insert().values({"id": 1}))
+
+
+def test_root_engine_is_shared(pmr_postgres_config, nested_transaction):
+    """Assert administrative statements share a single engine per config."""
+    root_engine = get_root_engine(pmr_postgres_config)
+    assert get_root_engine(pmr_postgres_config) is root_engine
+
+    config = PostgresConfig(port=pmr_postgres_config.port)
+    other_engine = get_root_engine(config)
+    assert other_engine is not root_engine
+
+    close_session_resources(config)
+    assert get_root_engine(config) is not other_engine
+    close_session_resources(config)
@@ -1,8 +1,20 @@
-from pytest_mock_resources import create_redis_fixture
+import pytest
+
+from pytest_mock_resources import create_redis_fixture, RedisConfig
 from pytest_mock_resources.compat import redis
+from pytest_mock_resources.container.base import unused_tcp_port
+from pytest_mock_resources.fixture import redis as redis_module
+from pytest_mock_resources.fixture.redis import (
+    get_database_count,
+    get_database_number,
+    release_database_number,
+    wait_for_namespace_cleanup,
+)
 
 redis_client = create_redis_fixture()
 redis_client_decode = create_redis_fixture(decode_responses=True)
+redis_namespaced = create_redis_fixture(namespace=True)
+redis_namespaced_other = create_redis_fixture(namespace=True, decode_responses=True)
 
 
 def _sets_setup(redis_client):
@@ -229,3 +241,117 @@ class TestLists:
         redis_client.ltrim("dbs", 1, -1)
         rest = redis_client.lrange("dbs", 0, -1)
         assert rest == [b"postgres", b"redis", b"mongo"]
+
+
+class WorkerConfig:
+    def __init__(self, pytestconfig, worker_id):
+        self._tmp_path_factory = pytestconfig._tmp_path_factory
+        self.workerinput = {"workerid": worker_id}
+
+
+def test_database_number_leases(pytestconfig):
+    # Nothing listens on the port, so the configured number of databases is used.
+    port = unused_tcp_port()
+    workers = [WorkerConfig(pytestconfig, f"gw{i}") for i in range(3)]
+    configs = [RedisConfig(port=port, databases=2) for _ in workers]
+
+    try:
+        assert get_database_number(workers[1], configs[1]) == 1
+        assert get_database_number(workers[0], configs[0]) == 0
+        assert get_database_number(workers[0], configs[0]) == 0
+
+        with pytest.raises(ValueError):
+            get_database_number(workers[2], configs[2])
+
+        release_database_number(workers[0], configs[0])
+        assert get_database_number(workers[2], configs[2]) == 0
+    finally:
+        for worker, config in zip(workers, configs):
+            release_database_number(worker, config)
+
+
+@pytest.mark.parametrize("response", [{}, {"databases": None}, {"databases": "many"}])
+def test_database_count_fallback(monkeypatch, response):
+    """Assert the configured number of databases is used, if the server's is unavailable."""
+
+    class Client:
+        def __init__(self, **kwargs):
+            pass
+
+        def config_get(self, pattern):
+            return response
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(redis_module.redis, "Redis", Client)
+    assert get_database_count(RedisConfig(databases=4)) == 4
+
+
+def test_container_args():
+    config = RedisConfig(databases=64)
+    assert config.container_args == ("redis-server", "--databases", "64")
+
+
+class TestNamespace:
+    def test_isolated(self, redis_namespaced, redis_namespaced_other):
+        redis_namespaced.set("foo", "bar")
+        redis_namespaced_other.set("foo", "baz")
+
+        assert redis_namespaced.get("foo") == b"bar"
+        assert redis_namespaced_other.get("foo") == "baz"
+        assert redis_namespaced.keys() == [b"foo"]
+        assert redis_namespaced_other.keys("f*") == ["foo"]
+
+        raw = redis.Redis(**redis_namespaced.pmr_credentials.as_redis_kwargs())
+        assert raw.exists(redis_namespaced.namespace.add("foo")) == 1
+        assert raw.exists(redis_namespaced_other.namespace.add("foo")) == 1
+        assert raw.exists("foo") == 0
+
+    def test_multi_key_commands(self, redis_namespaced):
+        redis_namespaced.mset({"a": 1, "b": 2})
+        assert redis_namespaced.mget("a", "b", "c") == [b"1", b"2", None]
+
+        redis_namespaced.sadd("x", 1, 2)
+        redis_namespaced.sadd("y", 2, 3)
+        assert redis_namespaced.sinterstore("z", ["x", "y"]) == 1
+        assert redis_namespaced.smembers("z") == {b"2"}
+
+        redis_namespaced.zadd("s1", {"m": 1})
+        redis_namespaced.zadd("s2", {"m": 2})
+        assert redis_namespaced.zunionstore("s3", ["s1", "s2"]) == 1
+        assert redis_namespaced.zscore("s3", "m") == 3
+
+        script = "return redis.call('GET', KEYS[1]) .. ARGV[1]"
+        assert redis_namespaced.eval(script, 1, "a", "!") == b"1!"
+
+        keys = [b"a", b"b", b"s1", b"s2", b"s3", b"x", b"y", b"z"]
+        assert sorted(redis_namespaced.scan_iter()) == keys
+        assert redis_namespaced.blpop(["missing", "list"], timeout=1) is None
+        redis_namespaced.rpush("list", "item")
+        assert redis_namespaced.blpop(["missing", "list"], timeout=1) == (b"list", b"item")
+
+    def test_pipeline(self, redis_namespaced):
+        with redis_namespaced.pipeline() as pipe:
+            pipe.set("foo", "bar").get("foo").keys()
+            assert pipe.execute() == [True, b"bar", [b"foo"]]
+
+        with redis_namespaced.pipeline(transaction=False) as pipe:
+            pipe.incr("count").incr("count")
+            assert pipe.execute() == [1, 2]
+
+    def test_cleanup(self, pmr_redis_config, redis_namespaced):
+        from pytest_mock_resources.fixture.redis import cleanup_namespace
+
+        redis_namespaced.set("foo", "bar")
+        redis_namespaced.flushdb()
+        assert redis_namespaced.keys() == []
+
+        redis_namespaced.mset({str(i): i for i in range(2500)})
+        prefix = redis_namespaced.namespace.prefix
+
+        cleanup_namespace(redis_namespaced)
+        wait_for_namespace_cleanup()
+
+        raw = redis.Redis(**redis_namespaced.pmr_credentials.as_redis_kwargs())
+        assert raw.keys(f"{prefix}*") == []
@@ -0,0 +1,57 @@
+import threading
+from itertools import count
+
+import pytest
+
+from pytest_mock_resources.fixture.base import ResourcePool
+
+
+def test_refills_after_get():
+    counter = count()
+    pool = ResourcePool(lambda: next(counter), size=1)
+
+    assert [pool.get() for _ in range(3)] == [0, 1, 2]
+    pool.close()
+
+
+def test_discards_unused_resources_on_close():
+    produced = threading.Semaphore(0)
+    discarded = []
+
+    def produce():
+        produced.release()
+        return "db"
+
+    pool = ResourcePool(produce, size=2, discard=discarded.append)
+    produced.acquire()
+    produced.acquire()
+    pool.close()
+
+    assert discarded == ["db", "db"]
+
+
+def test_produce_error_is_raised_by_get():
+    def produce():
+        raise ValueError("nope")
+
+    pool = ResourcePool(produce, size=1)
+    with pytest.raises(ValueError):
+        pool.get()
+
+    # Subsequent calls should fail rather than hang waiting on the dead producer.
+    with pytest.raises(ValueError):
+        pool.get()
+    pool.close()
+
+
+def test_get_after_close():
+    pool = ResourcePool(object, size=1)
+    pool.close()
+
+    with pytest.raises(RuntimeError):
+        pool.get()
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        ResourcePool(object, size=0)
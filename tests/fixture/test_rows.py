@@ -1,8 +1,16 @@
-from sqlalchemy import Column, Integer, SmallInteger, text
+from typing import List
+
+from sqlalchemy import Column, ForeignKey, Integer, SmallInteger, String, text
+from sqlalchemy.orm import relationship
 
 from pytest_mock_resources import create_mysql_fixture, create_postgres_fixture, Rows
 from pytest_mock_resources.compat.sqlalchemy import declarative_base
 
+try:
+    from sqlalchemy.orm import Mapped
+except ImportError:  # SQLAlchemy < 1.4, which does not inspect the annotation.
+    pass
+
 Base = declarative_base()
 
 
@@ -73,3 +81,58 @@ def test_2_bases_mysql(base_2_mysql):
 
     execute = base_2_mysql.execute(text("SELECT * FROM report"))
     assert [(3,)] == list(execute)
+
+
+RelatedBase = declarative_base()
+
+
+class Parent(RelatedBase):
+    __tablename__ = "parent"
+
+    id = Column(Integer, primary_key=True)
+    children: "Mapped[List[Child]]" = relationship("Child", uselist=True)
+
+
+class Child(RelatedBase):
+    __tablename__ = "child"
+
+    id = Column(Integer, primary_key=True)
+    parent_id = Column(Integer, ForeignKey("parent.id"), nullable=False)
+    name = Column(String, nullable=True)
+
+
+bulk_rows = Rows(
+    Child(id=1, parent_id=1, name="a"),
+    Child(id=2, parent_id=1, name="b"),
+    Child(id=3, parent_id=1),
+    Parent(id=1),
+)
+related_rows = Rows(Parent(id=1, children=[Child(id=1), Child(id=2)]))
+
+bulk_postgres = create_postgres_fixture(bulk_rows)
+related_postgres = create_postgres_fixture(related_rows)
+
+
+def test_bulk_inserts():
+    """Assert rows are grouped per table and column set, in dependency order."""
+    inserts = Rows._get_bulk_inserts(bulk_rows.rows)
+    assert inserts is not None
+
+    tables_and_counts = [(table.name, len(params)) for table, params in inserts]
+    assert tables_and_counts == [("parent", 1), ("child", 2), ("child", 1)]
+
+
+def test_bulk_inserts_relationship():
+    assert Rows._get_bulk_inserts(related_rows.rows) is None
+
+
+def test_bulk_rows_postgres(bulk_postgres):
+    with bulk_postgres.begin() as conn:
+        execute = conn.execute(text("SELECT id, parent_id, name FROM child ORDER BY id"))
+    assert [(1, 1, "a"), (2, 1, "b"), (3, 1, None)] == list(execute)
+
+
+def test_related_rows_postgres(related_postgres):
+    with related_postgres.begin() as conn:
+        execute = conn.execute(text("SELECT id, parent_id FROM child ORDER BY id"))
+    assert [(1, 1), (2, 1)] == list(execute)
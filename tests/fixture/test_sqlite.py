@@ -5,7 +5,7 @@ from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric, text, Uni
 from sqlalchemy.dialects.postgresql import JSON, JSONB
 from sqlalchemy.exc import IntegrityError, SAWarning
 
-from pytest_mock_resources import create_postgres_fixture, create_sqlite_fixture, Rows
+from pytest_mock_resources import create_postgres_fixture, create_sqlite_fixture, Rows, Statements
 from pytest_mock_resources.compat.sqlalchemy import declarative_base, select
 from pytest_mock_resources.fixture.sqlite import utc
 from tests import skip_if_sqlalchemy2
@@ -225,3 +225,25 @@ def test_dt_tz_column_tzaware_input_pg(pg_dt):
         )
         result = conn.execute(select(dt_table.c.dt_tz)).scalar()
     assert result == datetime(2018, 1, 1, 9, 0, 0, tzinfo=utc)
+
+
+insert_thing = Statements("INSERT INTO other.thing (id, name) VALUES (2, 'bar')")
+sqlite_dynamic = create_sqlite_fixture(Base, Rows(Thing(id=1, name="foo")), insert_thing)
+sqlite_no_template = create_sqlite_fixture(
+    Base, Rows(Thing(id=1, name="foo")), insert_thing, template_database=False
+)
+
+
+@pytest.mark.parametrize("run", range(2))
+def test_template_isolation(sqlite_dynamic, run):
+    """Assert each test receives an independent copy of the template."""
+    with sqlite_dynamic.begin() as conn:
+        result = list(conn.execute(text("select * from other.thing order by id")))
+        conn.execute(text("INSERT INTO other.thing (id, name) VALUES (3, 'baz')"))
+    assert result == [(1, "foo"), (2, "bar")]
+
+
+def test_no_template(sqlite_no_template):
+    with sqlite_no_template.begin() as conn:
+        result = list(conn.execute(text("select * from other.thing order by id")))
+    assert result == [(1, "foo"), (2, "bar")]
@@ -0,0 +1,152 @@
+import pytest
+
+from pytest_mock_resources import PostgresConfig, RedisConfig, RedshiftConfig
+from pytest_mock_resources.container.base import (
+    claim_started_container,
+    discard_started_containers,
+    get_container,
+    pending_containers,
+    start_containers,
+)
+from pytest_mock_resources.hooks import get_resource_kinds
+
+
+class BrokenConfig(RedisConfig):
+    @property
+    def check_fn(self):
+        def check():
+            raise RuntimeError("nope")
+
+        return check
+
+
+@pytest.mark.postgres
+@pytest.mark.redis
+def test_claim_started_containers(pytestconfig):
+    postgres_config = PostgresConfig()
+    redis_config = RedisConfig()
+
+    started = start_containers(pytestconfig, [postgres_config, redis_config])
+    assert set(started) == {postgres_config, redis_config}
+
+    # The services are already running, so no container is created.
+    assert claim_started_container(pytestconfig, postgres_config) == (True, None)
+    assert claim_started_container(pytestconfig, redis_config) == (True, None)
+
+    # Once claimed, the result is no longer available.
+    assert claim_started_container(pytestconfig, redis_config) == (False, None)
+    assert not set(started) & set(pending_containers(pytestconfig))
+
+
+@pytest.mark.postgres
+def test_shared_port_started_once(pytestconfig):
+    postgres_config = PostgresConfig()
+    redshift_config = RedshiftConfig()
+
+    started = start_containers(pytestconfig, [postgres_config, redshift_config])
+    assert list(started) == [postgres_config]
+
+    discard_started_containers(pytestconfig, started)
+    assert postgres_config not in pending_containers(pytestconfig)
+
+
+def test_failed_startup_falls_back(pytestconfig):
+    config = BrokenConfig()
+
+    started = start_containers(pytestconfig, [config])
+    started[config].exception()
+
+    assert claim_started_container(pytestconfig, config) == (False, None)
+
+    # `get_container` falls back to starting the container itself.
+    with pytest.raises(RuntimeError):
+        next(get_container(pytestconfig, config))
+
+
+def test_get_resource_kinds(pytester):
+    items = pytester.getitems(
+        """
+        import pytest
+
+        @pytest.mark.redis
+        def test_redis(): pass
+
+        @pytest.mark.postgres
+        @pytest.mark.skip
+        def test_postgres(): pass
+
+        def test_nothing(): pass
+        """
+    )
+    assert get_resource_kinds(items) == ["postgres", "redis"]
+
+
+@pytest.mark.postgres
+@pytest.mark.redis
+def test_parallel_startup_option(pytester):
+    pytester.makepyfile(
+        """
+        from pytest_mock_resources import create_postgres_fixture, create_redis_fixture
+
+        pg = create_postgres_fixture()
+        redis = create_redis_fixture()
+
+        def test_pending(pytestconfig, pmr_postgres_config, pmr_redis_config):
+            pending = pytestconfig._pmr_pending_containers
+            assert pmr_postgres_config in pending
+            assert pmr_redis_config in pending
+
+        def test_containers(pg, redis):
+            with pg.connect():
+                pass
+            redis.ping()
+        """
+    )
+    result = pytester.inline_run("--pmr-parallel-startup")
+    result.assertoutcome(passed=2)
+
+
+@pytest.mark.redis
+def test_parallel_startup_skips_overridden_config(pytester):
+    pytester.makepyfile(
+        test_root="""
+        import pytest
+
+        @pytest.mark.redis
+        def test_root(pytestconfig, pmr_redis_config):
+            assert pmr_redis_config.port != 6479
+            assert pmr_redis_config not in pytestconfig._pmr_pending_containers
+        """
+    )
+    pytester.mkpydir("sub")
+    pytester.path.joinpath("sub", "conftest.py").write_text(
+        "import pytest\n"
+        "from pytest_mock_resources import RedisConfig\n"
+        "\n"
+        "@pytest.fixture(scope='session')\n"
+        "def pmr_redis_config():\n"
+        "    return RedisConfig(port=6479)\n"
+    )
+    pytester.path.joinpath("sub", "test_sub.py").write_text(
+        "import pytest\n"
+        "\n"
+        "@pytest.mark.redis\n"
+        "def test_sub(pytestconfig, pmr_redis_config):\n"
+        "    assert pmr_redis_config.port == 6479\n"
+        "    pending = pytestconfig._pmr_pending_containers\n"
+        "    assert (pmr_redis_config in pending) is pytestconfig.getoption('sub_only')\n"
+    )
+    pytester.makeconftest(
+        """
+        def pytest_addoption(parser):
+            parser.addoption("--sub-only", action="store_true")
+        """
+    )
+
+    # Tests resolve different configs, so neither is started ahead of time.
+    result = pytester.inline_run("--pmr-parallel-startup")
+    result.assertoutcome(passed=2)
+
+    # Every test resolves the overridden config, so it is started.
+    result = pytester.inline_run("--pmr-parallel-startup", "--sub-only", "sub")
+    result.assertoutcome(passed=1)
@@ -0,0 +1,140 @@
+import asyncio
+import socket
+import threading
+import types
+
+import pytest
+
+from pytest_mock_resources import PostgresConfig
+from pytest_mock_resources.container import base
+from pytest_mock_resources.container.base import async_retry, ContainerCheckFailed, retry
+
+
+class Flaky:
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ContainerCheckFailed()
+        return self.calls
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+
+    # Replace the module's reference, rather than `time.sleep` itself, so that sleeps
+    # performed by unrelated (background) threads are not recorded. The clock only advances
+    # through (recorded) sleeps.
+    clock = types.SimpleNamespace(sleep=sleeps.append, monotonic=lambda: sum(sleeps))
+    monkeypatch.setattr(base, "time", clock)
+    return sleeps
+
+
+def test_retry_backs_off(sleeps):
+    func = Flaky(failures=4)
+    result = retry(func, retries=10, interval=0.02, on_exc=ContainerCheckFailed)
+
+    assert result == 5
+    assert sleeps == [0.005, 0.01, 0.02, 0.02]
+
+
+def test_retry_exhausted(sleeps):
+    func = Flaky(failures=100)
+    with pytest.raises(ContainerCheckFailed):
+        retry(func, retries=3, interval=0.02, on_exc=ContainerCheckFailed)
+
+    assert sleeps == [0.005, 0.01, 0.02, 0.02]
+    assert func.calls == 5
+
+
+@pytest.mark.parametrize("retries, interval", [(40, 0.5), (60, 1)])
+def test_retry_waits_as_long_as_fixed_interval(sleeps, retries, interval):
+    """Assert backing off does not shorten the total time waited before giving up."""
+    func = Flaky(failures=10_000)
+    with pytest.raises(ContainerCheckFailed):
+        retry(func, retries=retries, interval=interval, on_exc=ContainerCheckFailed)
+
+    assert sum(sleeps) >= (retries - 1) * interval
+
+
+def test_retry_single_attempt(sleeps):
+    func = Flaky(failures=1)
+    with pytest.raises(ContainerCheckFailed):
+        retry(func, retries=1, on_exc=ContainerCheckFailed)
+
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_async_retry_does_not_block():
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    async def check():
+        raise ContainerCheckFailed()
+
+    ticker = asyncio.ensure_future(tick())
+    try:
+        with pytest.raises(ContainerCheckFailed):
+            await async_retry(check, retries=4, interval=0.01, on_exc=ContainerCheckFailed)
+    finally:
+        ticker.cancel()
+
+    assert ticks > 3
+
+
+@pytest.fixture
+def silent_server():
+    """Produce the port of a listening socket which accepts, and immediately closes, connections.
+
+    Docker's port forwarding accepts connections before the container's server is up.
+    """
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+
+    def accept_and_close():
+        conn, _ = server.accept()
+        conn.close()
+
+    thread = threading.Thread(target=accept_and_close)
+    thread.start()
+    try:
+        yield server.getsockname()[1]
+    finally:
+        thread.join()
+        server.close()
+
+
+def test_postgres_check_requires_server_response(silent_server):
+    """Assert a listening socket which never speaks the protocol is not "ready"."""
+    config = PostgresConfig(host="127.0.0.1", port=silent_server)
+    with pytest.raises(ContainerCheckFailed):
+        config.check_fn()
+
+
+@pytest.mark.asyncio
+async def test_postgres_async_check_requires_server_response(silent_server):
+    config = PostgresConfig(host="127.0.0.1", port=silent_server)
+    with pytest.raises(ContainerCheckFailed):
+        await config.async_check_fn()
+
+
+@pytest.mark.postgres
+def test_postgres_check(pmr_postgres_config):
+    pmr_postgres_config.check_fn()
+
+
+@pytest.mark.postgres
+@pytest.mark.asyncio
+async def test_postgres_async_check(pmr_postgres_config):
+    await pmr_postgres_config.async_check_fn()
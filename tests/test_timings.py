@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from pytest_mock_resources.timing import Recorder, Timer
+
+test_file = """
+from pytest_mock_resources import create_postgres_fixture, create_sqlite_fixture
+
+pg = create_postgres_fixture()
+sqlite = create_sqlite_fixture()
+
+def test_pg(pg):
+    pass
+
+def test_sqlite(sqlite):
+    pass
+"""
+
+
+def test_timer_attributes_phases():
+    recorder = Recorder()
+    with recorder.fixture("pg"):
+        timer = Timer(recorder, recorder.current_fixture)
+
+    # i.e. teardown, after the fixture's setup has completed.
+    with timer("dispose"):
+        pass
+
+    assert [(t.fixture, t.phase) for t in recorder.timings] == [("pg", "dispose")]
+
+
+def test_disabled_timer():
+    with Timer()("connect"):
+        pass
+
+
+@pytest.mark.postgres
+def test_timings_report(pytester):
+    pytester.makepyfile(test_file)
+
+    result = pytester.runpytest_subprocess("--pmr-timings")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(
+        [
+            "*pmr fixture timings*",
+            "*pg: create_database",
+            "*pg: dispose",
+            "*sqlite: dynamic_actions",
+        ]
+    )
+
+
+@pytest.mark.postgres
+def test_timings_json_xdist(pytester):
+    pytester.makepyfile(test_file)
+    path = pytester.path / "timings.json"
+
+    result = pytester.runpytest_subprocess("-n", "2", "--pmr-timings-json", str(path))
+    result.assert_outcomes(passed=2)
+    result.stdout.no_fnmatch_line("*pmr fixture timings*")
+
+    data = json.loads(path.read_text())
+    phases = {(timing["fixture"], timing["phase"]) for timing in data["timings"]}
+    assert ("pg", "create_database") in phases
+    assert ("sqlite", "dynamic_actions") in phases
+    assert data["summary"]